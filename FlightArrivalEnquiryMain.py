@@ -1,185 +1,12 @@
 import tkinter as tk                # For GUI widgets
 from tkinter import messagebox      # For Close Program popup widget
-import datetime as dt               # For time management of flights
-import os                           # For Determining if file path exists
+from tkinter import ttk             # For the progress bar shown whilst reading and writing files
 import random                       # For construction of random data, determining if flight has delay
-
-
-class Airport:
-    """
-    Airport class is used to provide an origin or destination for flights, alongside housing inbound, outbound and
-    landed flights within lists.
-
-    When constructed, the Airport will proceed to gather and store references to Flight objects from the allFlights
-    parameter. Newly constructed flights are directly assigned to the Airport.
-    """
-    def __init__(self, name, allFlights):
-        self.name = name
-        self.inboundFlights = []
-        self.outboundFlights = []
-        self.landedFlights = []
-        self.GetAirportFlightData(allFlights)
-
-    def GetAirportFlightData(self, flightsList):
-        """
-        obtain inbound and outgoing flights for this airport name from `flightsList`,
-        which is the `ongoingFlights.txt` file
-        :param flightsList:
-        :return:
-        """
-        for flight in flightsList:
-            # Determine if flight belongs to inbound or outbound list:
-            if flight.fliOrigin == self.name:
-                self.outboundFlights.append(flight)
-            elif flight.fliDestination == self.name:
-                self.inboundFlights.append(flight)
-
-
-class Flight:
-    """
-    Flight Objects travel between two airports, set as their Origin and Destination. They may be constructed using data
-    stored within the `ongoingFlights.txt` file, or from user inputs.
-
-    When the time is within a Flight's "flight window" - the time between timetabled departure and arrival time - it
-    will depart, allowing the flight to update its remaining distance of travel between the Origin and Destination
-    airports until reaching 0.
-
-    Flights with a remaining distance > 0 will be saved to the `ongoingFlights.txt` file upon program close (if the
-    user permits).
-    """
-    def __init__(self, flightDetails, airlineDetails, timeDetails, stringDetailsList):
-        # fli is for flight, al is for airline. shortened for simpler var names
-        self.stringDetailsList = stringDetailsList
-        # flight details
-        self.fliNum = flightDetails[0]
-        self.fliCode = flightDetails[1]
-        self.fliOrigin = flightDetails[2]
-        self.fliDestination = flightDetails[3]
-        self.fliSpeed = float(flightDetails[4])
-        self.fliDist = float(flightDetails[5])
-        # airline/aircraft details
-        self.aircraft = airlineDetails[0]
-        self.alName = airlineDetails[1]
-        self.alCode = airlineDetails[2]
-        # timetabling, and delay details (in timedelta objects)
-        self.ttblDepartTime = self.StripTime(timeDetails[0])
-        self.ttblArriveTime = self.StripTime(timeDetails[1])
-        # Since programTime operates in 24hr loop, arrival time can be < departure time, hence:
-        if self.ttblArriveTime < self.ttblDepartTime:
-            self.trueArrive = dt.timedelta(days=1, seconds=self.ttblArriveTime.seconds)
-        else:
-            self.trueArrive = self.ttblArriveTime
-        self.appxArriveTime = self.StripTime(timeDetails[2])
-        self.delayTime = self.StripTime(timeDetails[3])
-
-        # Ensure flight only "flies" when it should be:
-        self.hasDeparted = self.GetBool(timeDetails[4])  # Departs when program time is >= to departure time:
-        self.isDeparting = self.GetBool(timeDetails[5])  # Is the program due to be departing in the next timeframe
-        self.hasLanded = False
-
-    def UpdateDistanceAndTime(self, prevTime, programTime):
-        """
-        This function will first determine if the Flight can be updated. This is done through checking the hasLanded
-        value of the Flight (True will result in the function ending without updating values) and if program time is
-        within the flight window. Should the programTime be within the Flight window, the Flight departs, and the
-        function begins to update the remaining distance value.
-
-        The remaining distance value is decremented by the flight speed (converted to seconds) multiplied by the change
-        in time since the function was last called.
-        :param prevTime:
-        :param programTime:
-        :return:
-        """
-        if self.hasLanded:
-            print("Flight Landed, ignoring Update Function")
-            return
-
-        # Ensures time is within the "flightwindow" - the time between departure and arrival of the flight
-        # before permitting flight to depart
-        if programTime <= self.ttblDepartTime and programTime <= self.ttblArriveTime < self.ttblDepartTime:
-            inFlightWindow = True
-        elif self.ttblDepartTime <= programTime <= self.trueArrive:  # in flight window
-            inFlightWindow = True
-        else:  # Not currently in flight window
-            self.isDeparting = True
-            inFlightWindow = False
-
-        # Shift Program Time to account for 24hr repeat loop:
-        if prevTime > programTime:
-            programTime = dt.timedelta(days=1, seconds=programTime.seconds)
-
-        if (inFlightWindow and self.isDeparting) or self.hasDeparted:
-            # get change in time since function last called
-            # ensure that change of time is no greater than timechange from the earliest the Flight could have departed
-            timechange = programTime - prevTime
-            if prevTime < self.ttblDepartTime and not self.hasDeparted:
-                timechange = programTime - self.ttblDepartTime
-
-            self.isDeparting = False  # Update departing status - plane will not depart again after arriving
-            self.hasDeparted = True  # Flight Distance will continue to decrease to 0 regardless of timeframe
-
-            distanceCovered = (self.fliSpeed / 60 / 60) * timechange.seconds  # speed converted from km/h to km/s
-            newDist = self.fliDist - distanceCovered
-            if newDist > 0:
-                self.fliDist = newDist
-                seconds = (self.fliDist / self.fliSpeed) * 60 * 60  # Get remaining time in flight in seconds
-                flightTimeRemaining = dt.timedelta(seconds=int(seconds))
-                self.appxArriveTime = programTime + flightTimeRemaining
-                self.delayTime = self.appxArriveTime - self.trueArrive
-                if self.delayTime.days < 0:
-                    self.delayTime = dt.timedelta(seconds=0)
-
-                if self.appxArriveTime.days == 1:   # remove days value to retain 24:00:00 format
-                    self.appxArriveTime = self.appxArriveTime - dt.timedelta(days=1)
-            else:   # Distance <=0 so flight has landed at destination airport
-                self.fliDist = 0
-                self.hasLanded = True
-                self.hasDeparted = False
-
-    @staticmethod
-    def StripTime(time):
-        """
-        Converts non-timedelta parameters into timedelta values. Used primarily for reading data from file.
-        :param time:
-        :return:
-        """
-        if type(time) is not dt.timedelta:
-            time = dt.datetime.strptime(time, "%H:%M:%S")   # Obtain datetime value
-            return dt.timedelta(hours=time.hour, minutes=time.minute, seconds=time.second)  # Convert to timedelta
-        else:  # time is of timedelta type already
-            return time
-
-    @staticmethod
-    def GetBool(string):
-        """
-        Converts non-boolean parameters into boolean values. Used primarily for reading data from file.
-        :param string:
-        :return:
-        """
-        if type(string) is not bool:
-            if string == "True":
-                return True
-            elif string == "False":
-                return False
-        else:  # Already boolean
-            return string
-
-    def GetFlightValue(self, stringTerm):
-        """
-        Function utilises a dictionary to utilise a string input parameter as a key for obtaining a tuple of the value
-        stored within the Flight that the string refers to, and the data type of the value.
-        :param stringTerm:
-        :return:
-        """
-        flightDataList = [(self.fliNum, 'int'), (self.fliCode, 'str'), (self.fliOrigin, 'str'),
-                          (self.fliDestination, 'str'),
-                          (self.fliSpeed, 'float'), (round(self.fliDist, 1), 'float'), (self.aircraft, 'str'),
-                          (self.alName, 'str'), (self.alCode, 'str'), (self.ttblDepartTime, 'time'),
-                          (self.ttblArriveTime, 'time'), (self.appxArriveTime, 'time'), (self.delayTime, 'time'),
-                          (self.hasDeparted, 'bool'), (self.isDeparting, 'bool')]
-        # Construct Dictionary from flight data strings and flight data list:
-        flightTermDict = {self.stringDetailsList[i]: flightDataList[i] for i in range(len(self.stringDetailsList))}
-        return flightTermDict[stringTerm]
+import operator                     # For sorting flights by attribute
+from FlightSimulationEngine import (DEFAULT_AUTOSAVE_INTERVAL, DEFAULT_MAX_FLIGHTS, DEFAULT_STATS_LOG_INTERVAL,
+                                    RANDOM_BATCH_LIMIT, TASK_POLL_INTERVAL, Airport, BackgroundTask, Flight,
+                                    FlightGenerator, FlightSet, FormatTime, ParseTimeString, Simulation,
+                                    SimulationClock)  # Headless simulation core
 
 
 class Main:
@@ -187,30 +14,66 @@ class Main:
     This is the main body of the program. Contains variables accessed by multiple screen classes, and also provides the
     construction of the main Tk root window.
 
-    Additionally, reads data from the `ongoingFlights.txt` and `AirportsAirlines.txt` files to construct Flights and
-    Airports.
+    Flights, Airports and programTime are owned by the Simulation (see `FlightSimulationEngine.py`), which reads them
+    from the `ongoingFlights.txt` and `AirportsAirlines.txt` files. Main acts as the GUI client of the Simulation.
 
     Also performs the program loop for updating the GUI, programTime and Flight Values, alongside providing code for the end-of-program processes, such
     as saving data to files.
+
+    The program files are read and written upon a worker thread (see `BackgroundTask`), whose progress is shown in the
+    root window whilst the program loop continues, so the window never freezes. The screens are constructed once the
+    Simulation has been read.
     """
-    def __init__(self):
+    def __init__(self, maxFlights=DEFAULT_MAX_FLIGHTS, autosaveInterval=DEFAULT_AUTOSAVE_INTERVAL,
+                 statsLogInterval=DEFAULT_STATS_LOG_INTERVAL):
         # For determining end-of-program processes:
         self.running = True
         self.updateFile = False
-
-        # Confirm that the file paths exist, else close program
-        self.allFlightsFileName = self.ConstructFile("ongoingFlights.txt")
-        self.airportsAirlinesFileName = self.ConstructFile("AirportsAirlines.txt")
+        self.discardChanges = False
+        self.autosaveInterval = autosaveInterval
+        self.statsLogInterval = statsLogInterval
+        self.simulation = None  # Constructed upon a worker thread, see Construct
+        self.task = None  # BackgroundTask reading or writing the program files
+        self.taskDone = None  # Called with the result of the task once complete
+        self.error = None  # Raised by a failed task, re-raised upon closing
 
         # construct tk root window, title, size
         self.root = tk.Tk()
-        self.menubar = tk.Menu(self.root)
-        self.root.config(menu=self.menubar)
         self.root.title('Airport Flight Arrival Enquiry Software')
         self.root.resizable(False, False)
         # Protocol dictates what happens when user attempts to close the tk window
         self.root.protocol("WM_DELETE_WINDOW", self.CloseProgramMessage)
 
+        # construct display of the progress of reading or writing the program files
+        self.progressFrame = tk.Frame(self.root, relief='raised', borderwidth=5)
+        self.progressText = tk.StringVar()
+        tk.Label(self.progressFrame, textvariable=self.progressText, width=60, anchor='w').grid(row=0, column=0)
+        self.progressBar = ttk.Progressbar(self.progressFrame, length=480, maximum=1.0, mode='determinate')
+        self.progressBar.grid(row=1, column=0)
+        self.progressFrame.grid(row=0, column=0, sticky='nsew')
+
+        # Construct the Simulation upon a worker thread, which reads the program files and owns all Flights, Airports
+        # and programTime. Changes are kept in a journal, so they are recovered should the program not close normally
+        self.StartTask('Reading program files', lambda progress: Simulation(
+            "ongoingFlights.txt", "AirportsAirlines.txt", maxFlights, journal=True, progress=progress), self.Construct)
+
+        self.ProgramLoop()  # Run window updates
+        self.EndProgram()  # Run Close Program Code (update files)
+
+    def Construct(self, simulation):
+        """
+        Constructs the program screens once the Simulation has been read from the program files, and starts the clock
+        which advances it.
+        :param simulation:
+        :return:
+        """
+        self.simulation = simulation
+        if self.autosaveInterval > 0:  # State is also checkpointed in the background every autosaveInterval seconds
+            self.simulation.StartAutosave(self.autosaveInterval)
+        self.instrumentation = self.simulation.instrumentation  # Timings and counters shown on the Statistics screen
+        self.menubar = tk.Menu(self.root)
+        self.root.config(menu=self.menubar)
+
         # construct program time and time multiplier display
         self.programTimeFrame = tk.Frame(self.root, relief='raised', borderwidth=5)
         self.programTimeFrame.grid(row=0, column=0, sticky='nsew')
@@ -223,55 +86,19 @@ class Main:
         self.inputTimeMultiplier.set("1")
         tk.Entry(self.programTimeFrame, textvariable=self.inputTimeMultiplier).grid(row=0, column=3)
 
-        # Initialise Program Time from file:
+        # The clock advances the Simulation by the real time passed, and runs each display update in turn:
         self.timeMultiplier = 1
-        timeString = open(self.allFlightsFileName, 'r').readlines()[1].strip()[1:]
-        time = dt.datetime.strptime(timeString, "%H:%M:%S")  # Create time object
-        self.programTime = dt.timedelta(hours=time.hour, minutes=time.minute, seconds=time.second)
-        self.prevTime = self.programTime  # Monitor change in time for updating flight values
-        self.UpdateProgramTime()
-
-        # Get Data Search Terms from file:
-        # read first line, remove \n and # char, split into list of values
-        # print("Unsplit search terms list:\n", open(self.allFlightsFileName).readline().strip())
-        self.dataSearchTerms = open(self.allFlightsFileName).readline().strip()[1:].split(', ')
-
-        # Read Flight data from file:
-        self.allFlights = []
-        self.maxFlights = 75
-        for flight in open(self.allFlightsFileName).readlines():
-            # Omit lines beginning with #, no value or \n char as these are not flight data lines
-            omit = ['#', '', '\n', ' ']
-            if flight[0] not in omit:
-                flightData = flight.strip().split(', ')
-                # Split data into categories using slices of the total flight data list
-                flightDetails = flightData[:6]
-                airlineDetails = flightData[6:9]
-                timeDetails = flightData[9:]
-                self.allFlights.append(Flight(flightDetails, airlineDetails, timeDetails, self.dataSearchTerms))
-
-        # Construct Airports and get Airline Data from file:
-        # gets 1st line from file, remove \n, # chars, split into a list of airport names
-        with open(self.airportsAirlinesFileName, 'r') as file:
-            self.airlineDataSets = []
-            self.airlineNames = []
-            for line in file:
-                if line[0] == '#':
-                    self.airportNames = line.strip()[1:].split(', ')
-                else:
-                    self.airlineDataSets.append(line.strip().split(', '))
-                    self.airlineNames.append(self.airlineDataSets[-1][0])
-
-        self.airports = []
-        for airport in self.airportNames:
-            # Create list of airport objects
-            self.airports.append(Airport(airport, self.allFlights))
-            # print("Created new airport:", self.airports[-1], airport)
+        self.clock = SimulationClock(self.simulation, multiplier=self.timeMultiplier)
+        self.inputTimeMultiplier.trace_add('write', lambda *args: self.UpdateTimeMultiplier())
+        self.clock.Register('Program Time', self.UpdateProgramTime, budget=0.01)
+        if self.statsLogInterval > 0:  # A summary of the timings and counters is printed every statsLogInterval seconds
+            self.clock.Register('Statistics Log', self.LogStatistics, interval=self.statsLogInterval)
 
         # Construct Program Screens:
         # Screens are classes containing tk Widgets and necessary functions, with self passed as parameter, so they can
         # access AirTrafficControl vars/funcs
-        self.screenFrames = [AirportFlightsScreen(self), SearchFlightDataScreen(self), AddFlightAirportScreen(self)]
+        self.screenFrames = [AirportFlightsScreen(self), SearchFlightDataScreen(self), AddFlightAirportScreen(self),
+                             StatisticsScreen(self)]
         for sf in self.screenFrames:
             sf.Construct()
 
@@ -282,12 +109,67 @@ class Main:
                                  command=lambda: self.SwitchScreen(self.screenFrames[1]))
         self.menubar.add_command(label='Add New Airport/Flight',
                                  command=lambda: self.SwitchScreen(self.screenFrames[2]))
+        self.menubar.add_command(label='Statistics',
+                                 command=lambda: self.SwitchScreen(self.screenFrames[3]))
 
         self.SwitchScreen(self.screenFrames[0])  # Display Airport Flights screen to load in automatically
 
-        self.FlightUpdateLoop()  # Starts the flight update loop, runs every 500ms#
-        self.ProgramLoop()  # Run window updates
-        self.EndProgram()  # Run Close Program Code (update files)
+        self.clock.Start(self.root.after)  # Starts advancing the Simulation and updating the screens
+
+    def StartTask(self, stage, function, taskDone):
+        """
+        Runs `function(progress)` upon a worker thread, showing its progress until complete, when `taskDone` is called
+        with its result. The task is polled every TASK_POLL_INTERVAL seconds by the program loop (see `PollTask`).
+        :param stage: Shown until the task first reports its progress
+        :param function:
+        :param taskDone:
+        :return:
+        """
+        self.ShowProgress(stage, None)
+        self.task = BackgroundTask(stage, function).Start()
+        self.taskDone = taskDone
+        self.root.after(int(TASK_POLL_INTERVAL * 1000), self.PollTask)
+
+    def PollTask(self):
+        """
+        Shows the progress reported by the task since the last poll. Once the task is complete the progress display is
+        removed and the result passed on, or if it failed, the error is shown and the program closed.
+        :return:
+        """
+        for kind, value in self.task.Poll():
+            if kind == BackgroundTask.PROGRESS:
+                self.ShowProgress(*value)
+                continue
+            self.task = None
+            self.progressBar.stop()
+            self.progressFrame.grid_forget()
+            if kind == BackgroundTask.DONE:
+                self.taskDone(value)
+            else:  # Re-raised by EndProgram, such that the program files are left as they are
+                self.error = value
+                messagebox.showerror('Error', f'Reading or writing the program files failed: {value}')
+                self.running = False
+            return
+        self.root.after(int(TASK_POLL_INTERVAL * 1000), self.PollTask)
+
+    def ShowProgress(self, stage, fraction):
+        """
+        Displays the stage being performed by the task, and the fraction of it completed. When the fraction is unknown
+        (None), the progress bar instead moves back and forth.
+        :param stage:
+        :param fraction:
+        :return:
+        """
+        self.progressText.set(f"{stage}...")
+        if fraction is None:
+            if str(self.progressBar.cget('mode')) != 'indeterminate':
+                self.progressBar.config(mode='indeterminate')
+                self.progressBar.start()
+        else:
+            if str(self.progressBar.cget('mode')) != 'determinate':
+                self.progressBar.stop()
+                self.progressBar.config(mode='determinate')
+            self.progressBar.config(value=fraction)
 
     def ProgramLoop(self):
         """
@@ -298,93 +180,66 @@ class Main:
         while self.running:
             try:
                 self.root.update()
-            except KeyboardInterrupt:  # Program closed through unexpected means, File not updated.
+            except KeyboardInterrupt:  # Program closed through unexpected means, File not updated but journal kept.
                 self.running = False
 
     def EndProgram(self):
         """
         This code runs after the user confirms that they wish to close the program, or the program is forcefully closed
-        by KeyboardInterrupt
+        by KeyboardInterrupt. If the user chose to update the files, they have already been written (see `SaveFiles`).
+        If the user chose not to, the Simulation's journal of changes is discarded, whereas if the program was
+        forcefully closed the journal is kept to be recovered upon the next run. Any files still being read or written
+        are completed first, and any profile being captured is stopped and printed.
         :return:
         """
-        if self.updateFile is False:
-            print("Files not updated.")
+        if self.task is not None:  # Forcefully closed whilst reading or writing the program files
+            result = self.task.Wait()
+            if self.simulation is None:
+                self.simulation = result
+        if self.error is not None:
+            raise self.error
+        if self.simulation.instrumentation.profile is not None:
+            print(self.simulation.instrumentation.StopProfile())
+        if self.updateFile:
+            print(f"Files updated in {self.simulation.instrumentation.timings['Save'].last:.2f}s.")
             return
 
-        # sort self.allFlights into list organised by timetabled arrival time (ascending from 00:00:00 to 23:59:59)
-        self.allFlights.sort(key=lambda fliDat: fliDat.ttblArriveTime)
-
-        # Update the ongoingFlights File
-        with open(self.allFlightsFileName, 'w') as file:
-            # Construct the Data Search Term Strings line:
-            dataSearchTermStrings = f"#{self.dataSearchTerms[0]}"
-            for searchTerm in self.dataSearchTerms[1:]:
-                dataSearchTermStrings = f"{dataSearchTermStrings}, {searchTerm}"
-            file.write(f"{dataSearchTermStrings}\n")
-
-            # Construct the programTime line:
-            file.write(f"#{self.programTime}\n")
-
-            # Construct the updated flight data lines:
-            for flight in self.allFlights:
-                if not flight.hasLanded:
-                    # Construct string of Flight object's values:
-                    flightDataString = f"{flight.GetFlightValue(self.dataSearchTerms[0])[0]}"
-                    for dataValue in self.dataSearchTerms[1:]:
-                        flightDataString = f"{flightDataString}, {flight.GetFlightValue(dataValue)[0]}"
-                    file.write(f"{flightDataString}\n")
-
-        # Update AirportsAirlines file:
-        with open(self.airportsAirlinesFileName, 'w') as file:
-            # Construct Airport names String line:
-            airportNamesString = f"#{self.airportNames[0]}"
-            for airport in self.airportNames[1:]:
-                airportNamesString = f"{airportNamesString}, {airport}"
-            file.write(f"{airportNamesString}\n")
-
-            # Construct airline data into string lines
-            for airline in self.airlineDataSets:
-                airlineDataString = f"{airline[0]}"
-                for data in airline[1:]:
-                    airlineDataString = f"{airlineDataString}, {data}"
-                file.write(f"{airlineDataString}\n")
-        print("Files updated.")
+        self.simulation.StopAutosave()
+        self.simulation.CloseJournal(discard=self.discardChanges)
+        print("Files not updated." if self.discardChanges else
+              f"Files not updated. Changes kept in {self.simulation.journalFileName}.")
 
-    @staticmethod
-    def ConstructFile(fileName):
+    def SaveFiles(self, progress):
         """
-        This function will determine if a file already exists for a path, given by a string parameter. If the file is
-        not found, then the program will construct new files with default data entered into them. This data can then be
-        used to continue normal use of the program.
-        :param fileName:
+        Updates the program files with the current state of the Simulation, then discards the journal of changes. Run
+        upon a worker thread once the clock has stopped, so nothing else accesses the Simulation.
+        :param progress:
         :return:
         """
-        if os.path.exists(fileName):  # Tests if file path exists.
-            return fileName
-        else:  # File path not found
-            print(f"Essential file: {fileName} NOT in local space. Ensure file has accessible presence in local space.")
-            print("File will be constructed using default data in program.")
-            if fileName == "AirportsAirlines.txt":  # Determine which file is being constructed, and hence what data
-                defaultAirportsString = "#East Midlands Airport, Heathrow Airport, Birmingham International Airport\n"
-                defaultAirlineString = ("BritishAirways, BA, Boeing787-9, Airbus A350-1000, Airbus A380-800, Embraer "
-                                        "190-BA, 1050, 905, 1086, 870")
-                with open(fileName, 'w') as file:
-                    file.write(defaultAirportsString)
-                    file.write(defaultAirlineString)
-            elif fileName == "ongoingFlights.txt":  # Determine which file is being constructed, and hence what data
-                defaultDataString = ("#Flight Number, Flight Code, Origin, Destination, Current Speed, Rem. Distance, "
-                                     "Aircraft, Airline, Airline Code, Departure Time, Arrival Time, APPX Arrival "
-                                     "Time, Delay Time, Has Departed, is Departing\n")
-                defaultProgramTime = "#07:30:00"
-                with open(fileName, 'w') as file:
-                    file.write(defaultDataString)
-                    file.write(defaultProgramTime)
-            return fileName
+        self.simulation.StopAutosave()
+        self.simulation.SaveFiles(progress)
+        self.simulation.CloseJournal(discard=True)
 
-    def UpdateProgramTime(self):
+    def BeginSave(self):
+        """
+        Stops the clock and hides the screens, then updates the program files upon a worker thread, showing its
+        progress. The program closes once the files are written.
+        :return:
+        """
+        self.clock.Stop()
+        for screen in self.screenFrames:
+            screen.body.grid_forget()
+        self.programTimeFrame.grid_forget()
+        self.root.config(menu='')
+        self.progressFrame.grid(row=0, column=0, sticky='nsew')
+        self.updateFile = True
+        self.StartTask('Updating program files', self.SaveFiles, lambda result: setattr(self, 'running', False))
+
+    def UpdateTimeMultiplier(self):
         """
-        Updates the programTime by a set amount every real-time second. This set amount may be anywhere from 0 to
-        6 hours. Larger values will default to 6 hours, and smaller or other non-suitable values default to 1.
+        Updates the clock's time multiplier - the simulated seconds per real-time second - whenever the time multiplier
+        entry changes. This may be anywhere from 0 to 6 hours. Larger values will default to 6 hours, and smaller or
+        other non-suitable values default to 1.
 
         :return:
         """
@@ -403,19 +258,29 @@ class Main:
         except OverflowError:
             # Value set was too large, go by 6hours per second
             self.timeMultiplier = 3600 * 6
+        self.clock.multiplier = self.timeMultiplier
 
-        self.programTime = dt.timedelta(seconds=self.programTime.seconds + (1 * self.timeMultiplier))
-        if self.programTime.days >= 1:
-            # If the Program Time is at 24:00:00 or greater, removes days value to keep to 24hr time only
-            ptSeconds = int(self.programTime.seconds)
-            self.programTime = dt.timedelta(seconds=ptSeconds)
+    def UpdateProgramTime(self):
+        """
+        Updates the program time display each frame of the clock, which advances the programTime (see
+        `SimulationClock`).
 
+        :return:
+        """
         # Update the program time display, and ensure it is non-editable by user:
         self.programTimeDisplay.config(state='normal')
         self.programTimeDisplay.delete('1.0', 'end')
-        self.programTimeDisplay.insert('1.0', str(self.programTime))
+        self.programTimeDisplay.insert('1.0', FormatTime(self.simulation.programTime))
         self.programTimeDisplay.config(state='disabled')
-        self.root.after(1000, self.UpdateProgramTime)
+
+    def LogStatistics(self):
+        """
+        Prints a single line summary of the timings and counters (see `Instrumentation.Summary`), every
+        statsLogInterval seconds (run by the clock). The first frame is not logged, as nothing has been measured yet.
+        :return:
+        """
+        if self.clock.numFrames > 0:
+            print(f"[{FormatTime(self.simulation.programTime)}] {self.instrumentation.Summary()}")
 
     def CloseProgramMessage(self):
         """
@@ -424,16 +289,19 @@ class Main:
         the updated Flight data.
         :return:
         """
+        if self.task is not None:  # The program files are being read or written
+            messagebox.showinfo('Quit', 'Please wait until the program files have been read or updated.')
+            return
         # Confirm close, and if to update the program files
         messageboxMessage = 'Closing Program. Would you like to update the program files?'
         updateFile = messagebox.askyesnocancel('Quit', messageboxMessage)
         # Returns True, False or None (to not close program)
         if updateFile:
-            self.running = False
-            self.updateFile = True
+            self.BeginSave()
         elif updateFile is False:
             self.running = False
             self.updateFile = False
+            self.discardChanges = True
 
     def SwitchScreen(self, screenToGrid):
         """
@@ -447,50 +315,48 @@ class Main:
                 screen.body.grid_forget()
         screenToGrid.body.grid(row=1, column=0)
 
-    def FlightUpdateLoop(self):
+    @staticmethod
+    def UpdateOptionMenuItems(menu, optionList, strvar, default=''):
         """
-        This function runs through all flights stored within the allFlights list and calls their UpdateDistanceAndTime
-        function. following this, if a flight has landed, it is removed from it's respective airports' inbound and
-        outbound lists, and moved into the landedFlights list of the Destination Airport.
+        This function updates the options within a tk.OptionMenu widget's dropdown menu.
 
-        Flights which have landed are then removed from the allFlights list, so that they are not continuously updated
-        and to permit more flights to be made (75 max ongoing flights)
+        This function is adapted from: https://stackoverflow.com/a/17581364 [Accessed 14th November 2023]
+        :param menu:
+        :param optionList:
+        :param strvar:
+        :param default:
         :return:
         """
-        for i, flight in enumerate(self.allFlights):
-            flight.UpdateDistanceAndTime(self.prevTime, self.programTime)  # Update Flight Values
-            if flight.hasLanded:
-                for airport in self.airports:  # iterate through all airports to find flight references
-                    for inb, inbFlight in enumerate(airport.inboundFlights):
-                        if flight == inbFlight:
-                            airport.landedFlights.append(airport.inboundFlights.pop(inb))
-                            break  # Flight found
-                    for outb, outbFlight in enumerate(airport.outboundFlights):
-                        if flight == outbFlight:
-                            airport.outboundFlights.pop(outb)
-                            break  # Flight found
-                self.allFlights.pop(i)  # Remove from allFlights list
-
-        self.prevTime = self.programTime  # Update previous time
-        self.root.after(1000, self.FlightUpdateLoop)  # Calls function automatically after 1 second
+        menu['menu'].delete(0, 'end')  # Remove all items in optionMenu
+        strvar.set(default)  # set prompt to given value
+        for option in optionList:
+            menu['menu'].add_command(label=option, command=tk._setit(strvar, option))  # Adds option to optionMenu
 
-    @staticmethod
-    def ConstructDynamicDataGrid(frame, nwrow, nwcol, dataLabels, width=800, height=400, numRows=5):
-        """
-        Constructs a scrollable data grid which data can be inserted into through the use of a tk.Canvas Widget to house
-        a tk.Frame containing the data grid.
 
+class DataGrid:
+    """
+    This Class provides a scrollable, virtualized data grid which flight data can be inserted into, through the use of
+    a tk.Canvas Widget to house a tk.Frame containing the data grid.
+
+    Only the rows which fit in the viewport are constructed as widgets. Scrolling vertically moves the viewport through
+    the flight data, rebinding the constructed rows to the flights now in view, so any number of flights can be
+    displayed without constructing further widgets.
+
+    The construction of the Canvas and its Scrollbars is adapted from https://stackoverflow.com/a/3092341
+    [accessed 14th November 2023]
+    """
+    def __init__(self, frame, nwrow, nwcol, dataLabels, width=800, height=400, numRows=5, instrumentation=None):
+        """
         The Canvas is constructed with the `frame` parameter as its root, at the position [nwcol+1, nwrow+1].
         A Horizontal Scrollbar is constructed above the Canvas, and a Vertical Scrollbar to the left of the Canvas.
 
         `DataLabels` is a list of strings, which are used to construct tk.Label widgets as the headers of each column.
-        Minimum columns in the data grid is 6, but maximum is unlimited. `numRows` determines the number of rows in the
-        data grid, defaulting to the minimum 5, and is able to be at most 25.
+        Minimum columns in the data grid is 6, but maximum is unlimited. `numRows` determines the number of rows
+        visible in the viewport, and so the number of rows constructed, with a minimum of 5.
 
         Parameters `width` and `height` are used to determine the size of the canvas, defaulting to 800 and 400
-        respectively.
-
-        This function is adapted from https://stackoverflow.com/a/3092341 [accessed 14th November 2023]
+        respectively. Given an `instrumentation`, the duration of each redraw and the number of cells redrawn are
+        recorded (see `Instrumentation`).
         :param frame:
         :param nwrow:
         :param nwcol:
@@ -498,130 +364,148 @@ class Main:
         :param width:
         :param height:
         :param numRows:
-        :return:
+        :param instrumentation:
         """
+        self.dataLabels = dataLabels
+        self.instrumentation = instrumentation
+        self.flightData = []  # Flights displayed by the data grid, sorted by arrival time
+        self.sortedSet = None  # FlightSet that flightData was sorted from, and its version then (see InsertValues)
+        self.sortedVersion = None
+        self.firstRow = 0  # Index within flightData of the flight displayed in the top row of the viewport
+
         # Construct Canvas and inner frame window widgets
-        canvas = tk.Canvas(frame, borderwidth=5, relief='raised', bg='gray', width=width, height=height)
-        canvas.grid(row=nwrow+1, column=nwcol+1)
-        canvasFrame = tk.Frame(canvas)
-        canvas.create_window((4, 4), window=canvasFrame, tags="self.srFrameInCanvas", anchor="nw")
-
-        # Construct Vertical and Horizontal Scrollbars
-        vsb = tk.Scrollbar(frame, orient='vertical', command=canvas.yview)
-        vsb.grid(row=nwrow+1, column=nwcol, sticky='ns')
-        canvas.config(yscrollcommand=vsb.set)
-        hsb = tk.Scrollbar(frame, orient='horizontal', command=canvas.xview)
-        hsb.grid(row=nwrow, column=nwcol+1, sticky='ew')
-        canvas.config(xscrollcommand=hsb.set)
-        canvasFrame.bind("<Configure>", lambda x: canvas.configure(scrollregion=canvas.bbox("all")))
+        self.canvas = tk.Canvas(frame, borderwidth=5, relief='raised', bg='gray', width=width, height=height)
+        self.canvas.grid(row=nwrow+1, column=nwcol+1)
+        self.canvasFrame = tk.Frame(self.canvas)
+        self.canvas.create_window((4, 4), window=self.canvasFrame, anchor="nw")
+
+        # Construct Vertical and Horizontal Scrollbars, the vertical scrollbar scrolls through the flight data
+        self.vsb = tk.Scrollbar(frame, orient='vertical', command=self.Scroll)
+        self.vsb.grid(row=nwrow+1, column=nwcol, sticky='ns')
+        self.hsb = tk.Scrollbar(frame, orient='horizontal', command=self.canvas.xview)
+        self.hsb.grid(row=nwrow, column=nwcol+1, sticky='ew')
+        self.canvas.config(xscrollcommand=self.hsb.set)
+        self.canvasFrame.bind("<Configure>", lambda x: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
 
         # Construct labels from the DataLabels list:
-        dataFieldLabels = []
+        self.dataFieldLabels = []
         for i, label in enumerate(dataLabels):
-            dataFieldLabels.append(tk.Label(canvasFrame, text=label))
-            dataFieldLabels[-1].grid(row=0, column=i)
+            self.dataFieldLabels.append(tk.Label(self.canvasFrame, text=label))
+            self.dataFieldLabels[-1].grid(row=0, column=i)
         if len(dataLabels) < 6:  # Ensure there are a minimum of 6 columns
             for i in range(6 - len(dataLabels)):
-                dataFieldLabels.append(tk.Label(canvasFrame, text=""))  # Empty labels
-                dataFieldLabels[-1].grid(row=0, column=6 - i)
-
-        # Ensure rows number between 5 and 25:
-        numRows = min(25, numRows)
-        numRows = max(5, numRows)
-
-        # construct the datagrid:
-        dataFieldRows = []
-        for row in range(numRows):
+                self.dataFieldLabels.append(tk.Label(self.canvasFrame, text=""))  # Empty labels
+                self.dataFieldLabels[-1].grid(row=0, column=6 - i)
+
+        # Construct the rows of the viewport, and the shadow copy of the values displayed within them:
+        self.numRows = max(5, numRows)
+        self.dataFieldRows = []
+        self.shownValues = [['' for _ in self.dataFieldLabels] for _ in range(self.numRows)]
+        for row in range(self.numRows):
             dataField = []
-            for col in range(len(dataFieldLabels)):  # Construct a row of cells for the data grid
+            for col in range(len(self.dataFieldLabels)):  # Construct a row of cells for the data grid
                 bg = 'light gray' if row % 2 == 0 else 'white'
-                dataField.append(tk.Text(canvasFrame, width=15, height=2, state='disabled', bg=bg,
+                dataField.append(tk.Text(self.canvasFrame, width=15, height=2, state='disabled', bg=bg,
                                          borderwidth=1, pady=1, wrap='word'))
                 dataField[-1].grid(row=row + 1, column=col)
-            dataFieldRows.append(dataField)  # add constructed row to data grid cells list
-        return canvas, [canvasFrame, dataFieldLabels, dataFieldRows]
+                self.BindMouseWheel(dataField[-1])
+            self.dataFieldRows.append(dataField)  # add constructed row to data grid cells list
+        self.BindMouseWheel(self.canvas)
+        self.Redraw()
 
-    @staticmethod
-    def InsertValuesToDataGrid(dataGrid, dataLabels, flightData):
+    def BindMouseWheel(self, widget):
         """
-        This function updates values within a given dataGrid by deleting all values currently present in the data grid,
-        and then iterating through a set of flightData, updating the cells in each row of the data grid with the values
-        obtained from flightData.
-        :param dataGrid:
-        :param dataLabels:
-        :param flightData:
+        Binds mouse wheel scrolling over the widget to scroll the data grid ("<Button-4>" and "<Button-5>" are the
+        mouse wheel events on X11).
+        :param widget:
         :return:
         """
-        # Delete all values in dataGrid cells:
-        for dataRow in dataGrid:
-            for dataField in dataRow:
-                dataField.config(state='normal')
-                dataField.delete('1.0', 'end')
-                dataField.config(state='disabled')
-
-        # Sort data being inputted by arrival time
-        flightData.sort(key=lambda fli: fli.ttblArriveTime)
-
-        # Insert into dataGrid:
-        for row, flight in enumerate(flightData):
-            try:
-                for col, label in enumerate(dataLabels):
-                    dataGrid[row][col].config(state='normal')
-                    dataGrid[row][col].insert('1.0', flight.GetFlightValue(label)[0])
-                    dataGrid[row][col].config(state='disabled')
-            except IndexError:
-                # more flights than present rows to input data into, hence end loop as all rows filled.
-                break
+        widget.bind("<MouseWheel>", lambda event: self.Scroll('scroll', -1 if event.delta > 0 else 1, 'units'))
+        widget.bind("<Button-4>", lambda event: self.Scroll('scroll', -1, 'units'))
+        widget.bind("<Button-5>", lambda event: self.Scroll('scroll', 1, 'units'))
 
-    @staticmethod
-    def UpdateOptionMenuItems(menu, optionList, strvar, default=''):
+    def InsertValues(self, flightData):
         """
-        This function updates the options within a tk.OptionMenu widget's dropdown menu.
-
-        This function is adapted from: https://stackoverflow.com/a/17581364 [Accessed 14th November 2023]
-        :param menu:
-        :param optionList:
-        :param strvar:
-        :param default:
+        This function replaces the flights displayed by the data grid with the given flightData, and updates the rows
+        within the viewport. A FlightSet is only sorted again once flights have been added to or removed from it, as
+        the timetabled arrival times of its flights never change; the rows within the viewport are always updated.
+        :param flightData:
         :return:
         """
-        menu['menu'].delete(0, 'end')  # Remove all items in optionMenu
-        strvar.set(default)  # set prompt to given value
-        for option in optionList:
-            menu['menu'].add_command(label=option, command=tk._setit(strvar, option))  # Adds option to optionMenu
+        if flightData is not self.sortedSet or flightData.version != self.sortedVersion:
+            # Sort data being inputted by arrival time
+            self.flightData = sorted(flightData, key=operator.attrgetter('ttblArriveTime'))
+            self.sortedSet = flightData if isinstance(flightData, FlightSet) else None
+            self.sortedVersion = self.sortedSet.version if self.sortedSet is not None else None
+        self.Redraw()
+
+    def Scroll(self, action, amount, units='units'):
+        """
+        This function moves the viewport through the flight data. Called by the vertical Scrollbar with either
+        ('moveto', fraction) or ('scroll', number, 'units' / 'pages').
+        :param action:
+        :param amount:
+        :param units:
+        :return: 'break', preventing the mouse wheel from also scrolling a cell's text
+        """
+        if action == 'moveto':
+            self.firstRow = int(float(amount) * len(self.flightData))
+        elif units == 'pages':
+            self.firstRow += int(amount) * self.numRows
+        else:
+            self.firstRow += int(amount)
+        self.Redraw()
+        return 'break'
 
-    @staticmethod
-    def Converter(dataType, fliValue, searchValues):
+    def Redraw(self):
         """
-        This function acts as a data type converter for values fetched from the flight object, and for the values
-        inputted into the search by the user. This ensures that the data can be suitably compared.
+        This function updates the rows within the viewport with the values of the flights now in view, comparing the
+        values to the shadow copy of the values currently displayed. Only cells whose values have changed are updated,
+        and rows without a flight are emptied (see RedrawRows). With instrumentation, each redraw is timed and the cells
+        updated are counted.
+        :return:
+        """
+        if self.instrumentation is not None:
+            with self.instrumentation.Timer('Redraw'):
+                self.instrumentation.Count('Cells Redrawn', self.RedrawRows())
+        else:
+            self.RedrawRows()
 
-        :param dataType:
-        :param fliValue:
-        :param searchValues:
+    def RedrawRows(self):
+        """
+        Updates the cells of the viewport whose values have changed (see Redraw), returning the number of cells updated.
         :return:
         """
-        convValues = []
-        if dataType == 'int':  # Convert to int
-            convValues = [int(searchValues[i]) for i in range(len(searchValues))]
-            return int(fliValue), convValues
-        elif dataType == 'float':  # Convert to float
-            convValues = [float(searchValues[i]) for i in range(len(searchValues))]
-            return float(fliValue), convValues
-        elif dataType == 'bool':  # Convert bools into strings
-            fliValue = f"{fliValue}"
-            return fliValue, searchValues
-        elif dataType == 'time':  # Convert into timedeltas
-            for i, sv in enumerate(searchValues):
-                try:
-                    time = dt.datetime.strptime(sv, "%H:%M:%S").time()
-                    timedelta = dt.timedelta(hours=time.hour, minutes=time.minute, seconds=time.second)
-                    convValues.append(timedelta)
-                except ValueError:  # Unsuitable inputs are provided, revert to default values
-                    convValues = [dt.timedelta(seconds=0) for _ in range(len(searchValues))]
-            return fliValue, convValues
-        else:  # Values did not need converting
-            return fliValue, searchValues
+        # Keep the viewport within the flight data
+        self.firstRow = max(0, min(self.firstRow, len(self.flightData) - self.numRows))
+
+        # Identify the cells whose values differ from those displayed:
+        changedFields = []
+        for row, dataRow in enumerate(self.dataFieldRows):
+            dataIndex = self.firstRow + row
+            values = self.flightData[dataIndex].GetRow(self.dataLabels) if dataIndex < len(self.flightData) else ()
+            shownRow = self.shownValues[row]
+            for col, dataField in enumerate(dataRow):
+                value = values[col] if col < len(values) else ''
+                if value != shownRow[col]:
+                    shownRow[col] = value
+                    changedFields.append((dataField, value))
+
+        # Update the changed cells, enabling them for editing only whilst their values are replaced:
+        for dataField, value in changedFields:
+            dataField.config(state='normal')
+        for dataField, value in changedFields:
+            dataField.replace('1.0', 'end', value)
+        for dataField, value in changedFields:
+            dataField.config(state='disabled')
+
+        # Size the vertical Scrollbar's slider to the proportion of the flight data within the viewport
+        if len(self.flightData) > self.numRows:
+            self.vsb.set(self.firstRow / len(self.flightData),
+                         (self.firstRow + self.numRows) / len(self.flightData))
+        else:
+            self.vsb.set(0, 1)
+        return len(changedFields)
 
 
 class AirportFlightsScreen:
@@ -634,6 +518,7 @@ class AirportFlightsScreen:
     """
     def __init__(self, host):
         self.host = host
+        self.simulation = host.simulation
         self.body = tk.Frame(self.host.root)
         self.framesList = [tk.Frame(self.body, relief="raised", borderwidth=5) for _ in range(4)]
 
@@ -649,13 +534,13 @@ class AirportFlightsScreen:
         self.displayLandedDataValues = ['Flight Code', 'Origin', 'Arrival Time', 'Delay Time']
 
         # Construct var-stored Widgets:
-        self.airportMenu = tk.OptionMenu(self.framesList[0], self.apSelection, *self.host.airportNames)
-        self.inboundCanvas, self.inbCanvasFrameWidgets = (
-            self.host.ConstructDynamicDataGrid(self.framesList[1], 1, 0, self.displayInbDataValues, 700, 200, 10))
-        self.outboundCanvas, self.outbCanvasFrameWidgets = (
-            self.host.ConstructDynamicDataGrid(self.framesList[2], 1, 0, self.displayOutbDataValues, 700, 200, 10))
-        self.landedCanvas, self.landedCanvasFrameWidgets = (
-            self.host.ConstructDynamicDataGrid(self.framesList[3], 1, 0, self.displayLandedDataValues, 500, 200, 10))
+        self.airportMenu = tk.OptionMenu(self.framesList[0], self.apSelection, *self.simulation.airportNames)
+        self.inboundGrid = DataGrid(self.framesList[1], 1, 0, self.displayInbDataValues, 700, 200, 5,
+                                    host.instrumentation)
+        self.outboundGrid = DataGrid(self.framesList[2], 1, 0, self.displayOutbDataValues, 700, 200, 5,
+                                     host.instrumentation)
+        self.landedGrid = DataGrid(self.framesList[3], 1, 0, self.displayLandedDataValues, 500, 200, 5,
+                                   host.instrumentation)
 
     def Construct(self):
         """
@@ -678,25 +563,21 @@ class AirportFlightsScreen:
         tk.Label(self.framesList[2], text='Outbound Flights Data').grid(row=0, column=0, columnspan=6)
         tk.Label(self.framesList[3], text='Landed Flights Data').grid(row=0, column=0, columnspan=6)
 
-        self.UpdateAirportDisplay()
+        self.host.clock.Register('Airport Flights', self.UpdateAirportDisplay, interval=1, budget=0.05, skippable=True)
 
     def UpdateAirportDisplay(self):
         """
-        This function updates the data grids each second to display the relevant flight information for the currently
-        selected Airport. This function only performs the updates when the frames are visible, hence it does not use up
-        proccessing whilst the user is on other screens.
+        This function updates the data grids each second (run by the clock) to display the relevant flight information
+        for the currently selected Airport. This function only performs the updates when the frames are visible, hence
+        it does not use up proccessing whilst the user is on other screens.
         :return:
         """
-        for airport in self.host.airports:
-            # only update frames when they are visible
-            if self.apSelection.get() == airport.name and self.body.winfo_ismapped():
-                self.host.InsertValuesToDataGrid(self.inbCanvasFrameWidgets[2], self.displayInbDataValues,
-                                                 airport.inboundFlights)
-                self.host.InsertValuesToDataGrid(self.outbCanvasFrameWidgets[2], self.displayOutbDataValues,
-                                                 airport.outboundFlights)
-                self.host.InsertValuesToDataGrid(self.landedCanvasFrameWidgets[2], self.displayLandedDataValues,
-                                                 airport.landedFlights)
-        self.host.root.after(1000, self.UpdateAirportDisplay)  # Creates loop, calls function again every second.
+        airport = self.simulation.airportsByName.get(self.apSelection.get())
+        # only update frames when they are visible
+        if airport is not None and self.body.winfo_ismapped():
+            self.inboundGrid.InsertValues(airport.inboundFlights)
+            self.outboundGrid.InsertValues(airport.outboundFlights)
+            self.landedGrid.InsertValues(airport.landedFlights)
 
 
 class SearchFlightDataScreen:
@@ -710,16 +591,18 @@ class SearchFlightDataScreen:
     """
     def __init__(self, host):
         self.host = host
+        self.simulation = host.simulation
         self.body = tk.Frame(self.host.root)
         self.framesList = [tk.Frame(self.body, relief='raised', borderwidth=5) for _ in range(2)]
 
         # Construct Search Term variables list [StringValue 1, StringValue 2, EnabledStatus] for each data element
-        self.searchTerms = [[tk.StringVar(), tk.StringVar(), tk.IntVar()] for _ in range(len(self.host.dataSearchTerms))]
+        self.searchTerms = [[tk.StringVar(), tk.StringVar(), tk.IntVar()]
+                            for _ in range(len(self.simulation.dataSearchTerms))]
         self.searchedFlights = []  # List of flights which match search data
 
-        # Construct search results canvas
-        self.searchResultsCanvas, self.srCanvasFrameWidgets = (
-            self.host.ConstructDynamicDataGrid(self.framesList[1], 0, 0, self.host.dataSearchTerms, 800, 400, 50))
+        # Construct search results data grid
+        self.searchResultsGrid = DataGrid(self.framesList[1], 0, 0, self.simulation.dataSearchTerms, 800, 400, 10,
+                                          host.instrumentation)
 
     def Construct(self):
         """
@@ -737,7 +620,7 @@ class SearchFlightDataScreen:
         tk.Label(self.framesList[0], text='Value 2 ').grid(row=0, column=2)
         tk.Label(self.framesList[0], text='Enabled?').grid(row=0, column=3)
 
-        for row, searchTerm in enumerate(self.host.dataSearchTerms):
+        for row, searchTerm in enumerate(self.simulation.dataSearchTerms):
             # Construct a label for each Search Term
             tk.Label(self.framesList[0], text=searchTerm).grid(row=row + 1, column=0)
             # Construct a checkbutton for each Search Term and set to "Enabled"
@@ -753,47 +636,38 @@ class SearchFlightDataScreen:
         tk.Button(self.framesList[0], text='Search Flights', command=lambda: self.SearchFlights()).grid(
             row=len(self.searchTerms) + 1, column=0, columnspan=500)
 
-        self.UpdateSearchFrame()
+        self.host.clock.Register('Search Results', self.UpdateSearchFrame, interval=5, budget=0.05, skippable=True)
 
     def SearchFlights(self):
         """
-        Search Through allFlights and identify which flights match all search terms that are entered.
+        Search Through allFlights and identify which flights match all search terms that are entered. The search is
+        performed by the Simulation's FlightSearchIndex (see `FlightSearchIndex.Search`).
         :return:
         """
-        self.searchedFlights = []  # list of flights that match the search data
-        suitableFlights = self.host.allFlights.copy()
-        # Loop through each search term, and each flight remaining within the suitable flights list
+        criteria = []  # Tuples of the search term and the user's search values for each enabled search term
         for termIndex, dataQueryInfo in enumerate(self.searchTerms):
             # Get text strings from the input boxes, assign as SearchValues
             searchValues = [dataQueryInfo[0].get(), dataQueryInfo[1].get()]
             if dataQueryInfo[2].get():  # dqi[2] refers to the IntVar, if 1 then the search term is enabled
+                searchTerm = self.simulation.dataSearchTerms[termIndex]
                 if searchValues[0] != '' and searchValues[1] != '':  # Dealing with a range of values
-                    for flIndex, flight in enumerate(suitableFlights):
-                        # Obtain the flight's value for searched term, and the data type
-                        # then convert flight's value and the user's search values to the data type for comparison
-                        fliValue, datType = flight.GetFlightValue(self.host.dataSearchTerms[termIndex])
-                        fliValue, convValues = self.host.Converter(datType, fliValue, searchValues)
-                        if not ((convValues[0] <= fliValue) and (fliValue <= convValues[1])):
-                            suitableFlights[flIndex] = ''
-
+                    criteria.append((searchTerm, searchValues))
                 elif searchValues[0] != '':  # Dealing with matching a single value (Entries only in val 2 are ignored)
-                    for flIndex, flight in enumerate(suitableFlights):
-                        if type(flight) is Flight:
-                            fliValue, datType = flight.GetFlightValue(self.host.dataSearchTerms[termIndex])
-                            fliValue, convValues = self.host.Converter(datType, fliValue, [searchValues[0]])
-                            if fliValue != convValues[0]:  # Only first converted Search value is required
-                                suitableFlights[flIndex] = ''
+                    criteria.append((searchTerm, [searchValues[0]]))
 
-        for flight in suitableFlights:
-            if flight != '':
-                self.searchedFlights.append(flight)
-
-        self.UpdateSearchFrame(reoccur=False)
+        # list of flights that match the search data, timed as the search latency
+        with self.host.instrumentation.Timer('Search'):
+            self.searchedFlights = self.simulation.searchIndex.Search(criteria)
+        self.UpdateSearchFrame()
 
-    def UpdateSearchFrame(self, reoccur=True):
-        self.host.InsertValuesToDataGrid(self.srCanvasFrameWidgets[2], self.host.dataSearchTerms, self.searchedFlights)
-        if reoccur and self.body.winfo_ismapped():
-            self.host.root.after(5000, self.UpdateSearchFrame)  # Performs loop every 5 seconds
+    def UpdateSearchFrame(self):
+        """
+        Updates the search results data grid with the values of the searched flights, when the screen is visible. Run
+        every 5 seconds by the clock, and upon each search.
+        :return:
+        """
+        if self.body.winfo_ismapped():
+            self.searchResultsGrid.InsertValues(self.searchedFlights)
 
 
 class AddFlightAirportScreen:
@@ -807,6 +681,7 @@ class AddFlightAirportScreen:
     """
     def __init__(self, host):
         self.host = host
+        self.simulation = host.simulation
         self.body = tk.Frame(self.host.root)
         self.framesList = [tk.Frame(self.body, relief="raised", borderwidth=5) for _ in range(3)]
 
@@ -821,11 +696,15 @@ class AddFlightAirportScreen:
         self.flightDataEntries[4].set("Select Aircraft")
         self.flightDataEntries[5].set("12:00:00")
         self.numFlights = tk.StringVar()
+        # Constructs the flights of random batches, freshly seeded so that each session makes different flights
+        self.flightGenerator = FlightGenerator(self.simulation, random.randrange(2 ** 32))
 
         # Flight: Construct var-stored Widgets:
-        self.originMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[1], *self.host.airportNames)
-        self.destinationMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[2], *self.host.airportNames)
-        self.airlineMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[3], *self.host.airlineNames,
+        self.originMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[1], *self.simulation.airportNames)
+        self.destinationMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[2],
+                                             *self.simulation.airportNames)
+        self.airlineMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[3],
+                                         *self.simulation.airlines.Names(),
                                          command=lambda x: self.UpdateAircraftOptions())
         self.aircraftMenu = tk.OptionMenu(self.framesList[0], self.flightDataEntries[4], *[''])
         self.valueInfoBoxes = []  # Error markers to fill in red if value unsuitable
@@ -836,6 +715,7 @@ class AddFlightAirportScreen:
         # Airport: Construct tk.StringVar() inputs, and set values to them:
         self.canConstructAirport = True
         self.canDestroyAirport = True
+        self.numLandedChecked = 0  # Flights landed when the inputs were last checked, see RecheckAfterLandings
         self.newAirportName = tk.StringVar()
         self.newAirportName.set("Default Airport Name")
         self.destroyAirportName = tk.StringVar()
@@ -843,7 +723,8 @@ class AddFlightAirportScreen:
 
         # Airport: Construct var-stored Widgets:
         self.nameAvailable = tk.Text(self.framesList[2], width=2, height=1, bg='red', state='disabled')
-        self.destroyAirportMenu = tk.OptionMenu(self.framesList[2], self.destroyAirportName, *self.host.airportNames)
+        self.destroyAirportMenu = tk.OptionMenu(self.framesList[2], self.destroyAirportName,
+                                                *self.simulation.airportNames)
         self.airportFound = tk.Text(self.framesList[2], width=2, height=1, bg='red', state='disabled')
 
     def Construct(self):
@@ -907,8 +788,35 @@ class AddFlightAirportScreen:
         tk.Button(self.framesList[2], text='Destroy',
                   command=lambda: self.DestroyAirport()).grid(row=5, column=1, sticky='ew')
 
-        self.FlightValueSuitableCheck()  # Runs Loop to check that inputted values for the flight are suitable
-        self.AirportValueSuitableCheck()  # as with flights, but for adding/removing airports
+        # Check that inputted values for the flight are suitable whenever they change, and as with flights, but for
+        # adding/removing airports. The checks are timed as 'Validation'
+        flightCheck = self.host.instrumentation.Timed('Validation', self.FlightValueSuitableCheck)
+        airportCheck = self.host.instrumentation.Timed('Validation', self.AirportValueSuitableCheck)
+        for flightDataEntry in self.flightDataEntries:
+            flightDataEntry.trace_add('write', lambda *args: flightCheck())
+        for airportEntry in (self.newAirportName, self.destroyAirportName):
+            airportEntry.trace_add('write', lambda *args: airportCheck())
+        self.FlightValueSuitableCheck()
+        self.AirportValueSuitableCheck()
+        # Landings free flight numbers and airports without the inputs changing, so they are also checked after them
+        self.numLandedChecked = len(self.simulation.landedFlightTable)
+        self.host.clock.Register('Validation', lambda: self.RecheckAfterLandings(flightCheck, airportCheck), interval=1,
+                                 budget=0.01, skippable=True)
+
+    def RecheckAfterLandings(self, flightCheck, airportCheck):
+        """
+        This function re-checks the user's inputs for flights and airports each second (run by the clock) once flights
+        have landed since they were last checked, as a landing frees the flight's number and may leave its airports
+        without inbound or outbound flights, so they can be destroyed.
+        :param flightCheck:
+        :param airportCheck:
+        :return:
+        """
+        numLanded = len(self.simulation.landedFlightTable)
+        if numLanded != self.numLandedChecked:
+            self.numLandedChecked = numLanded
+            flightCheck()
+            airportCheck()
 
     def ConstructAirport(self):
         """
@@ -926,19 +834,18 @@ class AddFlightAirportScreen:
             if "airport" not in newAirportName.lower():
                 newAirportName = f"{newAirportName} Airport"
 
-            newAirport = Airport(newAirportName, self.host.allFlights)  # Construct new Airport object
-            # Update Main's airport information lists
-            self.host.airports.append(newAirport)
-            self.host.airportNames.append(newAirport.name)
+            newAirport = Airport(newAirportName, self.simulation.allFlights)  # Construct new Airport object
+            # Update the Simulation's airport information lists
+            self.simulation.AddAirport(newAirport)
 
             # Update optionMenus with new airport:
-            self.host.UpdateOptionMenuItems(self.host.screenFrames[0].airportMenu, self.host.airportNames,
+            self.host.UpdateOptionMenuItems(self.host.screenFrames[0].airportMenu, self.simulation.airportNames,
                                             self.host.screenFrames[0].apSelection, "Select Airport")
-            self.host.UpdateOptionMenuItems(self.originMenu, self.host.airportNames,
+            self.host.UpdateOptionMenuItems(self.originMenu, self.simulation.airportNames,
                                             self.flightDataEntries[1], "Select Origin")
-            self.host.UpdateOptionMenuItems(self.destinationMenu, self.host.airportNames,
+            self.host.UpdateOptionMenuItems(self.destinationMenu, self.simulation.airportNames,
                                             self.flightDataEntries[2], "Select Destination")
-            self.host.UpdateOptionMenuItems(self.destroyAirportMenu, self.host.airportNames,
+            self.host.UpdateOptionMenuItems(self.destroyAirportMenu, self.simulation.airportNames,
                                             self.destroyAirportName, "Select Airport")
 
     def DestroyAirport(self):
@@ -947,82 +854,73 @@ class AddFlightAirportScreen:
         object.
         :return:
         """
-        self.AirportValueSuitableCheck(False)  # Ensure airport is valid
+        self.AirportValueSuitableCheck()  # Ensure airport is valid
         if self.canDestroyAirport:
-            for i, airport in enumerate(self.host.airports):
-                if airport.name == self.destroyAirportName.get():
-                    # Remove airports from Main's info lists
-                    self.host.airports.pop(i)
-                    self.host.airportNames.pop(i)
-                    del airport  # destroys Airport object
+            # Remove airport from the Simulation's info lists, destroying the Airport object
+            self.simulation.RemoveAirport(self.destroyAirportName.get())
 
         # Update optionMenus with new airport list:
-        self.host.UpdateOptionMenuItems(self.host.screenFrames[0].airportMenu, self.host.airportNames,
+        self.host.UpdateOptionMenuItems(self.host.screenFrames[0].airportMenu, self.simulation.airportNames,
                                         self.host.screenFrames[0].apSelection, "Select Airport")
-        self.host.UpdateOptionMenuItems(self.originMenu, self.host.airportNames,
+        self.host.UpdateOptionMenuItems(self.originMenu, self.simulation.airportNames,
                                         self.flightDataEntries[1], "Select Origin Airport")
-        self.host.UpdateOptionMenuItems(self.destinationMenu, self.host.airportNames,
+        self.host.UpdateOptionMenuItems(self.destinationMenu, self.simulation.airportNames,
                                         self.flightDataEntries[2], "Select Destination Airport")
-        self.host.UpdateOptionMenuItems(self.destroyAirportMenu, self.host.airportNames,
+        self.host.UpdateOptionMenuItems(self.destroyAirportMenu, self.simulation.airportNames,
                                         self.destroyAirportName, "Select Airport")
 
-    def AirportValueSuitableCheck(self, reoccur=True):
+    def AirportValueSuitableCheck(self):
         """
         This function determines if the user's inputs for the airport constructor or airport destructor are valid. It is
-        used for both airport construction and destruction, and is called on loop every second, alongside whenever the
-        construct / destroy airport button is pressed.
-        :param reoccur:
+        used for both airport construction and destruction, and is called whenever the new airport name or the airport
+        selected for destruction changes (through a trace upon their variables), alongside whenever the construct /
+        destroy airport button is pressed. Names are looked up within the Simulation's airportsByName.
         :return:
         """
-        if self.body.winfo_ismapped():  # Only runs if the window is currently shown to the user
-            # Assume the details are suitable:
-            self.canConstructAirport = True
-            self.nameAvailable.config(bg='green')
-            self.canDestroyAirport = True
-            self.airportFound.config(bg='green')
+        # Assume the details are suitable:
+        self.canConstructAirport = True
+        self.nameAvailable.config(bg='green')
+        self.canDestroyAirport = True
+        self.airportFound.config(bg='green')
+
+        # ----Perform checks on new airport creation:----
+        # Ensure new airport name fits criteria:
+        apNameSections = self.newAirportName.get().strip().split(' ')
+        apNameSections = [apNameSect.strip() for apNameSect in apNameSections if apNameSect not in ('', ' ')]
+        if len(apNameSections) != 0:  # Only proceed if user entry is made
+            # Remove Whitespace and construct full name
+            newAirportName = f"{apNameSections[0]}"
+            for apNameSect in apNameSections[1:]:
+                newAirportName = f"{newAirportName} {apNameSect}"
+            if "airport" not in newAirportName.lower():
+                newAirportName = f"{newAirportName} Airport"
 
-            # ----Perform checks on new airport creation:----
-            # Ensure new airport name fits criteria:
-            apNameSections = self.newAirportName.get().strip().split(' ')
-            apNameSections = [apNameSect.strip() for apNameSect in apNameSections if apNameSect not in ('', ' ')]
-            if len(apNameSections) != 0:  # Only proceed if user entry is made
-                # Remove Whitespace and construct full name
-                newAirportName = f"{apNameSections[0]}"
-                for apNameSect in apNameSections[1:]:
-                    newAirportName = f"{newAirportName} {apNameSect}"
-                if "airport" not in newAirportName.lower():
-                    newAirportName = f"{newAirportName} Airport"
-
-                if newAirportName in self.host.airportNames or newAirportName == "Default Airport Name":
-                    # Name already exists / is default prompt, so cannot be used
-                    self.canConstructAirport = False
-                    self.nameAvailable.config(bg='red')
-
-                if len(newAirportName.strip()) < 13:
-                    # name too short (is under 5 chars) and cannot be used
-                    self.canConstructAirport = False
-                    self.nameAvailable.config(bg='red')
-
-            else:  # No name entered
+            if newAirportName in self.simulation.airportsByName or newAirportName == "Default Airport Name":
+                # Name already exists / is default prompt, so cannot be used
                 self.canConstructAirport = False
                 self.nameAvailable.config(bg='red')
 
-            # ----Perform checks on airport deletion:----
-            # ensure selected airport for destruction meets criteria
-            if self.destroyAirportName.get() in self.host.airportNames:  # Ensures is not prompt value
-                for airport in self.host.airports:
-                    if airport.name == self.destroyAirportName.get():
-                        # Prevent destroying Airport whilst it has inbound and outbound flights
-                        if len(airport.inboundFlights) > 0 or len(airport.outboundFlights) > 0:
-                            self.canDestroyAirport = False
-                            self.airportFound.config(bg='red')
-
-            elif self.destroyAirportName.get() not in self.host.airportNames:
+            if len(newAirportName.strip()) < 13:
+                # name too short (is under 5 chars) and cannot be used
+                self.canConstructAirport = False
+                self.nameAvailable.config(bg='red')
+
+        else:  # No name entered
+            self.canConstructAirport = False
+            self.nameAvailable.config(bg='red')
+
+        # ----Perform checks on airport deletion:----
+        # ensure selected airport for destruction meets criteria
+        if self.destroyAirportName.get() in self.simulation.airportsByName:  # Ensures is not prompt value
+            airport = self.simulation.airportsByName[self.destroyAirportName.get()]
+            # Prevent destroying Airport whilst it has inbound and outbound flights
+            if len(airport.inboundFlights) > 0 or len(airport.outboundFlights) > 0:
                 self.canDestroyAirport = False
                 self.airportFound.config(bg='red')
 
-        if reoccur:
-            self.host.root.after(1000, self.AirportValueSuitableCheck)  # Performs loop of function every second
+        else:
+            self.canDestroyAirport = False
+            self.airportFound.config(bg='red')
 
     def UpdateAircraftOptions(self):
         """
@@ -1030,41 +928,29 @@ class AddFlightAirportScreen:
         selection optionMenu with the new aircraft list.
         :return:
         """
-        aircraftList = []
-        for airline in self.host.airlineDataSets:
-            if airline[0] == self.flightDataEntries[3].get():  # identify airline
-                airlineData = airline
-                aircraftList = airlineData[2:int(len(airlineData) / 2) + 1]  # obtain aircraft from airline data
+        airline = self.simulation.airlines.Get(self.flightDataEntries[3].get())  # identify airline
+        aircraftList = list(airline.aircraft) if airline is not None else []  # obtain aircraft names of the airline
 
         # update optionMenu
         self.host.UpdateOptionMenuItems(self.aircraftMenu, aircraftList, self.flightDataEntries[4], "Select Aircraft")
 
     def SetToFreeFlightNumber(self):
         """
-        This function is used to obtain the lowest unused flight number from a user-selected airline. The function
-        compiles all in-use flight numbers for a given airline in their integer forms, in an ascending sort. After
-        obtaining the lowest unused flight number, the program creates a 0-padded flight number which is inserted into
-        the Flight Number Entry field.
+        This function is used to obtain the lowest unused flight number from a user-selected airline, as held by the
+        airline's FlightNumberAllocator within the Simulation. After obtaining the lowest unused flight number, the
+        program creates a 0-padded flight number which is inserted into the Flight Number Entry field. Should the
+        airline have no unused flight numbers, the field is emptied (and hence marked as invalid).
         :return:
         """
-        airlineCode = ''
-        for airlineData in self.host.airlineDataSets:
-            if airlineData[0] == self.flightDataEntries[3].get():
-                airlineCode = airlineData[1]  # Get airline Code
-
-        # Get all flight numbers using that airline code:
-        fliNumbers = []
-        for flight in self.host.allFlights:
-            alCode, fliNum = flight.alCode, flight.fliNum  # Get flight data for comparison
-            if alCode == airlineCode:  # Flight belongs to airline check
-                fliNumbers.append(int(fliNum))  # Adds flight number to list
-        fliNumbers.sort()  # Sort numerically ascending
-
-        # Iterate through list to identify the lowest unused value
-        nextNum = 0
-        for num in fliNumbers:
-            if nextNum == num:
-                nextNum = num + 1
+        airline = self.simulation.airlines.Get(self.flightDataEntries[3].get())
+        airlineCode = airline.code if airline is not None else ''  # Get airline Code
+
+        # Get the lowest flight number not in use by the airline:
+        try:
+            nextNum = self.simulation.FlightNumbers(airlineCode).Lowest()
+        except ValueError:  # Every flight number of the airline is in use
+            self.flightDataEntries[0].set("")
+            return
 
         # Create 0 padded flight num and set to fli Number entry:
         strNextNum = f"{nextNum}"
@@ -1080,124 +966,124 @@ class AddFlightAirportScreen:
         :return:
         """
         # Airline set first so random flight number can be not in use already:
-        self.flightDataEntries[3].set(random.choice(self.host.airlineNames))
+        self.flightDataEntries[3].set(random.choice(self.simulation.airlines.Names()))
         # Get next free flight number:
         self.SetToFreeFlightNumber()
 
         # Get origin/destination as random choice
-        airportOptions = self.host.airportNames.copy()
+        airportOptions = self.simulation.airportNames.copy()
         origin = airportOptions.pop(random.randint(0, len(airportOptions) - 1))  # Removes Origin Airport from list
         destination = airportOptions.pop(random.randint(0, len(airportOptions) - 1))
         self.flightDataEntries[1].set(origin)
         self.flightDataEntries[2].set(destination)
 
         # Get and then set a random aircraft after retrieving the list of usable aircraft
-        for airline in self.host.airlineDataSets:
-            if airline[0] == self.flightDataEntries[3].get():
-                aircraftList = airline[2:int(len(airline) / 2) + 1]
-                self.flightDataEntries[4].set(random.choice(aircraftList))
+        airline = self.simulation.airlines.Get(self.flightDataEntries[3].get())
+        self.flightDataEntries[4].set(random.choice(list(airline.aircraft)))
 
         # Set Random hours and 15min interval time:
         self.flightDataEntries[5].set(f"{random.randint(0, 23)}:{random.randint(0, 3) * 15}:00")
 
     def CreateRandomFlightsBatch(self):
         """
-        This function is a method for the user to automate the creation of (max 25, min 0) flights utilising random
-        data. CreateRandomFlightsBatch utilises FillRandomData and ConstructNewFlight in a loop to repeatedly assign
-        random data to the user entry fields, and then construct a flight from that data.
+        This function is a method for the user to automate the creation of flights utilising random data, limited to
+        the Simulation's remaining capacity for ongoing flights and to RANDOM_BATCH_LIMIT flights at a time, so the
+        program loop is never held up for long. The flights are constructed in bulk by the FlightGenerator, with the
+        same random values as FillRandomData and ConstructNewFlight would choose.
         :return:
         """
         try:  # Ensure num flights is a proper integer
             numFlights = int(self.numFlights.get())
-            if numFlights > 25:  # impose limits on max flights (prevents large repeating loops)
-                numFlights = 25
-            elif numFlights < 0:  # prevent negative value
+            # impose limits on max flights, and on the flights constructed at once
+            numFlights = min(numFlights, self.simulation.maxFlights - len(self.simulation.allFlights),
+                             RANDOM_BATCH_LIMIT)
+            if numFlights < 0:  # prevent negative value
                 raise ValueError
         except ValueError:
             numFlights = 0
 
-        for f in range(numFlights):  # Create the flights using loop
-            self.FillRandomData()
-            self.ConstructNewFlight()
+        try:  # An airline may run out of flight numbers, or there may be too few airports to fly between
+            self.flightGenerator.Generate(numFlights)
+        except ValueError as error:
+            messagebox.showerror('Random Batch Creator', f'The flights could not be created: {error}')
+        self.FlightValueSuitableCheck()  # The entered flight number may now be in use
 
-    def FlightValueSuitableCheck(self, reoccur=True):
+    def FlightValueSuitableCheck(self):
         """
         This function determines if the user's entered values for flight construction are valid and acceptable for a
         new Flight object. The function assumes the values are suitable, and attempts to then identify if values break
         the conditions making them unsuitable. This applies to all 6 entry fields (Flight Number, Origin, Destination,
         Airline, Aircraft and Departure Time).
-        :param reoccur:
+
+        The check is run whenever an entry field changes (through a trace upon its variable), and after flights are
+        created. Flight numbers, airport names, airlines and aircraft are looked up within the Simulation's
+        FlightNumberAllocators, airportsByName and AirlineCatalog, so each check takes constant time however many
+        flights and airlines there are.
         :return:
         """
-        if self.body.winfo_ismapped():  # Only updates if screen is showing
-            # Assume values to be suitable, and hence perform checks to see if any values are not
-            self.canConstructFlight = True
-            for infoBox in self.valueInfoBoxes:
-                infoBox.config(bg='green')
+        # Assume values to be suitable, and hence perform checks to see if any values are not
+        self.canConstructFlight = True
+        for infoBox in self.valueInfoBoxes:
+            infoBox.config(bg='green')
 
-            # Ensure flight num entry is a valid integer:
-            try:
-                if int(self.flightDataEntries[0].get()) < 0:
-                    raise ValueError
-                if len(self.flightDataEntries[0].get()) > 4:
-                    raise ValueError
-            except ValueError:
-                # flightDataEntry cannot be made into a positive int or is too large
-                self.canConstructFlight = False
-                self.valueInfoBoxes[0].config(bg='red')
+        # Ensure flight num entry is a valid integer:
+        try:
+            if int(self.flightDataEntries[0].get()) < 0:
+                raise ValueError
+            if len(self.flightDataEntries[0].get()) > 4:
+                raise ValueError
+        except ValueError:
+            # flightDataEntry cannot be made into a positive int or is too large
+            self.canConstructFlight = False
+            self.valueInfoBoxes[0].config(bg='red')
 
-            # Create 0 padded flight num
-            paddedFliNum = f"{self.flightDataEntries[0].get()}"
-            for i in range(4 - len(paddedFliNum)):
-                paddedFliNum = f"0{paddedFliNum}"
-
-            # Check Flight Number by obtaining list of flight numbers currently in use for selected airline:
-            for i, airline in enumerate(self.host.airlineDataSets):  # Identify set of airline data to get airline code
-                if airline[0] == self.flightDataEntries[3].get():
-                    unavailableFlightCodes = []
-                    for flight in self.host.allFlights:  # Obtain list of in-use flight Codes
-                        unavailableFlightCodes.append(flight.fliCode)
-
-                    fliCode = f"{self.host.airlineDataSets[i][1]}{paddedFliNum}"  # Construct flight's flight Code
-                    if fliCode in unavailableFlightCodes or len(self.flightDataEntries[0].get()) > 4:
-                        # Code already in use, or was too large
-                        self.canConstructFlight = False
-                        self.valueInfoBoxes[0].config(bg='red')
-
-            # Check Airports if they are the same and not default values:
-            if self.flightDataEntries[1].get() == self.flightDataEntries[2].get():
-                self.canConstructFlight = False
-                self.valueInfoBoxes[1].config(bg='red')
-                self.valueInfoBoxes[2].config(bg='red')
+        # Create 0 padded flight num
+        paddedFliNum = f"{self.flightDataEntries[0].get()}"
+        for i in range(4 - len(paddedFliNum)):
+            paddedFliNum = f"0{paddedFliNum}"
 
-            if self.flightDataEntries[1].get() not in self.host.airportNames:
+        # Check Flight Number is not currently in use by the selected airline:
+        # Identify the airline to get airline code
+        airline = self.simulation.airlines.Get(self.flightDataEntries[3].get())
+        if airline is not None:
+            fliNumber = int(paddedFliNum) if paddedFliNum.isdigit() else -1
+            if (not self.simulation.FlightNumbers(airline.code).IsFree(fliNumber)
+                    or len(self.flightDataEntries[0].get()) > 4):
+                # Code already in use, or was too large
                 self.canConstructFlight = False
-                self.valueInfoBoxes[1].config(bg='red')
+                self.valueInfoBoxes[0].config(bg='red')
 
-            if self.flightDataEntries[2].get() not in self.host.airportNames:
-                self.canConstructFlight = False
-                self.valueInfoBoxes[2].config(bg='red')
+        # Check Airports if they are the same and not default values:
+        if self.flightDataEntries[1].get() == self.flightDataEntries[2].get():
+            self.canConstructFlight = False
+            self.valueInfoBoxes[1].config(bg='red')
+            self.valueInfoBoxes[2].config(bg='red')
 
-            # Check Airline and Aircraft:
-            if self.flightDataEntries[3].get() == "Select Airline":  # Ensure value is not equal to default prompt
-                self.canConstructFlight = False
-                self.valueInfoBoxes[3].config(bg='red')
+        if self.flightDataEntries[1].get() not in self.simulation.airportsByName:
+            self.canConstructFlight = False
+            self.valueInfoBoxes[1].config(bg='red')
 
-            if self.flightDataEntries[4].get() == "Select Aircraft":  # Ensure value is not equal to default prompt
-                self.canConstructFlight = False
-                self.valueInfoBoxes[4].config(bg='red')
+        if self.flightDataEntries[2].get() not in self.simulation.airportsByName:
+            self.canConstructFlight = False
+            self.valueInfoBoxes[2].config(bg='red')
 
-            # Check Departure Time is valid Time string:
-            try:
-                # Attempt to turn string into a time object
-                dt.datetime.strptime(self.flightDataEntries[5].get(), "%H:%M:%S")
-            except ValueError:
-                # Exception Thrown as string unsuited to format
-                self.canConstructFlight = False
-                self.valueInfoBoxes[5].config(bg='red')
+        # Check Airline and Aircraft (such as the default prompts) are within the airline catalog:
+        if airline is None:
+            self.canConstructFlight = False
+            self.valueInfoBoxes[3].config(bg='red')
 
-        if reoccur:
-            self.host.root.after(1000, lambda: self.FlightValueSuitableCheck())  # performs loop every second
+        if airline is None or self.flightDataEntries[4].get() not in airline.aircraft:
+            self.canConstructFlight = False
+            self.valueInfoBoxes[4].config(bg='red')
+
+        # Check Departure Time is valid Time string:
+        try:
+            # Attempt to turn string into a time of day in seconds
+            ParseTimeString(self.flightDataEntries[5].get())
+        except ValueError:
+            # Exception Thrown as string unsuited to format
+            self.canConstructFlight = False
+            self.valueInfoBoxes[5].config(bg='red')
 
     def ConstructNewFlight(self):
         """
@@ -1206,23 +1092,15 @@ class AddFlightAirportScreen:
         lists, and to Main's allFlights list.
         :return:
         """
-        self.FlightValueSuitableCheck(False)  # Perform check on flight data validity
+        self.FlightValueSuitableCheck()  # Perform check on flight data validity
 
         # Reject new flight creation if exceed max flights or flight data is invalid
-        if not self.canConstructFlight or (len(self.host.allFlights) >= self.host.maxFlights):
+        if not self.canConstructFlight or not self.simulation.HasCapacity():
             return
 
-        # Get airlineData, aircraftData and index of aircraft/speed
-        airlineData, aircraftData, aircraftIndex = [], [], 0
-        for i, airline in enumerate(self.host.airlineDataSets):
-            if airline[0] == self.flightDataEntries[3].get():
-                # Get index of selected Aircraft to match up with aircraft speed
-                airlineData = airline
-                aircraftData = airline[2:int(len(airline) / 2) + 1]
-                for acIndex, aircraft in enumerate(aircraftData):
-                    if aircraft == self.flightDataEntries[4].get():
-                        # Get Values from airlineData, aircraftData and flightDataEntries:
-                        aircraftIndex = acIndex
+        # Get the selected Airline and Aircraft (with its speed) from the airline catalog
+        airline = self.simulation.airlines.Get(self.flightDataEntries[3].get())
+        aircraft = airline.aircraft[self.flightDataEntries[4].get()]
 
         # Create 0 padded flight num
         paddedFliNum = f"{self.flightDataEntries[0].get()}"
@@ -1231,38 +1109,23 @@ class AddFlightAirportScreen:
 
         #Construct Flight and Airline Details:
         fliNum = paddedFliNum
-        fliCode = f"{airlineData[1]}{fliNum}"
+        fliCode = f"{airline.code}{fliNum}"
         fliOrigin = self.flightDataEntries[1].get()
         fliDestination = self.flightDataEntries[2].get()
-        fliSpeed = float(airlineData[int(len(airlineData) / 2) + 1:][aircraftIndex])
+        fliSpeed = aircraft.speed
         fliDist = random.randint(1200, 3500)
-        aircraftName = aircraftData[aircraftIndex]
-        airlineName = airlineData[0]
-        airlineCode = airlineData[1]
-
-        # Convert Departure Time from string to timedelta
-        time = dt.datetime.strptime(self.flightDataEntries[5].get(), "%H:%M:%S")
-        departureTime = dt.timedelta(hours=time.hour, minutes=time.minute, seconds=time.second)
-
-        # Get approximate Arrival Time
-        appxHours = (fliDist / int(fliSpeed))
-        appxMins = (appxHours - int(appxHours))*60
-        appxSeconds = (appxMins - int(appxMins))*60
-        appxFlightTime = dt.timedelta(hours=int(appxHours), minutes=int(appxMins), seconds=int(appxSeconds))
-        appxArriveTime = departureTime + appxFlightTime
-        if appxArriveTime.days == 1:
-            appxArriveTime = appxArriveTime - dt.timedelta(days=1)
-
-        # Create Timetabled arrival time based upon the 15min window that appxArrive is in : 13:32:00 -> 13:45:00
-        arriveHour = appxArriveTime.seconds/60/60
-        arriveMin = (arriveHour - int(arriveHour))*60
-        minWindow = (arriveMin//15)+1
-        arrivalTime = dt.timedelta(hours=int(arriveHour), minutes=minWindow * 15)
-        if arrivalTime.days == 1:
-            arrivalTime = arrivalTime - dt.timedelta(days=1)
+        aircraftName = aircraft.name
+        airlineName = airline.name
+        airlineCode = airline.code
+
+        # Convert Departure Time from string to seconds since midnight
+        departureTime = ParseTimeString(self.flightDataEntries[5].get())
+
+        # Get approximate Arrival Time, and the Timetabled arrival time based upon the 15min window it is in
+        appxArriveTime, arrivalTime = FlightGenerator.TimetableTimes(departureTime, fliDist, fliSpeed)
 
         # if program time has already passed the departure time, flight scheduled to depart next day
-        if departureTime <= self.host.programTime:
+        if departureTime <= self.simulation.programTime:
             hasDeparted = False
             isDeparting = False
         else:
@@ -1277,16 +1140,82 @@ class AddFlightAirportScreen:
         # Construct new Flight object
         flightDetails = [fliNum, fliCode, fliOrigin, fliDestination, fliSpeed, fliDist]
         airlineDetails = [aircraftName, airlineName, airlineCode]
-        timeDetails = [departureTime, arrivalTime, appxArriveTime, "00:00:00", hasDeparted, isDeparting]
-        newFlight = Flight(flightDetails, airlineDetails, timeDetails, self.host.dataSearchTerms)
-        self.host.allFlights.append(newFlight)  # Add to self.host.allFlights list
-
-        # add to relevant airport's inbound/outbound lists
-        for airport in self.host.airports:
-            if airport.name == self.flightDataEntries[1].get():
-                airport.outboundFlights.append(newFlight)
-            elif airport.name == self.flightDataEntries[2].get():
-                airport.inboundFlights.append(newFlight)
+        timeDetails = [departureTime, arrivalTime, appxArriveTime, 0, hasDeparted, isDeparting]
+        newFlight = Flight(flightDetails, airlineDetails, timeDetails, self.simulation.flightColumns,
+                           self.simulation.flightTable)
+        # Add to the simulation's allFlights list and relevant airport's inbound/outbound lists
+        self.simulation.AddFlight(newFlight)
+        self.FlightValueSuitableCheck()  # The flight number is now in use
+
+
+class StatisticsScreen:
+    """
+    This Class provides the user with the Statistics screen, which displays the timings and counters of the simulation
+    and of each screen (see `Instrumentation`), so that slow updates can be traced to simulating flights, drawing the
+    data grids, or reading and writing files. From this screen the statistics can be reset, and a profile of every call
+    and memory allocation captured (printed once stopped).
+
+    Main is passed as a parameter so that the class can access the variables stored within it, without having to utilise
+    inheritance and creation of a new Main instance.
+    """
+    def __init__(self, host):
+        self.host = host
+        self.instrumentation = host.instrumentation
+        self.body = tk.Frame(self.host.root)
+        self.framesList = [tk.Frame(self.body, relief='raised', borderwidth=5) for _ in range(2)]
+
+        self.profileButtonText = tk.StringVar()
+        self.profileButtonText.set('Start Profiling')
+        self.statisticsDisplay = tk.Text(self.framesList[1], width=80, height=30, bg='light gray', font='TkFixedFont',
+                                         state='disabled')
+
+    def Construct(self):
+        """
+        This function is utilised to grid any widgets defined within __init__, alongside constructing and mapping
+        Widgets which do not require a variable for storage.
+        :return:
+        """
+        self.framesList[0].grid(row=0, column=0, sticky='nsew')
+        self.framesList[1].grid(row=1, column=0, sticky='nsew')
+
+        tk.Label(self.framesList[0], text='Program Statistics').grid(row=0, column=0)
+        tk.Button(self.framesList[0], text='Reset Statistics',
+                  command=lambda: self.ResetStatistics()).grid(row=0, column=1)
+        tk.Button(self.framesList[0], textvariable=self.profileButtonText,
+                  command=lambda: self.ToggleProfile()).grid(row=0, column=2)
+        self.statisticsDisplay.grid(row=0, column=0)
+
+        self.host.clock.Register('Statistics', self.UpdateStatistics, interval=1, budget=0.05, skippable=True)
+
+    def UpdateStatistics(self):
+        """
+        Updates the statistics display each second (run by the clock), when the screen is visible.
+        :return:
+        """
+        if self.body.winfo_ismapped():
+            self.statisticsDisplay.config(state='normal')
+            self.statisticsDisplay.replace('1.0', 'end', self.instrumentation.Report())
+            self.statisticsDisplay.config(state='disabled')
+
+    def ResetStatistics(self):
+        """
+        Discards the timings and counters measured so far, such that the statistics cover only what happens next.
+        :return:
+        """
+        self.instrumentation.Reset()
+        self.UpdateStatistics()
+
+    def ToggleProfile(self):
+        """
+        Starts capturing a profile, or stops the profile being captured and prints its report.
+        :return:
+        """
+        if self.instrumentation.profile is None:
+            self.instrumentation.StartProfile()
+            self.profileButtonText.set('Stop Profiling')
+        else:
+            print(self.instrumentation.StopProfile())
+            self.profileButtonText.set('Start Profiling')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+"""
+The benchmark suite of the Flight Arrival Enquiry program. It times loading the program files, constructing flights,
+building the search indexes and searching, an hour of ticks, refreshing the data grids and saving (see
+`BenchmarkSuite`), upon synthetic datasets of 100, 10,000, 100,000 and 1,000,000 flights across 200 airports and 120
+airlines. The datasets are made by a seeded FlightGenerator, so every machine benchmarks the same flights, and are kept
+within `--data-dir` to be reused by later runs:
+
+    python FlightBenchmarkSuite.py --sizes 100 10000 100000 --repeat 3 --output current.json
+
+The results, in seconds, are written as JSON. With `--compare`, each benchmark is compared against a baseline results
+file, and any benchmark more than `--threshold` (20% by default) slower than the baseline is reported as a regression,
+exiting with status 1:
+
+    python FlightBenchmarkSuite.py --output current.json --compare baseline.json
+"""
+import argparse                     # For the command line runner
+import json                         # For the benchmark results and baseline files
+import operator                     # For sorting flights by arrival time, as the data grids do
+import os                           # For the benchmark dataset files
+import platform                     # For recording the machine the benchmarks were run upon
+import shutil                       # For copying datasets, so saving does not overwrite them
+import sys                          # For the exit status of comparisons, and the Python version
+import tempfile                     # For the copies of datasets which are saved to
+import time                         # For timing each benchmark
+from FlightSimulationEngine import (DEFAULT_FLIGHTS_FILE_HEADER, FLIGHT_NUMBER_LIMIT, Flight, FlightGenerator,
+                                    FlightTable, Simulation, np)  # Headless simulation core
+
+BENCHMARK_SIZES = (100, 10000, 100000, 1000000)  # Numbers of ongoing flights benchmarked by default
+BENCHMARK_AIRPORTS = 200            # Airports of the generated datasets
+BENCHMARK_AIRLINES = 120            # Airlines of the generated datasets, enough flight numbers for 1,000,000 flights
+BENCHMARK_SEED = 0                  # Random seed the datasets are generated with
+BENCHMARK_THRESHOLD = 0.2           # Fraction slower than the baseline at which a benchmark is a regression
+BENCHMARK_NOISE = 0.005             # Seconds slower than the baseline which are never a regression, being timer noise
+RESULTS_VERSION = 1                 # Version of the results file format
+# Display labels and rows of the data grids refreshed by the render benchmark, as on the Airport Flights screen
+GRID_LABELS = ['Flight Code', 'Origin', 'Arrival Time', 'Departure Time', 'Delay Time', 'Rem. Distance']
+GRID_ROWS = 5
+
+
+class BenchmarkDataset:
+    """
+    BenchmarkDataset is a synthetic pair of program files - an `ongoingFlights.txt` of `numFlights` flights and an
+    `AirportsAirlines.txt` of BENCHMARK_AIRPORTS airports and BENCHMARK_AIRLINES airlines - within `directory`. The
+    flights are constructed by a FlightGenerator with the given seed, so the same dataset is generated upon every
+    machine, and a dataset is only generated once, being reused by later runs.
+    """
+    def __init__(self, directory, numFlights, seed=BENCHMARK_SEED):
+        self.numFlights = numFlights
+        self.seed = seed
+        self.airportsAirlinesFileName = os.path.join(directory, 'AirportsAirlines.txt')
+        self.allFlightsFileName = os.path.join(directory, f'ongoingFlights{numFlights}-{seed}.txt')
+        self.emptyFlightsFileName = os.path.join(directory, 'emptyFlights.txt')
+        os.makedirs(directory, exist_ok=True)
+
+    def Generate(self):
+        """
+        Writes the airports and airlines file and the flights file, unless they have been generated already. Returns
+        the seconds taken to generate them.
+        :return:
+        """
+        startTime = time.perf_counter()
+        if not os.path.exists(self.airportsAirlinesFileName):
+            with open(self.airportsAirlinesFileName, 'w') as file:
+                file.write('#' + ', '.join(f'Airport {i:03d}' for i in range(BENCHMARK_AIRPORTS)) + '\n')
+                for i in range(BENCHMARK_AIRLINES):
+                    code = chr(ord('A') + i // 26) + chr(ord('A') + i % 26)
+                    file.write(f'Airline {i:03d}, {code}, Aircraft {code}1, Aircraft {code}2, 850, 905\n')
+        if not os.path.exists(self.emptyFlightsFileName):
+            with open(self.emptyFlightsFileName, 'w') as file:
+                file.write(DEFAULT_FLIGHTS_FILE_HEADER)
+                file.write('#07:30:00')
+        if not os.path.exists(self.allFlightsFileName):
+            simulation = Simulation(self.emptyFlightsFileName, self.airportsAirlinesFileName)
+            FlightGenerator(simulation, self.seed).Generate(self.numFlights)
+            simulation.SaveFlights(self.allFlightsFileName + '.tmp')
+            os.replace(self.allFlightsFileName + '.tmp', self.allFlightsFileName)
+        return time.perf_counter() - startTime
+
+
+class BenchmarkSuite:
+    """
+    BenchmarkSuite times the operations of the program upon a BenchmarkDataset of each size, each in seconds:
+
+    - 'load': reading the program files into a Simulation, as the program does upon starting.
+    - 'construct': constructing a Flight for every flight loaded, as the file reader and Create Flight screen do.
+    - 'searchIndex': the first search, which builds the search indexes.
+    - 'search': the mean of the representative searches within `SEARCHES`, as made from the Search Flights screen.
+    - 'tickHour': a simulated hour of ticks of 1 second.
+    - 'render': a refresh of the Airport Flights screen's grids for the busiest airport, and of the search results
+      grid. The data grids are refreshed without constructing any widgets: the flights are sorted by arrival time and
+      the displayed values of the rows within view are obtained, as `DataGrid.InsertValues` does.
+    - 'save': saving both program files, as `EndProgram` does when closing the program.
+
+    Each benchmark is run `repeat` times, with the fastest time kept. The results may be written to a JSON file, and
+    compared against the results of an earlier run (see `Compare`).
+    """
+    # Search criteria of the 'search' benchmark, as entered upon the Search Flights screen
+    SEARCHES = [[('Airline Code', ['AA'])],
+                [('Origin', ['Airport 003']), ('Departure Time', ['8:00:00', '12:00:00'])],
+                [('Rem. Distance', ['1000', '1200'])],
+                [('Flight Code', ['AB0001'])],
+                [('Destination', ['Airport 010']), ('Arrival Time', ['18:00:00', '23:59:59'])]]
+
+    def __init__(self, directory, sizes=BENCHMARK_SIZES, seed=BENCHMARK_SEED, repeat=1):
+        self.directory = directory
+        self.sizes = sizes
+        self.seed = seed
+        self.repeat = max(1, repeat)
+        self.results = {}  # Size to benchmark name to seconds
+
+    def Run(self):
+        """
+        Runs the benchmarks for each size in turn, printing the time of each, and returns the results.
+        :return:
+        """
+        if max(self.sizes) > BENCHMARK_AIRLINES * FLIGHT_NUMBER_LIMIT:
+            raise ValueError(f"At most {BENCHMARK_AIRLINES * FLIGHT_NUMBER_LIMIT} flights may be benchmarked")
+        for size in self.sizes:
+            dataset = BenchmarkDataset(self.directory, size, self.seed)
+            print(f"{size} flights: dataset ready in {dataset.Generate():.2f}s")
+            timings = {}
+            for _ in range(self.repeat):
+                for name, seconds in self.RunDataset(dataset).items():
+                    timings[name] = min(seconds, timings.get(name, seconds))
+            for name, seconds in timings.items():
+                print(f"    {name:<12}{seconds * 1000:>12.2f} ms")
+            self.results[str(size)] = timings
+        return self.results
+
+    def RunDataset(self, dataset):
+        """
+        Runs each benchmark once upon a copy of the dataset (so that saving does not change the dataset), returning a
+        dictionary of benchmark name to seconds.
+        :param dataset:
+        :return:
+        """
+        timings = {}
+        with tempfile.TemporaryDirectory() as directory:
+            flightsFileName = os.path.join(directory, 'ongoingFlights.txt')
+            airportsAirlinesFileName = os.path.join(directory, 'AirportsAirlines.txt')
+            shutil.copy(dataset.allFlightsFileName, flightsFileName)
+            shutil.copy(dataset.airportsAirlinesFileName, airportsAirlinesFileName)
+
+            startTime = time.perf_counter()
+            simulation = Simulation(flightsFileName, airportsAirlinesFileName)
+            timings['load'] = time.perf_counter() - startTime
+
+            # Constructor arguments of every flight are gathered before timing, as the file reader parses them
+            details = [([flight.fliNum, flight.fliCode, flight.fliOrigin, flight.fliDestination, flight.fliSpeed,
+                         flight.fliDist], [flight.aircraft, flight.alName, flight.alCode],
+                        [flight.ttblDepartTime, flight.ttblArriveTime, flight.appxArriveTime, flight.delayTime,
+                         flight.hasDeparted, flight.isDeparting]) for flight in simulation.allFlights]
+            flightTable = FlightTable(len(details))
+            startTime = time.perf_counter()
+            for flightDetails, airlineDetails, timeDetails in details:
+                Flight(flightDetails, airlineDetails, timeDetails, simulation.flightColumns, flightTable)
+            timings['construct'] = time.perf_counter() - startTime
+            del details, flightTable
+
+            startTime = time.perf_counter()
+            simulation.searchIndex.Search(self.SEARCHES[0])
+            timings['searchIndex'] = time.perf_counter() - startTime
+            startTime = time.perf_counter()
+            for criteria in self.SEARCHES:
+                searchedFlights = simulation.searchIndex.Search(criteria)
+            timings['search'] = (time.perf_counter() - startTime) / len(self.SEARCHES)
+
+            airport = max(simulation.airports, key=lambda a: len(a.inboundFlights) + len(a.outboundFlights))
+            startTime = time.perf_counter()
+            for flights in (airport.inboundFlights, airport.outboundFlights, airport.landedFlights, searchedFlights):
+                self.RefreshGrid(flights)
+            timings['render'] = time.perf_counter() - startTime
+
+            startTime = time.perf_counter()
+            simulation.Run(1, step=1)
+            timings['tickHour'] = time.perf_counter() - startTime
+
+            startTime = time.perf_counter()
+            simulation.SaveFiles()
+            timings['save'] = time.perf_counter() - startTime
+        return timings
+
+    @staticmethod
+    def RefreshGrid(flights):
+        """
+        Performs the work of refreshing a data grid showing `flights` without its widgets: sorting the flights by
+        arrival time, and obtaining the displayed values of the rows within view. Returns the values.
+        :param flights:
+        :return:
+        """
+        flightData = sorted(flights, key=operator.attrgetter('ttblArriveTime'))
+        return [flight.GetRow(GRID_LABELS) for flight in flightData[:GRID_ROWS]]
+
+    def Write(self, fileName):
+        """
+        Writes the results, alongside the details of the machine and the datasets, to a JSON file.
+        :param fileName:
+        :return:
+        """
+        document = {'version': RESULTS_VERSION,
+                    'python': platform.python_version(),
+                    'numpy': np.__version__ if np is not None else None,
+                    'platform': platform.platform(),
+                    'processor': platform.processor(),
+                    'cpus': os.cpu_count(),
+                    'seed': self.seed,
+                    'repeat': self.repeat,
+                    'results': self.results}
+        with open(fileName, 'w') as file:
+            json.dump(document, file, indent=2)
+
+    def Compare(self, fileName, threshold=BENCHMARK_THRESHOLD):
+        """
+        Compares the results against those of a baseline results file, printing the change of each benchmark run by
+        both. A benchmark has regressed when it is more than `threshold` (a fraction) slower than the baseline, and
+        more than BENCHMARK_NOISE seconds slower. Returns the (size, benchmark name) of each regression.
+        :param fileName:
+        :param threshold:
+        :return:
+        """
+        with open(fileName, 'r') as file:
+            baseline = json.load(file)
+        if baseline.get('version') != RESULTS_VERSION:
+            raise ValueError(f"{fileName} is not a version {RESULTS_VERSION} benchmark results file")
+        if baseline.get('seed') != self.seed:
+            print(f"Warning: the baseline was run with seed {baseline.get('seed')}, not {self.seed}.")
+        regressions = []
+        print(f"{'Flights':>10}  {'Benchmark':<12}{'Baseline ms':>14}{'Current ms':>14}{'Change':>10}")
+        for size, timings in self.results.items():
+            for name, seconds in timings.items():
+                baseSeconds = baseline['results'].get(size, {}).get(name)
+                if baseSeconds is None:
+                    continue
+                change = (seconds - baseSeconds) / baseSeconds if baseSeconds > 0 else 0.0
+                regressed = change > threshold and seconds - baseSeconds > BENCHMARK_NOISE
+                if regressed:
+                    regressions.append((size, name))
+                print(f"{size:>10}  {name:<12}{baseSeconds * 1000:>14.2f}{seconds * 1000:>14.2f}{change:>+10.1%}"
+                      f"{'  REGRESSION' if regressed else ''}")
+        return regressions
+
+
+def RunBenchmarks(argv=None):
+    """
+    Command line entry point. Runs the BenchmarkSuite for each requested size, writing the results to a JSON file, and
+    compares them against a baseline results file if given. Exits with status 1 should any benchmark have regressed.
+    :param argv:
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Benchmark loading, ticking, searching, rendering and saving flights.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES),
+                        help=f'numbers of flights to benchmark (default {" ".join(map(str, BENCHMARK_SIZES))})')
+    parser.add_argument('--data-dir', default='benchmarkData',
+                        help='directory the generated datasets are kept in (default benchmarkData)')
+    parser.add_argument('--seed', type=int, default=BENCHMARK_SEED,
+                        help=f'random seed the datasets are generated with (default {BENCHMARK_SEED})')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs of each benchmark, keeping the fastest (default 1)')
+    parser.add_argument('--output', default='benchmarkResults.json',
+                        help='JSON file the results are written to (default benchmarkResults.json)')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='JSON results file to compare the results against, flagging regressions')
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_THRESHOLD,
+                        help=f'fraction slower than the baseline which is a regression (default {BENCHMARK_THRESHOLD})')
+    args = parser.parse_args(argv)
+    if min(args.sizes) < 1:
+        parser.error('--sizes must be at least 1')
+    if args.compare is not None and not os.path.exists(args.compare):
+        parser.error(f'baseline {args.compare} does not exist')
+
+    suite = BenchmarkSuite(args.data_dir, args.sizes, args.seed, args.repeat)
+    try:
+        suite.Run()
+    except ValueError as error:
+        parser.error(str(error))
+    suite.Write(args.output)
+    print(f"Results written to {args.output}.")
+    if args.compare is not None:
+        regressions = suite.Compare(args.compare, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmarks regressed against {args.compare}.")
+            sys.exit(1)
+        print(f"No benchmarks regressed against {args.compare}.")
+
+
+if __name__ == "__main__":
+    RunBenchmarks()
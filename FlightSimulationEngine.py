@@ -0,0 +1,3745 @@
+"""
+The headless simulation core of the Flight Arrival Enquiry program. This module holds the Airport and Flight classes,
+the FlightTable which stores the values of flights, and the Simulation engine which owns all flights, airports and the
+program time. It does not depend upon tkinter, so simulations can be run on machines without a display, and as fast as
+the CPU allows through the command line:
+
+    python FlightSimulationEngine.py --hours 6 --step 60 --output simulatedFlights.txt
+"""
+import argparse                     # For the command line runner
+import array                        # For the columns of flight snapshot files when NumPy is not installed
+import bisect                       # For range lookups within the SortedIndex, and Histogram buckets
+import contextlib                   # For the timers of Instrumentation
+import copy                         # For copying Flights to view a copied FlightTable
+import datetime as dt               # For displaying durations of a day or more
+import cProfile                     # For the optional profile captured by Instrumentation
+import heapq                        # For the EventScheduler priority queue
+import io                           # For formatting the profile captured by Instrumentation
+import itertools                    # For numbering the flights created whilst a flight journal is kept
+import json                         # For the header of flight snapshot files and the records of flight journals
+import mmap                         # For memory-mapping flight snapshot files
+import multiprocessing              # For the worker processes of sharded simulations
+import operator                     # For precompiled attribute getters of FlightColumns
+import os                           # For Determining if file path exists
+import pstats                       # For formatting the profile captured by Instrumentation
+import queue                        # For passing the progress and results of BackgroundTasks between threads
+import random                       # For the flights constructed by a FlightGenerator
+import sys                          # For the byte order of flight snapshot columns, and interning shared strings
+import tempfile                     # For the flights files of each shard of a sharded simulation
+import threading                    # For writing autosaves and running BackgroundTasks on worker threads
+import time                         # For pacing command line runs to a fixed tick rate
+import tracemalloc                  # For the optional memory capture of Instrumentation
+import zlib                         # For assigning unlisted keys to the shards of a sharded simulation
+try:
+    import numpy as np              # For the typed columns of the FlightTable and snapshot files (optional)
+except ImportError:
+    np = None
+
+DAY_SECONDS = 24 * 60 * 60          # Length of the programTime 24hr loop, in seconds
+DEFAULT_MAX_FLIGHTS = 1000000       # Default limit upon the number of ongoing flights within a Simulation
+SNAPSHOT_MAGIC = b'FLTSNAP\x00'     # First bytes of a flight snapshot file, see FlightSnapshot
+JOURNAL_FLUSH_INTERVAL = 1.0        # Real seconds between writes of the flight journal, see FlightJournal
+DEFAULT_CHECKPOINT_RECORDS = 100000  # Journal records after which a Simulation writes a compacted checkpoint
+DEFAULT_AUTOSAVE_INTERVAL = 300     # Real seconds between autosaves to journal checkpoints, see Autosave
+DEFAULT_GENERATOR_SEED = 0          # Random seed of a FlightGenerator, unless another is given
+FLIGHT_NUMBER_LIMIT = 10000         # Flight numbers of each airline are 0000 to 9999, see FlightNumberAllocator
+RANDOM_BATCH_LIMIT = 10000          # Flights constructed per use of the GUI's Random Batch Creator
+DEFAULT_CLOCK_STEP = 0.1            # Real seconds per fixed step of a SimulationClock
+MAX_SKIPPED_FRAMES = 10             # Frames in a row a SimulationClock may skip a subsystem for whilst behind
+MAX_CATCH_UP_STEPS = 50             # Steps a SimulationClock may perform within a single frame, see Advance
+DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)  # Seconds, see Histogram
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 50, 100, 500, 1000)  # Upper bounds of Histograms of counts per event
+DEFAULT_STATS_LOG_INTERVAL = 60     # Real seconds between the statistics logged by the GUI, see Instrumentation
+PROFILE_REPORT_LIMIT = 20           # Functions and allocation sites listed by an Instrumentation profile report
+FILE_PROGRESS_INTERVAL = 10000     # Flights read or written between reports of progress, see BackgroundTask
+TASK_POLL_INTERVAL = 0.05           # Real seconds between polls of a BackgroundTask's results by the GUI
+DEFAULT_FLIGHTS_FILE_HEADER = ("#Flight Number, Flight Code, Origin, Destination, Current Speed, Rem. Distance, "
+                               "Aircraft, Airline, Airline Code, Departure Time, Arrival Time, APPX Arrival Time, "
+                               "Delay Time, Has Departed, is Departing\n")  # Data search terms of a new flights file
+
+
+class FlightSet:
+    """
+    FlightSet is an insertion-ordered collection of Flights backed by a dictionary, so adding, removing and checking
+    membership of a Flight are O(1) operations. Iterating a FlightSet returns the Flights in the order they were added.
+    `version` counts the changes made to the FlightSet, so views of it (such as the GUI's data grids) can tell whether
+    it has changed since they were last updated.
+    """
+    def __init__(self, flights=()):
+        self.flights = dict.fromkeys(flights)
+        self.version = 0
+
+    def __iter__(self):
+        return iter(self.flights)
+
+    def __len__(self):
+        return len(self.flights)
+
+    def __contains__(self, flight):
+        return flight in self.flights
+
+    def Add(self, flight):
+        if flight not in self.flights:
+            self.flights[flight] = None
+            self.version += 1
+
+    def Remove(self, flight):
+        """
+        Removes `flight` from the FlightSet, if present.
+        :param flight:
+        :return:
+        """
+        if self.flights.pop(flight, self) is not self:
+            self.version += 1
+
+
+class Airport:
+    """
+    Airport class is used to provide an origin or destination for flights, alongside housing inbound, outbound and
+    landed flights within FlightSets.
+
+    When constructed, the Airport will proceed to gather and store references to Flight objects from the allFlights
+    parameter, with each Flight also referencing the Airport as its originAirport or destinationAirport. Newly
+    constructed flights are directly assigned to the Airport.
+
+    Airports are slotted, without a per-instance `__dict__`, and the name is interned, such that it is the same string
+    object as the origin or destination of each of its Flights (see `Flight.SetDetails`).
+    """
+    __slots__ = ('name', 'inboundFlights', 'outboundFlights', 'landedFlights')
+
+    def __init__(self, name, allFlights=()):
+        self.name = sys.intern(name)
+        self.inboundFlights = FlightSet()
+        self.outboundFlights = FlightSet()
+        self.landedFlights = FlightSet()
+        self.GetAirportFlightData(allFlights)
+
+    def GetAirportFlightData(self, flightsList):
+        """
+        obtain inbound and outgoing flights for this airport name from `flightsList`,
+        which is the `ongoingFlights.txt` file
+        :param flightsList:
+        :return:
+        """
+        for flight in flightsList:
+            self.AddFlight(flight)
+
+    def AddFlight(self, flight):
+        """
+        Adds a flight to the inbound or outbound flights of this airport, if the flight's Origin or Destination is this
+        airport.
+        :param flight:
+        :return:
+        """
+        # Determine if flight belongs to inbound or outbound list:
+        if flight.fliOrigin == self.name:
+            self.outboundFlights.Add(flight)
+            flight.originAirport = self
+        elif flight.fliDestination == self.name:
+            self.inboundFlights.Add(flight)
+            flight.destinationAirport = self
+
+
+def Intern(value):
+    """
+    Returns the interned copy of a string value (see `sys.intern`), such that equal strings share a single object.
+    Values which are not strings are returned unchanged.
+    :param value:
+    :return:
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def TableColumnProperty(column, toValue, fromValue=None):
+    """
+    Constructs a property which reads and writes a Flight's value from its row within the given column of the Flight's
+    FlightTable. `toValue` converts the stored value to the type the rest of the program expects, and `fromValue`
+    converts it back when the value is set.
+    :param column:
+    :param toValue:
+    :param fromValue:
+    :return:
+    """
+    def Get(flight):
+        return toValue(getattr(flight.table, column)[flight.row])
+
+    def Set(flight, value):
+        getattr(flight.table, column)[flight.row] = fromValue(value) if fromValue else value
+    return property(Get, Set)
+
+
+def ParseTimeString(timeString):
+    """
+    Converts a "H:M:S" time of day string into a number of seconds since midnight, raising ValueError for unsuitable
+    strings. Each part may be 1 or 2 digits, as accepted by `strptime(timeString, "%H:%M:%S")`.
+    :param timeString:
+    :return:
+    """
+    parts = timeString.split(':')
+    if len(parts) != 3 or not all(0 < len(part) <= 2 and part.isdigit() for part in parts):
+        raise ValueError(f"time data {timeString!r} does not match format 'H:M:S'")
+    hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
+    if hours > 23 or minutes > 59 or seconds > 59:
+        raise ValueError(f"time data {timeString!r} is not a time of day")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def LandingTime(speed, distance, anchorTime):
+    """
+    Returns the simulation time at which a flight which departed at `anchorTime`, with `distance` remaining and
+    travelling at `speed`, reaches its destination.
+    :param speed:
+    :param distance:
+    :param anchorTime:
+    :return:
+    """
+    return anchorTime + (distance / speed) * 60 * 60
+
+
+def RemainingDistance(time, speed, distance, anchorTime):
+    """
+    Returns the remaining distance at the simulation time `time` of a flight which departed at `anchorTime`, with
+    `distance` remaining and travelling at `speed` (converted to km/s). Before `anchorTime`, the whole distance remains.
+    :param time:
+    :param speed:
+    :param distance:
+    :param anchorTime:
+    :return:
+    """
+    distanceCovered = (speed / 60 / 60) * max(0, time - anchorTime)
+    return max(0.0, float(distance - distanceCovered))
+
+
+def DelayTime(landingTime, windowStart, departTime, trueArrive):
+    """
+    Returns the delay of a flight landing at the simulation time `landingTime`, having departed within the flight
+    window which began at `windowStart`, with `departTime` and `trueArrive` being its timetabled times in seconds since
+    midnight.
+    :param landingTime:
+    :param windowStart:
+    :param departTime:
+    :param trueArrive:
+    :return:
+    """
+    # Timetabled arrival in simulation time, relative to when the flight window began
+    return max(0, int(landingTime - (windowStart + trueArrive - departTime)))
+
+
+def FlightStateAt(time, speed, distance, anchorTime, windowStart, departTime, trueArrive):
+    """
+    Computes the state of a departed flight at the simulation time `time` directly from its departure: its remaining
+    distance, approximate arrival time (of day), delay, and whether it has landed. As the state depends only upon
+    `time`, it is the same however many ticks (of whatever size) the simulation took to reach it, and may be computed
+    for any time, past or future. See `FlightTable.StatesAt` for the states of many flights at once.
+    :param time:
+    :param speed:
+    :param distance:
+    :param anchorTime:
+    :param windowStart:
+    :param departTime:
+    :param trueArrive:
+    :return:
+    """
+    landingTime = LandingTime(speed, distance, anchorTime)
+    return (RemainingDistance(time, speed, distance, anchorTime), int(landingTime) % DAY_SECONDS,
+            DelayTime(landingTime, windowStart, departTime, trueArrive), landingTime <= time)
+
+
+def FormatTime(seconds):
+    """
+    Converts a number of seconds into a "H:MM:SS" string for display, matching the string of a timedelta.
+    :param seconds:
+    :return:
+    """
+    seconds = int(seconds)
+    if 0 <= seconds < DAY_SECONDS:
+        return f"{seconds // 3600}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+    return str(dt.timedelta(seconds=seconds))  # Durations of a day or more are displayed with their days
+
+
+class FlightTable:
+    """
+    FlightTable stores the values of many Flights as a struct-of-arrays, with one array per field (speed, distance,
+    timetable times in seconds, and the departed/departing/landed flags). Each Flight is a thin view over a single row
+    of a FlightTable. NumPy arrays are used when NumPy is installed, otherwise plain lists are used.
+
+    For departed flights, `distance` is the remaining distance at the simulation time `anchorTime` (the time of
+    departure), so the current distance and arrival time can be computed on demand from the table's `time` rather than
+    being updated every tick. `windowStart` is the simulation time at which the flight window of the departure began.
+    """
+    columnTypes = {'speed': float, 'distance': float, 'anchorTime': int, 'windowStart': int,
+                   'departTime': int, 'arriveTime': int, 'trueArrive': int, 'appxArriveTime': int, 'delayTime': int,
+                   'hasDeparted': bool, 'isDeparting': bool, 'hasLanded': bool}
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = max(1, capacity)
+        self.time = 0  # Current simulation time in seconds, used to compute on-demand values
+        self.flights = []  # Flight object viewing each row, in row order
+        for column, dataType in self.columnTypes.items():
+            setattr(self, column, self.NewColumn(dataType, self.capacity))
+
+    def __len__(self):
+        return self.count
+
+    @staticmethod
+    def NewColumn(dataType, size):
+        """
+        Constructs an empty column of the given data type, as a NumPy array if NumPy is available or a list otherwise.
+        :param dataType:
+        :param size:
+        :return:
+        """
+        if np is not None:
+            npType = {float: np.float64, int: np.int64, bool: np.bool_}[dataType]
+            return np.zeros(size, dtype=npType)
+        return [dataType()] * size
+
+    def Grow(self):
+        """
+        Doubles the capacity of every column, retaining the values already stored.
+        :return:
+        """
+        for column, dataType in self.columnTypes.items():
+            newColumn = self.NewColumn(dataType, self.capacity * 2)
+            newColumn[:self.count] = getattr(self, column)[:self.count]
+            setattr(self, column, newColumn)
+        self.capacity *= 2
+
+    def Append(self, flight, values):
+        """
+        Adds a new row to the end of the table for `flight`, with `values` being a dictionary of column name to value.
+        Returns the index of the new row.
+        :param flight:
+        :param values:
+        :return:
+        """
+        if self.count == self.capacity:
+            self.Grow()
+        row = self.count
+        for column, value in values.items():
+            getattr(self, column)[row] = value
+        self.flights.append(flight)
+        self.count += 1
+        return row
+
+    def AppendColumns(self, count, values):
+        """
+        Adds `count` new rows to the end of the table in one operation per column, with `values` being a dictionary of
+        column name to the sequence of values of the new rows. The Flights viewing the new rows must then be placed in
+        `flights` (see `Flight.ViewTableRow`). Returns the index of the first new row.
+        :param count:
+        :param values:
+        :return:
+        """
+        while self.count + count > self.capacity:
+            self.Grow()
+        firstRow = self.count
+        for column, columnValues in values.items():
+            getattr(self, column)[firstRow:firstRow + count] = columnValues
+        self.flights.extend([None] * count)
+        self.count += count
+        return firstRow
+
+    def Copy(self):
+        """
+        Returns a new FlightTable holding a copy of the values of each row (but not the Flights viewing them), such that
+        the values may be read whilst this table continues to change. Each column is copied in a single operation.
+        :return:
+        """
+        table = FlightTable.__new__(FlightTable)
+        table.count = table.capacity = self.count
+        table.time = self.time
+        table.flights = []
+        for column in self.columnTypes:
+            setattr(table, column, getattr(self, column)[:self.count].copy())
+        return table
+
+    def StatesAt(self, time, rows=None):
+        """
+        Computes the state of the flights within the given rows (or every row) at the simulation time `time`, in one
+        operation per column (see `FlightStateAt`). Returns a dictionary of 'distance', 'appxArriveTime', 'delayTime'
+        and 'hasLanded' to the value of each row, with the stored values used for flights which have not departed.
+        :param time:
+        :param rows:
+        :return:
+        """
+        if rows is None:
+            rows = range(self.count)
+        if np is None:
+            states = []
+            for row in rows:
+                if self.hasDeparted[row]:
+                    states.append(FlightStateAt(time, self.speed[row], self.distance[row], self.anchorTime[row],
+                                                self.windowStart[row], self.departTime[row], self.trueArrive[row]))
+                else:
+                    states.append((float(self.distance[row]), self.appxArriveTime[row], self.delayTime[row], False))
+            return dict(zip(('distance', 'appxArriveTime', 'delayTime', 'hasLanded'),
+                            (list(values) for values in zip(*states)) if states else ([], [], [], [])))
+
+        rows = np.asarray(rows, dtype=np.int64)
+        departed = self.hasDeparted[rows]
+        speed, distance, anchorTime = self.speed[rows], self.distance[rows], self.anchorTime[rows]
+        landingTime = anchorTime + (distance / speed) * 60 * 60
+        remaining = np.maximum(0.0, distance - (speed / 60 / 60) * np.maximum(0, time - anchorTime))
+        delay = landingTime - (self.windowStart[rows] + self.trueArrive[rows] - self.departTime[rows])
+        return {'distance': np.where(departed, remaining, distance),
+                'appxArriveTime': np.where(departed, landingTime.astype(np.int64) % DAY_SECONDS,
+                                           self.appxArriveTime[rows]),
+                'delayTime': np.where(departed, np.maximum(0, delay.astype(np.int64)), self.delayTime[rows]),
+                'hasLanded': departed & (landingTime <= time)}
+
+    def LandRows(self, rows):
+        """
+        Lands the flights within the given rows, retaining their final approximate arrival and delay times, in one
+        operation per column.
+        :param rows:
+        :return:
+        """
+        states = self.StatesAt(0, rows)  # Arrival and delay times do not depend upon the time
+        for column in ('appxArriveTime', 'delayTime'):
+            values = getattr(self, column)
+            if np is not None:
+                values[np.asarray(rows, dtype=np.int64)] = states[column]
+            else:
+                for row, value in zip(rows, states[column]):
+                    values[row] = value
+        for column, value in (('distance', 0), ('hasLanded', True), ('hasDeparted', False)):
+            values = getattr(self, column)
+            if np is not None:
+                values[np.asarray(rows, dtype=np.int64)] = value
+            else:
+                for row in rows:
+                    values[row] = value
+
+    def MoveRows(self, rows, flightTable):
+        """
+        Moves the values of the given rows to the end of `flightTable` in one operation per column, alongside the
+        Flights viewing them, and then removes the rows (see RemoveRows).
+        :param rows:
+        :param flightTable:
+        :return:
+        """
+        if np is not None:
+            index = np.asarray(rows, dtype=np.int64)
+            values = {column: getattr(self, column)[index] for column in self.columnTypes}
+        else:
+            values = {column: [getattr(self, column)[row] for row in rows] for column in self.columnTypes}
+        firstRow = flightTable.AppendColumns(len(rows), values)
+        for newRow, row in enumerate(rows, firstRow):
+            flight = self.flights[row]
+            flight.table = flightTable
+            flight.row = newRow
+            flightTable.flights[newRow] = flight
+        self.RemoveRows(rows)
+
+    def RemoveRows(self, rows):
+        """
+        Removes many rows from the table at once, filling the removed rows below the new end of the table with the
+        remaining rows beyond it (as with Remove), such that only as many rows are moved as are removed.
+        :param rows:
+        :return:
+        """
+        removed = set(rows)
+        newCount = self.count - len(removed)
+        holes = sorted(row for row in removed if row < newCount)
+        fillers = [row for row in range(newCount, self.count) if row not in removed]
+        if holes:
+            for column in self.columnTypes:
+                values = getattr(self, column)
+                if np is not None:
+                    values[holes] = values[fillers]
+                else:
+                    for hole, filler in zip(holes, fillers):
+                        values[hole] = values[filler]
+            for hole, filler in zip(holes, fillers):
+                movedFlight = self.flights[filler]
+                self.flights[hole] = movedFlight
+                movedFlight.row = hole
+        del self.flights[newCount:]
+        self.count = newCount
+
+    def GetRowValues(self, row):
+        """
+        Returns a dictionary of column name to the (python typed) value stored within the given row.
+        :param row:
+        :return:
+        """
+        return {column: dataType(getattr(self, column)[row]) for column, dataType in self.columnTypes.items()}
+
+    def Remove(self, row):
+        """
+        Removes a row from the table by moving the final row into its place, which keeps the table densely packed so
+        that only occupied rows are ever stored. The view of the moved Flight is updated to its new row.
+        :param row:
+        :return:
+        """
+        lastRow = self.count - 1
+        if row != lastRow:
+            for column in self.columnTypes:
+                values = getattr(self, column)
+                values[row] = values[lastRow]
+            movedFlight = self.flights[lastRow]
+            self.flights[row] = movedFlight
+            movedFlight.row = row
+        self.flights.pop()
+        self.count -= 1
+
+
+class FlightColumns:
+    """
+    FlightColumns is a registry which maps each data search term (the names on the first line of the
+    `ongoingFlights.txt` file) to a precompiled getter for the Flight value the term refers to, and the data type of the
+    value. The registry is constructed once, when the search terms are read, and is shared by all Flights.
+
+    `GetRow` and `GetColumns` provide many values in one call, for displaying, searching and saving flights. Times are
+    stored and compared as seconds, and are only formatted as "H:MM:SS" strings by `GetRow`, for display and saving to
+    text.
+    """
+    # Getter, data type and search index kind of each Flight value, in the order of the data search terms. Only values
+    # which do not change whilst a flight is ongoing are indexed, see FlightSearchIndex.
+    fieldAccessors = [(operator.attrgetter('fliNum'), 'int', 'sorted'),
+                      (operator.attrgetter('fliCode'), 'str', 'hash'),
+                      (operator.attrgetter('fliOrigin'), 'str', 'hash'),
+                      (operator.attrgetter('fliDestination'), 'str', 'hash'),
+                      (operator.attrgetter('fliSpeed'), 'float', 'sorted'),
+                      (lambda flight: round(flight.fliDist, 1), 'float', None),
+                      (operator.attrgetter('aircraft'), 'str', 'hash'),
+                      (operator.attrgetter('alName'), 'str', 'hash'),
+                      (operator.attrgetter('alCode'), 'str', 'hash'),
+                      (operator.attrgetter('ttblDepartTime'), 'time', 'sorted'),
+                      (operator.attrgetter('ttblArriveTime'), 'time', 'sorted'),
+                      (operator.attrgetter('appxArriveTime'), 'time', None),
+                      (operator.attrgetter('delayTime'), 'time', None),
+                      (operator.attrgetter('hasDeparted'), 'bool', None),
+                      (operator.attrgetter('isDeparting'), 'bool', None)]
+    registries = {}  # FlightColumns constructed for each list of search terms, see ForTerms
+
+    def __init__(self, dataSearchTerms):
+        self.terms = list(dataSearchTerms)
+        self.getters = {}
+        self.displayGetters = {}  # Getters of the value of each term as displayed, with times formatted as strings
+        self.types = {}
+        self.indexKinds = {}
+        for term, (getter, dataType, indexKind) in zip(self.terms, self.fieldAccessors):
+            self.getters[term] = getter
+            self.displayGetters[term] = (lambda flight, getter=getter: FormatTime(getter(flight))) \
+                if dataType == 'time' else getter
+            self.types[term] = dataType
+            self.indexKinds[term] = indexKind
+        self.registries[tuple(self.terms)] = self
+
+    @classmethod
+    def ForTerms(cls, dataSearchTerms):
+        """
+        Returns the FlightColumns registry for the given search terms, constructing it if one does not yet exist.
+        :param dataSearchTerms:
+        :return:
+        """
+        registry = cls.registries.get(tuple(dataSearchTerms))
+        return registry if registry is not None else cls(dataSearchTerms)
+
+    def GetAccessor(self, term):
+        """
+        Returns a tuple of the getter function for a search term, and the data type of the value it gets.
+        :param term:
+        :return:
+        """
+        return self.getters[term], self.types[term]
+
+    def GetRow(self, flight, terms=None):
+        """
+        Returns a list of the values of `flight` for each of the given search terms (all terms if None), as displayed.
+        :param flight:
+        :param terms:
+        :return:
+        """
+        getters = self.displayGetters
+        return [getters[term](flight) for term in (terms or self.terms)]
+
+    def GetColumns(self, flights, terms=None):
+        """
+        Returns a dictionary of search term to the list of values of each flight in `flights`, for each of the given
+        search terms (all terms if None). Times are given in seconds.
+        :param flights:
+        :param terms:
+        :return:
+        """
+        flights = list(flights)
+        return {term: list(map(self.getters[term], flights)) for term in (terms or self.terms)}
+
+
+class Flight:
+    """
+    Flight Objects travel between two airports, set as their Origin and Destination. They may be constructed using data
+    stored within the `ongoingFlights.txt` file, or from user inputs.
+
+    When the time is within a Flight's "flight window" - the time between timetabled departure and arrival time - it
+    will depart, after which its remaining distance of travel between the Origin and Destination airports decreases
+    until reaching 0. The Simulation's EventScheduler determines when the Flight departs and lands, and the remaining
+    distance, approximate arrival time and delay of a departed Flight are computed on demand from its departure.
+
+    The speed, distance, time and status values of a Flight are stored within a row of a FlightTable, with the Flight
+    acting as a view over that row. When no FlightTable is given, the Flight constructs its own single-row table.
+
+    Flights with a remaining distance > 0 will be saved to the `ongoingFlights.txt` file upon program close (if the
+    user permits).
+
+    As there may be a million Flights, each is a slotted record without a per-instance `__dict__`, and the values
+    shared by many Flights (the flight number, origin, destination, aircraft and airline) are interned strings, such
+    that each distinct value is stored once rather than once per Flight.
+    """
+    __slots__ = ('flightColumns', 'fliNum', 'fliCode', 'fliOrigin', 'fliDestination', 'aircraft', 'alName', 'alCode',
+                 'originAirport', 'destinationAirport', 'table', 'row')
+    fliSpeed = TableColumnProperty('speed', float)
+    # timetabling details (in seconds since midnight)
+    ttblDepartTime = TableColumnProperty('departTime', int)
+    ttblArriveTime = TableColumnProperty('arriveTime', int)
+    trueArrive = TableColumnProperty('trueArrive', int)
+    hasDeparted = TableColumnProperty('hasDeparted', bool)
+    isDeparting = TableColumnProperty('isDeparting', bool)
+    hasLanded = TableColumnProperty('hasLanded', bool)
+
+    def __init__(self, flightDetails, airlineDetails, timeDetails, flightColumns, flightTable=None):
+        self.SetDetails(flightDetails, airlineDetails, flightColumns)
+        departTime = self.StripTime(timeDetails[0])
+        arriveTime = self.StripTime(timeDetails[1])
+        values = {'speed': float(flightDetails[4]), 'distance': float(flightDetails[5]),
+                  'departTime': departTime, 'arriveTime': arriveTime,
+                  # Since programTime operates in 24hr loop, arrival time can be < departure time, hence:
+                  'trueArrive': arriveTime + DAY_SECONDS if arriveTime < departTime else arriveTime,
+                  'appxArriveTime': self.StripTime(timeDetails[2]),
+                  'delayTime': self.StripTime(timeDetails[3]),
+                  # Ensure flight only "flies" when it should be:
+                  'hasDeparted': self.GetBool(timeDetails[4]),  # Departs when program time is >= to departure time
+                  'isDeparting': self.GetBool(timeDetails[5]),  # Is the program due to be departing in next timeframe
+                  'hasLanded': False}
+
+        # Store the values within a row of the FlightTable
+        self.table = flightTable if flightTable is not None else FlightTable(1)
+        self.row = self.table.Append(self, values)
+
+    @classmethod
+    def ViewTableRow(cls, flightDetails, airlineDetails, flightColumns, flightTable, row):
+        """
+        Constructs a Flight viewing a row of `flightTable` whose values have already been stored, such as by
+        `FlightTable.AppendColumns`. Only the number, code, origin and destination of the flightDetails are used.
+        :param flightDetails:
+        :param airlineDetails:
+        :param flightColumns:
+        :param flightTable:
+        :param row:
+        :return:
+        """
+        flight = cls.__new__(cls)
+        flight.SetDetails(flightDetails, airlineDetails, flightColumns)
+        flight.table = flightTable
+        flight.row = row
+        flightTable.flights[row] = flight
+        return flight
+
+    def SetDetails(self, flightDetails, airlineDetails, flightColumns):
+        """
+        Sets the flight and airline details of the Flight, which are not stored within its FlightTable.
+        :param flightDetails:
+        :param airlineDetails:
+        :param flightColumns:
+        :return:
+        """
+        # fli is for flight, al is for airline. shortened for simpler var names
+        # Registry of the data search terms, given as a FlightColumns or a list of search terms
+        if not isinstance(flightColumns, FlightColumns):
+            flightColumns = FlightColumns.ForTerms(flightColumns)
+        self.flightColumns = flightColumns
+        # flight details, with the values shared between Flights interned
+        self.fliNum = Intern(flightDetails[0])
+        self.fliCode = flightDetails[1]
+        self.fliOrigin = Intern(flightDetails[2])
+        self.fliDestination = Intern(flightDetails[3])
+        # airline/aircraft details
+        self.aircraft = Intern(airlineDetails[0])
+        self.alName = Intern(airlineDetails[1])
+        self.alCode = Intern(airlineDetails[2])
+        # Origin and Destination Airport objects, assigned by the Airports when present
+        self.originAirport = None
+        self.destinationAirport = None
+
+    def CopyView(self, flightTable, row):
+        """
+        Returns a copy of this Flight viewing `row` of `flightTable`, such as a copy of its FlightTable (see
+        `FlightTable.Copy`). The FlightTable's list of Flights is left unchanged.
+        :param flightTable:
+        :param row:
+        :return:
+        """
+        flight = copy.copy(self)
+        flight.table = flightTable
+        flight.row = row
+        return flight
+
+    def MoveToTable(self, flightTable):
+        """
+        Moves this Flight's values out of its current FlightTable and into a new row of `flightTable`.
+        :param flightTable:
+        :return:
+        """
+        values = self.table.GetRowValues(self.row)
+        self.table.Remove(self.row)
+        self.table = flightTable
+        self.row = flightTable.Append(self, values)
+
+    @property
+    def landingTime(self):
+        """
+        The simulation time (in seconds) at which a departed Flight reaches its destination.
+        :return:
+        """
+        table, row = self.table, self.row
+        return LandingTime(table.speed[row], table.distance[row], table.anchorTime[row])
+
+    @property
+    def fliDist(self):
+        """
+        Remaining distance of the Flight. For departed Flights this is computed from the distance and time at departure,
+        with the distance covered being the speed (converted to km/s) multiplied by the time since departure.
+        :return:
+        """
+        table, row = self.table, self.row
+        if not table.hasDeparted[row]:
+            return float(table.distance[row])
+        return RemainingDistance(table.time, table.speed[row], table.distance[row], table.anchorTime[row])
+
+    @property
+    def appxArriveTime(self):
+        if not self.hasDeparted:
+            return int(self.table.appxArriveTime[self.row])
+        return int(self.landingTime) % DAY_SECONDS  # remove days value to retain 24:00:00 format
+
+    @property
+    def delayTime(self):
+        if not self.hasDeparted:
+            return int(self.table.delayTime[self.row])
+        table, row = self.table, self.row
+        return DelayTime(self.landingTime, table.windowStart[row], table.departTime[row], table.trueArrive[row])
+
+    def StateAt(self, time):
+        """
+        Returns the remaining distance, approximate arrival time, delay and landed status of the Flight at the
+        simulation time `time` (see `FlightStateAt`), without changing the Flight.
+        :param time:
+        :return:
+        """
+        table, row = self.table, self.row
+        if not table.hasDeparted[row]:
+            return float(table.distance[row]), self.appxArriveTime, self.delayTime, self.hasLanded
+        return FlightStateAt(time, table.speed[row], table.distance[row], table.anchorTime[row], table.windowStart[row],
+                             table.departTime[row], table.trueArrive[row])
+
+    def InFlightWindow(self, timeOfDay):
+        """
+        Determines if the given time of day (in seconds) is within the "flightwindow" - the time between timetabled
+        departure and arrival of the flight.
+        :param timeOfDay:
+        :return:
+        """
+        table, row = self.table, self.row
+        departTime, arriveTime = table.departTime[row], table.arriveTime[row]
+        if timeOfDay <= departTime and timeOfDay <= arriveTime < departTime:
+            return True  # After midnight, within a flight window which began the previous day
+        return departTime <= timeOfDay <= table.trueArrive[row]
+
+    def LatestDepartureTime(self, time):
+        """
+        Returns the simulation time of the most recent timetabled departure at or before the simulation time `time`.
+        :param time:
+        :return:
+        """
+        departTime = self.table.departTime[self.row]
+        latest = time - time % DAY_SECONDS + departTime
+        return int(latest if latest <= time else latest - DAY_SECONDS)
+
+    def NextDepartureTime(self, time):
+        """
+        Returns the simulation time of the next timetabled departure after the simulation time `time`.
+        :param time:
+        :return:
+        """
+        return self.LatestDepartureTime(time) + DAY_SECONDS
+
+    def WindowEndTime(self, time):
+        """
+        Returns the simulation time at which the flight window containing the simulation time `time` ends.
+        :param time:
+        :return:
+        """
+        table, row = self.table, self.row
+        return self.LatestDepartureTime(time) + int(table.trueArrive[row] - table.departTime[row])
+
+    def Depart(self, time, windowStart):
+        """
+        Departs the Flight at simulation time `time`, anchoring its current remaining distance to that time.
+        :param time:
+        :param windowStart:
+        :return:
+        """
+        table, row = self.table, self.row
+        table.anchorTime[row] = time
+        table.windowStart[row] = windowStart
+        self.isDeparting = False  # Update departing status - plane will not depart again after arriving
+        self.hasDeparted = True  # Flight Distance will continue to decrease to 0 regardless of timeframe
+
+    def Land(self):
+        """
+        Lands the Flight at its destination, retaining its final approximate arrival and delay times.
+        :return:
+        """
+        table, row = self.table, self.row
+        table.appxArriveTime[row] = self.appxArriveTime
+        table.delayTime[row] = self.delayTime
+        table.distance[row] = 0
+        self.hasLanded = True
+        self.hasDeparted = False
+
+    @staticmethod
+    def StripTime(time):
+        """
+        Converts "H:M:S" string parameters into seconds since midnight. Used primarily for reading data from file.
+        :param time:
+        :return:
+        """
+        if type(time) is str:
+            return ParseTimeString(time)
+        else:  # time is in seconds already
+            return int(time)
+
+    @staticmethod
+    def GetBool(string):
+        """
+        Converts non-boolean parameters into boolean values. Used primarily for reading data from file.
+        :param string:
+        :return:
+        """
+        if type(string) is not bool:
+            if string == "True":
+                return True
+            elif string == "False":
+                return False
+        else:  # Already boolean
+            return string
+
+    def GetFlightValue(self, stringTerm):
+        """
+        Function utilises the FlightColumns registry to utilise a string input parameter as a key for obtaining a tuple
+        of the value stored within the Flight that the string refers to, and the data type of the value.
+        :param stringTerm:
+        :return:
+        """
+        getter, dataType = self.flightColumns.GetAccessor(stringTerm)
+        return getter(self), dataType
+
+    def GetRow(self, stringTerms=None):
+        """
+        Returns a list of the Flight's values for each of the given search terms, or for all search terms if None.
+        :param stringTerms:
+        :return:
+        """
+        return self.flightColumns.GetRow(self, stringTerms)
+
+
+class EventScheduler:
+    """
+    EventScheduler is a priority queue (heap) of the next departure, landing or ready event of each Flight, ordered by
+    the simulation time at which the event is due. Each tick of the Simulation pops only the events which are due,
+    so the cost of a tick scales with the number of events rather than the number of flights.
+
+    A Flight has at most one pending event. Scheduling a new event for a Flight replaces its pending event, with the
+    replaced event being skipped when it reaches the top of the heap.
+    """
+    DEPART = 'depart'  # Flight departs, and its landing is scheduled
+    LAND = 'land'  # Flight reaches its destination
+    READY = 'ready'  # Flight window of a flight which is not departing has ended, so it may depart in the next window
+
+    def __init__(self):
+        self.heap = []
+        self.pending = {}  # Flight to the sequence number of its pending event
+        self.sequence = 0  # Orders events due at the same time, and identifies replaced events
+
+    def __len__(self):
+        return len(self.pending)
+
+    def Schedule(self, time, kind, flight):
+        """
+        Schedules an event of the given kind for `flight` at simulation time `time`, replacing any pending event.
+        :param time:
+        :param kind:
+        :param flight:
+        :return:
+        """
+        self.sequence += 1
+        self.pending[flight] = self.sequence
+        heapq.heappush(self.heap, (time, self.sequence, kind, flight))
+
+    def Cancel(self, flight):
+        """
+        Cancels the pending event of `flight`, if it has one.
+        :param flight:
+        :return:
+        """
+        self.pending.pop(flight, None)
+
+    def PopDue(self, time):
+        """
+        Yields (eventTime, kind, flight) for every pending event due at or before simulation time `time`, in order.
+        Events scheduled whilst iterating are also yielded if they are due.
+        :param time:
+        :return:
+        """
+        while self.heap and self.heap[0][0] <= time:
+            eventTime, sequence, kind, flight = heapq.heappop(self.heap)
+            if self.pending.get(flight) == sequence:
+                del self.pending[flight]
+                yield eventTime, kind, flight
+
+
+class HashIndex:
+    """
+    HashIndex maps each value of a search term to the FlightSet of flights with that value, for O(1) equality lookups.
+    """
+    def __init__(self, keyFunction):
+        self.keyFunction = keyFunction
+        self.buckets = {}
+
+    def Add(self, flight):
+        key = self.keyFunction(flight)
+        if key not in self.buckets:
+            self.buckets[key] = FlightSet()
+        self.buckets[key].Add(flight)
+
+    def Remove(self, flight):
+        bucket = self.buckets.get(self.keyFunction(flight))
+        if bucket is not None:
+            bucket.Remove(flight)
+
+    def Count(self, value):
+        return len(self.buckets.get(value, ()))
+
+    def Lookup(self, value):
+        return self.buckets.get(value, FlightSet())
+
+
+class SortedIndex:
+    """
+    SortedIndex holds the flights sorted by the value of a search term, with bisect used to find the flights within a
+    range of values (or equal to a single value).
+
+    Added flights are held as pending until the next lookup, at which point they are merged into the sorted lists in one
+    sort. Removed flights are skipped at lookup through the `live` FlightSet, and dropped when the index is next merged.
+    """
+    def __init__(self, keyFunction):
+        self.keyFunction = keyFunction
+        self.keys = []
+        self.flights = []
+        self.pending = []  # (key, flight) pairs of flights added since the last merge
+        self.removed = 0  # Number of removed flights still present within the sorted lists
+
+    def Add(self, flight):
+        self.pending.append((self.keyFunction(flight), flight))
+
+    def Remove(self, flight):
+        self.removed += 1
+
+    def Refresh(self, live):
+        """
+        Merges pending flights into the sorted lists, and drops removed flights once they make up a large part of the
+        index.
+        :param live:
+        :return:
+        """
+        if not self.pending and self.removed * 4 <= len(self.keys):
+            return
+        entries = list(zip(self.keys, self.flights))
+        if self.removed:
+            entries = [entry for entry in entries if entry[1] in live]
+            self.removed = 0
+        entries.extend(self.pending)
+        entries.sort(key=operator.itemgetter(0))  # Both parts are sorted runs, so this is a linear merge
+        self.pending = []
+        self.keys = [entry[0] for entry in entries]
+        self.flights = [entry[1] for entry in entries]
+
+    def Count(self, low, high):
+        return bisect.bisect_right(self.keys, high) - bisect.bisect_left(self.keys, low)
+
+    def Lookup(self, low, high, live):
+        start, end = bisect.bisect_left(self.keys, low), bisect.bisect_right(self.keys, high)
+        return [flight for flight in self.flights[start:end] if flight in live]
+
+
+class FlightSearchIndex:
+    """
+    FlightSearchIndex provides the search of ongoing flights for the Search Flights screen. Search terms with values
+    that do not change whilst a flight is ongoing are indexed - a HashIndex for names and codes (origin, destination,
+    airline, aircraft), and a SortedIndex for numbers and times - whilst the remaining terms are checked against each
+    candidate flight.
+
+    When searching, the values entered by the user are parsed once. The planner then begins from the indexed term
+    which matches the fewest flights, and intersects the candidates with the remaining terms.
+
+    The indexes are only built upon the first search, so loading and simulating flights without searching them (such
+    as from the command line) does not pay for their construction.
+    """
+    def __init__(self, flightColumns, flights=()):
+        self.flightColumns = flightColumns
+        self.flights = FlightSet(flights)
+        self.indexes = None  # Index of each indexed search term, built by BuildIndexes
+
+    def BuildIndexes(self):
+        """
+        Constructs the index of each indexed search term, from the flights currently held.
+        :return:
+        """
+        self.indexes = {}
+        for term in self.flightColumns.terms:
+            getter, dataType = self.flightColumns.GetAccessor(term)
+            if self.flightColumns.indexKinds[term] == 'hash':
+                self.indexes[term] = HashIndex(getter)
+            elif self.flightColumns.indexKinds[term] == 'sorted':
+                self.indexes[term] = SortedIndex(self.KeyFunction(getter, dataType))
+        for index in self.indexes.values():
+            for flight in self.flights:
+                index.Add(flight)
+
+    def Add(self, flight):
+        self.flights.Add(flight)
+        if self.indexes is not None:
+            for index in self.indexes.values():
+                index.Add(flight)
+
+    def Remove(self, flight):
+        self.flights.Remove(flight)
+        if self.indexes is not None:
+            for index in self.indexes.values():
+                index.Remove(flight)
+
+    @classmethod
+    def KeyFunction(cls, getter, dataType):
+        """
+        Returns a function providing a flight's value for `getter`, converted to the given data type for comparison.
+        :param getter:
+        :param dataType:
+        :return:
+        """
+        if dataType in ('int', 'float', 'bool'):
+            return lambda flight: cls.ConvertValue(dataType, getter(flight))
+        return getter
+
+    @staticmethod
+    def ConvertValue(dataType, fliValue):
+        """
+        This function acts as a data type converter for values fetched from the flight object, ensuring that they can
+        be suitably compared with the parsed search values.
+        :param dataType:
+        :param fliValue:
+        :return:
+        """
+        if dataType == 'int':  # Convert to int
+            return int(fliValue)
+        elif dataType == 'float':  # Convert to float
+            return float(fliValue)
+        elif dataType == 'bool':  # Convert bools into strings
+            return f"{fliValue}"
+        return fliValue  # Values did not need converting
+
+    @staticmethod
+    def ParseValues(dataType, searchValues):
+        """
+        This function converts the values inputted into the search by the user to the data type of a search term, so
+        that they can be compared with flight values.
+        :param dataType:
+        :param searchValues:
+        :return:
+        """
+        if dataType == 'int':  # Convert to int
+            return [int(searchValue) for searchValue in searchValues]
+        elif dataType == 'float':  # Convert to float
+            return [float(searchValue) for searchValue in searchValues]
+        elif dataType == 'time':  # Convert into seconds
+            try:
+                return [ParseTimeString(searchValue) for searchValue in searchValues]
+            except ValueError:  # Unsuitable inputs are provided, revert to default values
+                return [0 for _ in searchValues]
+        return list(searchValues)  # Values did not need converting
+
+    def Search(self, criteria):
+        """
+        Returns a list of the flights which match all of the given criteria. Each criterion is a tuple of a search term
+        and a list of the user's search values: one value to be matched exactly, or two values giving an inclusive
+        range.
+        :param criteria:
+        :return:
+        """
+        if self.indexes is None:
+            self.BuildIndexes()
+        indexed, unindexed = [], []
+        for term, searchValues in criteria:
+            getter, dataType = self.flightColumns.GetAccessor(term)
+            values = self.ParseValues(dataType, searchValues)
+            low, high = values[0], values[-1]
+            index = self.indexes.get(term)
+            if isinstance(index, SortedIndex):
+                index.Refresh(self.flights)
+                indexed.append((index.Count(low, high), index, low, high))
+            elif isinstance(index, HashIndex) and len(values) == 1:
+                indexed.append((index.Count(low), index, low, high))
+            else:
+                unindexed.append((self.KeyFunction(getter, dataType), low, high))
+
+        # Begin from the most selective indexed term
+        indexed.sort(key=operator.itemgetter(0))
+        candidates = None
+        for count, index, low, high in indexed:
+            if candidates is None:
+                candidates = (index.Lookup(low, high, self.flights) if isinstance(index, SortedIndex)
+                              else list(index.Lookup(low)))
+            elif count < len(candidates):  # Intersect with the (smaller) set of flights matching this term
+                matches = (set(index.Lookup(low, high, self.flights)) if isinstance(index, SortedIndex)
+                           else index.Lookup(low))
+                candidates = [flight for flight in candidates if flight in matches]
+            else:  # Cheaper to check this term's value of each remaining candidate
+                unindexed.append((index.keyFunction, low, high))
+            if not candidates:
+                return []
+
+        if candidates is None:
+            candidates = list(self.flights)
+        for keyFunction, low, high in unindexed:
+            candidates = [flight for flight in candidates if low <= keyFunction(flight) <= high]
+        return candidates
+
+
+class FlightFilter:
+    """
+    FlightFilter selects which flights are loaded from a flights file: only flights with an Origin or Destination
+    within `airports` (when given), and with a timetabled departure time within the time window from `departAfter` to
+    `departBefore` (when given, as seconds since midnight). A time window where departAfter > departBefore passes
+    midnight. When a `shard` is given (see `FlightShard`), only the flights of that shard are selected.
+    """
+    def __init__(self, airports=None, departAfter=None, departBefore=None, shard=None):
+        self.airports = set(airports) if airports is not None else None
+        self.departAfter = departAfter
+        self.departBefore = departBefore
+        self.shard = shard
+
+    def Match(self, origin, destination, departTime, airlineCode=None):
+        """
+        Returns True if a flight with the given Origin, Destination, departure time (in seconds) and airline code is
+        selected.
+        :param origin:
+        :param destination:
+        :param departTime:
+        :param airlineCode:
+        :return:
+        """
+        if self.shard is not None and not self.shard.Match(origin, airlineCode):
+            return False
+        if self.airports is not None and origin not in self.airports and destination not in self.airports:
+            return False
+        if self.departAfter is not None and self.departBefore is not None and self.departAfter > self.departBefore:
+            return departTime >= self.departAfter or departTime <= self.departBefore  # Window passes midnight
+        if self.departAfter is not None and departTime < self.departAfter:
+            return False
+        return self.departBefore is None or departTime <= self.departBefore
+
+    def MatchRecord(self, flightData):
+        """
+        Returns True if the flight described by the values of a line of the ongoing flights text file is selected. The
+        departure time is only parsed when a time window is given.
+        :param flightData:
+        :return:
+        """
+        if self.departAfter is None and self.departBefore is None:
+            return self.Match(flightData[2], flightData[3], 0, flightData[8])
+        return self.Match(flightData[2], flightData[3], ParseTimeString(flightData[9]), flightData[8])
+
+
+class FlightShard:
+    """
+    FlightShard selects the flights of one shard of a ShardedSimulation, with flights partitioned by their Origin
+    airport (`shardBy='airport'`) or by their airline code (`shardBy='airline'`). The given `keys` (airport names or
+    airline codes) are dealt to the shards in turn, so that each shard holds a similar number of keys, with any other
+    key assigned to a shard by its CRC-32.
+    """
+    SHARD_KEYS = ('airport', 'airline')
+
+    def __init__(self, shardBy, index, numShards, keys=()):
+        if shardBy not in self.SHARD_KEYS:
+            raise ValueError(f"Flights can only be sharded by {' or '.join(self.SHARD_KEYS)}, not {shardBy}")
+        self.shardBy = shardBy
+        self.index = index
+        self.numShards = numShards
+        self.assignments = {key: position % numShards for position, key in enumerate(keys)}
+
+    def ShardOf(self, key):
+        """
+        Returns the index of the shard that the given airport name or airline code belongs to.
+        :param key:
+        :return:
+        """
+        shard = self.assignments.get(key)
+        return shard if shard is not None else zlib.crc32(key.encode('utf-8')) % self.numShards
+
+    def Match(self, origin, airlineCode):
+        """
+        Returns True if a flight with the given Origin and airline code belongs to this shard.
+        :param origin:
+        :param airlineCode:
+        :return:
+        """
+        return self.ShardOf(origin if self.shardBy == 'airport' else airlineCode) == self.index
+
+
+class FlightFileReader:
+    """
+    FlightFileReader reads the ongoing flights text file in a single streaming pass. The data search terms and the
+    programTime (in seconds) are read from the first two lines upon construction, after which `Flights` yields a Flight
+    for each remaining line as it is read, so the file is never held in memory as a whole.
+    """
+    def __init__(self, fileName):
+        self.size = max(1, os.path.getsize(fileName))
+        self.file = open(fileName, 'r')
+        try:
+            # read first line, remove \n and # char, split into list of values
+            self.dataSearchTerms = self.file.readline().strip()[1:].split(', ')
+            self.programTime = ParseTimeString(self.file.readline().strip()[1:])
+        except ValueError:
+            self.file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+    def Close(self):
+        self.file.close()
+
+    def Progress(self, numFlights):
+        """
+        Returns the fraction of the file read so far, by the position within the file of the text buffered for reading.
+        :param numFlights: Flights yielded so far (unused, as the number of flights within a text file is unknown)
+        :return:
+        """
+        return min(1.0, self.file.buffer.tell() / self.size)
+
+    def Flights(self, flightColumns, flightTable, flightFilter=None, positions=None):
+        """
+        Yields a Flight, stored within `flightTable`, for each flight line of the file selected by `flightFilter`. The
+        position of each yielded flight amongst all flights of the file is appended to `positions`, if given.
+        :param flightColumns:
+        :param flightTable:
+        :param flightFilter:
+        :param positions:
+        :return:
+        """
+        # Omit lines beginning with #, no value or \n char as these are not flight data lines
+        omit = ('#', '\n', ' ')
+        position = 0
+        for line in self.file:
+            if line[0] not in omit:
+                flightData = line.strip().split(', ')
+                if flightFilter is None or flightFilter.MatchRecord(flightData):
+                    if positions is not None:
+                        positions.append(position)
+                    # Split data into categories using slices of the total flight data list
+                    yield Flight(flightData[:6], flightData[6:9], flightData[9:], flightColumns, flightTable)
+                position += 1
+
+
+class FlightSnapshot:
+    """
+    FlightSnapshot reads and writes the binary snapshot format of the ongoing flights, an alternative to the
+    `ongoingFlights.txt` text file which can be loaded without parsing each value. The file consists of:
+
+    - The 8 byte SNAPSHOT_MAGIC, followed by the length of the header as a 4 byte little-endian integer.
+    - A JSON header holding the format version, the number of flights, the programTime (in seconds), the data search
+      terms and the layout of each column.
+    - One fixed-width column per data search term, each aligned to 8 bytes, holding the value of every flight in the
+      order of the flights: little-endian floats for speeds and distances, 4 byte integers of seconds for times, single
+      bytes for bools, null-padded bytes for flight numbers and codes, and 4 byte indexes into a dictionary of names
+      (listed in the header) for airports, aircraft, airlines and airline codes.
+
+    The file is memory-mapped when read, so the columns are viewed directly (as NumPy arrays when NumPy is installed)
+    rather than parsed.
+    """
+    version = 1
+    # Encoding of the column of each data search term, in the order of the data search terms
+    columnEncodings = ('text', 'text', 'dictionary', 'dictionary', 'float', 'float', 'dictionary', 'dictionary',
+                       'dictionary', 'time', 'time', 'time', 'time', 'bool', 'bool')
+    # Array type code and the column dtype of each fixed-size encoding
+    encodingTypes = {'float': ('d', '<f8'), 'time': ('i', '<i4'), 'dictionary': ('I', '<u4'), 'bool': ('B', '|u1')}
+
+    def __init__(self, fileName):
+        with open(fileName, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buffer[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self.buffer.close()
+            raise ValueError(f"{fileName} is not a flight snapshot file")
+        headerStart = len(SNAPSHOT_MAGIC) + 4
+        headerLength = int.from_bytes(self.buffer[len(SNAPSHOT_MAGIC):headerStart], 'little')
+        header = json.loads(self.buffer[headerStart:headerStart + headerLength].decode('utf-8'))
+        if header['version'] != self.version:
+            self.buffer.close()
+            raise ValueError(f"{fileName} is a version {header['version']} snapshot, expected {self.version}")
+        self.count = header['count']
+        self.programTime = header['programTime']
+        self.dataSearchTerms = header['dataSearchTerms']
+        self.columns = header['columns']
+        self.dataStart = self.Align(headerStart + headerLength)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+    def Close(self):
+        self.buffer.close()
+
+    def Progress(self, numFlights):
+        """
+        Returns the fraction of the snapshot's flights which `numFlights` flights are.
+        :param numFlights:
+        :return:
+        """
+        return min(1.0, numFlights / max(1, self.count))
+
+    @staticmethod
+    def Align(offset):
+        """
+        Returns the first offset at or after `offset` which is a multiple of 8 bytes.
+        :param offset:
+        :return:
+        """
+        return (offset + 7) // 8 * 8
+
+    @staticmethod
+    def IsSnapshot(fileName):
+        """
+        Returns True if the file at `fileName` begins with the snapshot magic bytes.
+        :param fileName:
+        :return:
+        """
+        with open(fileName, 'rb') as file:
+            return file.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+    def Column(self, index):
+        """
+        Returns the stored values of the column at `index`: a NumPy array viewing the memory-mapped file when NumPy is
+        installed, otherwise an array copied from it. Dictionary columns return the indexes of each name.
+        :param index:
+        :return:
+        """
+        column = self.columns[index]
+        offset = self.dataStart + column['offset']
+        if np is not None:
+            return np.frombuffer(self.buffer, dtype=column['dtype'], count=self.count, offset=offset)
+        values = array.array(self.encodingTypes[column['encoding']][0])
+        values.frombytes(self.buffer[offset:offset + self.count * values.itemsize])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def Strings(self, index):
+        """
+        Returns a list of the string values of the text or dictionary column at `index`.
+        :param index:
+        :return:
+        """
+        column = self.columns[index]
+        if column['encoding'] == 'dictionary':
+            names = column['values']
+            codes = self.Column(index)
+            return [names[code] for code in (codes.tolist() if np is not None else codes)]
+        width, offset = column['width'], self.dataStart + column['offset']
+        data = self.buffer[offset:offset + self.count * width]
+        return [data[i:i + width].rstrip(b'\0').decode('utf-8') for i in range(0, len(data), width)]
+
+    def Values(self, index):
+        """
+        Returns a list of the values of the column at `index`, as the types used when writing: strings, floats, seconds
+        and bools.
+        :param index:
+        :return:
+        """
+        encoding = self.columns[index]['encoding']
+        if encoding in ('text', 'dictionary'):
+            return self.Strings(index)
+        values = self.Column(index)
+        values = values.tolist() if np is not None else list(values)
+        return [bool(value) for value in values] if encoding == 'bool' else values
+
+    def Flights(self, flightColumns, flightTable, flightFilter=None, positions=None):
+        """
+        Appends the values of every flight within the snapshot selected by `flightFilter` to `flightTable` in one
+        operation per column, and returns a list of the Flights viewing the new rows. The position of each selected
+        flight amongst all flights of the snapshot is appended to `positions`, if given.
+        :param flightColumns:
+        :param flightTable:
+        :param flightFilter:
+        :param positions:
+        :return:
+        """
+        columns = {index: self.Column(index) for index in (4, 5, 9, 10, 11, 12, 13, 14)}
+        strings = {index: self.Strings(index) for index in (0, 1, 2, 3, 6, 7, 8)}
+        rows = range(self.count)
+        if flightFilter is not None:  # Select the rows of the flights which match the filter
+            rows = [row for row, flight in enumerate(zip(strings[2], strings[3], columns[9], strings[8]))
+                    if flightFilter.Match(*flight)]
+            for index, values in columns.items():
+                if np is not None:
+                    columns[index] = values[rows]
+                else:
+                    columns[index] = array.array(values.typecode, [values[row] for row in rows])
+            for index, values in strings.items():
+                strings[index] = [values[row] for row in rows]
+        if positions is not None:
+            positions.extend(rows)
+
+        departTimes, arriveTimes = columns[9], columns[10]
+        if np is not None:  # Since programTime operates in 24hr loop, arrival time can be < departure time
+            trueArrives = arriveTimes + DAY_SECONDS * (arriveTimes < departTimes)
+        else:
+            trueArrives = [arrive + DAY_SECONDS if arrive < depart else arrive
+                           for depart, arrive in zip(departTimes, arriveTimes)]
+        firstRow = flightTable.AppendColumns(len(departTimes), {
+            'speed': columns[4], 'distance': columns[5], 'departTime': departTimes, 'arriveTime': arriveTimes,
+            'trueArrive': trueArrives, 'appxArriveTime': columns[11], 'delayTime': columns[12],
+            'hasDeparted': columns[13], 'isDeparting': columns[14]})
+        details = zip(strings[0], strings[1], strings[2], strings[3])
+        airlineDetails = zip(strings[6], strings[7], strings[8])
+        return [Flight.ViewTableRow(flightDetails, airline, flightColumns, flightTable, row)
+                for row, flightDetails, airline in zip(range(firstRow, flightTable.count), details, airlineDetails)]
+
+    @classmethod
+    def Write(cls, fileName, dataSearchTerms, programTime, columnValues):
+        """
+        Writes a snapshot file, with `programTime` in seconds and `columnValues` being a list of the values of every
+        flight for each data search term. Time values are given in seconds.
+        :param fileName:
+        :param dataSearchTerms:
+        :param programTime:
+        :param columnValues:
+        :return:
+        """
+        count = len(columnValues[0]) if columnValues else 0
+        columns, data, offset = [], [], 0
+        for encoding, values in zip(cls.columnEncodings, columnValues):
+            column = {'encoding': encoding, 'offset': offset}
+            if encoding == 'text':
+                encoded = [str(value).encode('utf-8') for value in values]
+                column['width'] = width = max(map(len, encoded), default=1) or 1
+                column['dtype'] = f"|S{width}"
+                columnData = b''.join(value.ljust(width, b'\0') for value in encoded)
+            else:
+                if encoding == 'dictionary':  # Replace each name with its index in the dictionary of names
+                    dictionary = {}
+                    values = [dictionary.setdefault(value, len(dictionary)) for value in values]
+                    column['values'] = list(dictionary)
+                elif encoding == 'time':
+                    values = [int(value) for value in values]
+                elif encoding == 'bool':
+                    values = [bool(value) for value in values]
+                typeCode, column['dtype'] = cls.encodingTypes[encoding]
+                values = array.array(typeCode, values)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                columnData = values.tobytes()
+            columns.append(column)
+            data.append(columnData)
+            data.append(bytes(cls.Align(len(columnData)) - len(columnData)))  # Pad to the next column
+            offset += cls.Align(len(columnData))
+
+        header = json.dumps({'version': cls.version, 'count': count, 'programTime': int(programTime),
+                             'dataSearchTerms': list(dataSearchTerms), 'columns': columns}).encode('utf-8')
+        headerStart = len(SNAPSHOT_MAGIC) + 4
+        with open(fileName, 'wb') as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(len(header).to_bytes(4, 'little'))
+            file.write(header)
+            file.write(bytes(cls.Align(headerStart + len(header)) - headerStart - len(header)))
+            file.writelines(data)
+
+    @classmethod
+    def ImportText(cls, textFileName, snapshotFileName):
+        """
+        Converts an ongoing flights text file into a snapshot file.
+        :param textFileName:
+        :param snapshotFileName:
+        :return:
+        """
+        with open(textFileName, 'r') as file:
+            dataSearchTerms = file.readline().strip()[1:].split(', ')
+            programTime = ParseTimeString(file.readline().strip()[1:])
+            rows = [line.strip().split(', ') for line in file if line[0] not in ('#', '', '\n', ' ')]
+        columnValues = []
+        for encoding, values in zip(cls.columnEncodings, zip(*rows) if rows else [()] * len(cls.columnEncodings)):
+            if encoding == 'float':
+                values = [float(value) for value in values]
+            elif encoding == 'time':
+                values = [ParseTimeString(value) for value in values]
+            elif encoding == 'bool':
+                values = [value == 'True' for value in values]
+            columnValues.append(list(values))
+        cls.Write(snapshotFileName, dataSearchTerms, programTime, columnValues)
+
+    @classmethod
+    def ExportText(cls, snapshotFileName, textFileName):
+        """
+        Converts a snapshot file into an ongoing flights text file.
+        :param snapshotFileName:
+        :param textFileName:
+        :return:
+        """
+        with cls(snapshotFileName) as snapshot:
+            columnValues = []
+            for index, encoding in enumerate(cls.columnEncodings):
+                values = snapshot.Values(index)
+                columnValues.append(list(map(FormatTime, values)) if encoding == 'time' else values)
+            dataSearchTerms, programTime = snapshot.dataSearchTerms, FormatTime(snapshot.programTime)
+        with open(textFileName, 'w') as file:
+            file.write(f"#{', '.join(dataSearchTerms)}\n")
+            file.write(f"#{programTime}\n")
+            file.writelines(f"{', '.join(map(str, row))}\n" for row in zip(*columnValues))
+
+
+class FlightJournal:
+    """
+    FlightJournal is an append-only (write-ahead) log of the changes made to a Simulation since its flights and airports
+    were last written to file: flights created, departed and landed, and airports added and removed. Records are
+    buffered in memory and written in batches by `Flush`, so saving costs O(changes) rather than O(flights), and at
+    most one flush interval of changes is lost should the program crash.
+
+    The first line of the journal is a JSON header naming the flights and airports files (the "base" files) that the
+    records follow on from, being either the program files or a checkpoint written by `Simulation.Checkpoint`. The size
+    and modification time of each base file is kept in the header, so a journal whose base files have since been
+    rewritten is never replayed onto them. Each following line is a JSON list of the record kind, the simulation time
+    of the record, and the values of the record. The header's `baseTime` is the simulation time at which the base files
+    were written, so a Simulation which reads the base files replays each record at the same time after them.
+
+    Flight codes need not be unique, so departures and landings give the flight by its id within the journal: the
+    flights of the base flights file are numbered by their position within it (see `NumberFlights`), and each flight
+    created is given the next number, in the order of the records.
+
+    After `Mark`, records are also retained in memory, such that `Rebase` can carry the records made since the mark
+    into a new journal following on from files written with the state at the mark (see `Autosave`). The records are
+    retained unencoded, as the flights are numbered afresh within the new journal.
+    """
+    version = 2
+    CREATE = 'create'  # A flight is added, with the values of each data search term
+    DEPART = 'depart'  # A flight departs, given by flight id and departure time
+    LAND = 'land'  # A flight lands, given by flight id
+    ADD_AIRPORT = 'addAirport'  # An airport is added, given by name
+    REMOVE_AIRPORT = 'removeAirport'  # An airport is removed, given by name
+    TIME = 'time'  # The simulation time when the journal was flushed
+
+    def __init__(self, fileName, header, timeOffset=0, numRecords=0, flushInterval=JOURNAL_FLUSH_INTERVAL):
+        self.fileName = fileName
+        self.header = header
+        self.timeOffset = timeOffset  # Added to the Simulation's times to give the times of the journal
+        self.flushInterval = flushInterval
+        self.pending = []  # Encoded records not yet written
+        self.retained = None  # (kind, time, flight, values) of the records since Mark, if marked
+        self.numRecords = numRecords  # Records since the base files
+        self.flightIds = {}  # Id of each ongoing flight within the records, see NumberFlights
+        self.newFlightIds = itertools.count()  # Ids of the flights created
+        self.lastFlush = time.monotonic()
+        self.file = open(fileName, 'a')
+
+    @classmethod
+    def Create(cls, fileName, baseFiles, baseTime, checkpointSlot=None, records=()):
+        """
+        Creates a journal following on from the given (flights, airports) base files, written at simulation time
+        `baseTime`, and holding the given encoded records. Any existing journal of the same name is replaced: the
+        journal is written to a temporary file and then moved into place, so a crash leaves either the previous journal
+        or the new one.
+        :param fileName:
+        :param baseFiles:
+        :param baseTime:
+        :param checkpointSlot:
+        :param records:
+        :return:
+        """
+        header = {'version': cls.version, 'baseFiles': list(baseFiles),
+                  'baseStamps': [cls.FileStamp(name) for name in baseFiles], 'baseTime': int(baseTime),
+                  'checkpointSlot': checkpointSlot}
+        with open(f"{fileName}.tmp", 'w') as file:
+            file.write(f"{json.dumps(header)}\n")
+            file.writelines(records)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{fileName}.tmp", fileName)
+        return cls(fileName, header, numRecords=len(records))
+
+    @classmethod
+    def Recover(cls, fileName):
+        """
+        Reads an existing journal, returning its header and list of records, or None if there is no journal, it is of
+        another version, or its base files no longer match it. A partly written record left at the end of the journal
+        by a crash is discarded, and truncated from the file so that further records may be appended.
+        :param fileName:
+        :return:
+        """
+        if not os.path.exists(fileName):
+            return None
+        with open(fileName, 'rb') as file:
+            try:
+                header = json.loads(file.readline())
+            except ValueError:
+                header = None
+            if header is None or header.get('version') != cls.version:
+                print(f"Flight journal: {fileName} is not a version {cls.version} journal, and has been ignored.")
+                return None
+            if [cls.FileStamp(name) for name in header['baseFiles']] != header['baseStamps']:
+                print(f"Flight journal: {fileName} does not match its base files, and has been ignored.")
+                return None
+            records, end = [], file.tell()
+            for line in file:
+                if not line.endswith(b'\n'):  # Partly written record
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                end += len(line)
+        if end < os.path.getsize(fileName):
+            os.truncate(fileName, end)
+        return header, records
+
+    @staticmethod
+    def FileStamp(fileName):
+        """
+        Returns the [size, modification time] of a file, or None if it does not exist.
+        :param fileName:
+        :return:
+        """
+        if not os.path.exists(fileName):
+            return None
+        stat = os.stat(fileName)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def SyncFile(fileName):
+        """
+        Ensures that a written file has reached the disk.
+        :param fileName:
+        :return:
+        """
+        with open(fileName, 'rb') as file:
+            os.fsync(file.fileno())
+
+    def NumberFlights(self, flights, ongoing=None):
+        """
+        Numbers the flights of the base flights file, given in the order of the file, with the flights created after
+        them numbered from `len(flights)`. Given `ongoing`, flights not within it (having landed) are not numbered.
+        :param flights:
+        :param ongoing:
+        :return:
+        """
+        self.flightIds = {flight: flightId for flightId, flight in enumerate(flights)
+                          if ongoing is None or flight in ongoing}
+        self.newFlightIds = itertools.count(len(flights))
+
+    @staticmethod
+    def Encode(kind, time, *values):
+        return f"{json.dumps([kind, time, *values])}\n"
+
+    @classmethod
+    def EncodeFlight(cls, flightIds, newFlightIds, kind, time, flight, values):
+        """
+        Returns the encoded record of a flight being created, departing or landing, giving the flight by its id within
+        `flightIds`. A created flight is given the next of `newFlightIds`, and a landed flight's id is forgotten.
+        :param flightIds:
+        :param newFlightIds:
+        :param kind:
+        :param time:
+        :param flight:
+        :param values:
+        :return:
+        """
+        if kind == cls.CREATE:
+            flightIds[flight] = next(newFlightIds)
+            return cls.Encode(kind, time, *values)
+        flightId = flightIds.pop(flight) if kind == cls.LAND else flightIds[flight]
+        return cls.Encode(kind, time, flightId, *values)
+
+    def Record(self, kind, time, *values):
+        """
+        Adds a record of the given kind, occurring at simulation time `time`, to be written upon the next Flush.
+        :param kind:
+        :param time:
+        :param values:
+        :return:
+        """
+        self.pending.append(self.Encode(kind, time + self.timeOffset, *values))
+        if self.retained is not None:
+            self.retained.append((kind, time + self.timeOffset, None, values))
+        self.numRecords += 1
+
+    def RecordFlight(self, kind, time, flight, *values):
+        """
+        Adds a record of `flight` being created, departing or landing at simulation time `time` (see Record), with the
+        flight given by its id.
+        :param kind:
+        :param time:
+        :param flight:
+        :param values:
+        :return:
+        """
+        self.pending.append(self.EncodeFlight(self.flightIds, self.newFlightIds, kind, time + self.timeOffset, flight,
+                                              values))
+        if self.retained is not None:
+            self.retained.append((kind, time + self.timeOffset, flight, values))
+        self.numRecords += 1
+
+    def Mark(self):
+        """
+        Begins retaining the records made from now on, for a following Rebase.
+        :return:
+        """
+        self.retained = []
+
+    def Rebase(self, baseFiles, baseTime, baseFlights, checkpointSlot=None):
+        """
+        Closes this journal, and returns a new journal in its place following on from the given base files, written at
+        simulation time `baseTime` with `baseFlights` in the order of the flights file. The records retained since Mark
+        (if any) are carried into the new journal, with their flights numbered within it.
+        :param baseFiles:
+        :param baseTime:
+        :param baseFlights:
+        :param checkpointSlot:
+        :return:
+        """
+        self.Close()
+        flightIds = {flight: flightId for flightId, flight in enumerate(baseFlights)}
+        newFlightIds = itertools.count(len(flightIds))
+        records = [self.Encode(kind, time, *values) if flight is None else
+                   self.EncodeFlight(flightIds, newFlightIds, kind, time, flight, values)
+                   for kind, time, flight, values in self.retained or ()]
+        journal = FlightJournal.Create(self.fileName, baseFiles, baseTime + self.timeOffset, checkpointSlot, records)
+        journal.timeOffset = self.timeOffset
+        journal.flightIds, journal.newFlightIds = flightIds, newFlightIds
+        return journal
+
+    def FlushDue(self):
+        """
+        Returns True once the flush interval has passed since the journal was last flushed.
+        :return:
+        """
+        return time.monotonic() - self.lastFlush >= self.flushInterval
+
+    def Flush(self):
+        """
+        Writes all pending records to the journal in a single batch, and ensures they have reached the disk.
+        :return:
+        """
+        self.lastFlush = time.monotonic()
+        if self.pending:
+            self.file.writelines(self.pending)
+            self.pending = []
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def Close(self):
+        """
+        Flushes and closes the journal.
+        :return:
+        """
+        self.Flush()
+        self.file.close()
+
+
+class SimulationState:
+    """
+    SimulationState holds the values of a Simulation which are written to the program files - the ongoing flights,
+    programTime, data search terms, airport names and airline data - and writes them to file. It is constructed by
+    `Simulation.CaptureState`, either viewing the Simulation's flights directly, or with a copy of its FlightTable and
+    the row of each flight, so that the state may be written on another thread whilst the Simulation continues.
+    """
+    def __init__(self, dataSearchTerms, flightColumns, programTime, flights, airportNames, airlineDataSets,
+                 flightTable=None, rows=None):
+        self.dataSearchTerms = dataSearchTerms
+        self.flightColumns = flightColumns
+        self.programTime = programTime
+        self.flights = flights
+        self.airportNames = airportNames
+        self.airlineDataSets = airlineDataSets
+        self.flightTable = flightTable  # Copied FlightTable the flights are viewed within, if copied
+        self.rows = rows  # Row of the copied FlightTable for each flight
+        self.sortedIndexes = None  # Index within flights of each flight, in the order written, see SortedFlights
+
+    def SortedFlights(self):
+        """
+        Returns the ongoing flights organised by timetabled arrival time, the order they are written in. When the
+        FlightTable was copied, each flight is a copy viewing its row of the copied table. The order is sorted once, and
+        kept for BaseFlights.
+        :return:
+        """
+        flights = self.flights
+        if self.flightTable is not None:
+            flights = map(Flight.CopyView, flights, [self.flightTable] * len(self.rows), self.rows)
+        flights = list(flights)
+        if self.sortedIndexes is None:
+            # sort into list organised by timetabled arrival time (ascending from 00:00:00 to 23:59:59)
+            arriveTimes = [fliDat.ttblArriveTime for fliDat in flights]
+            self.sortedIndexes = sorted(range(len(flights)), key=arriveTimes.__getitem__)
+        return [flights[index] for index in self.sortedIndexes]
+
+    def BaseFlights(self):
+        """
+        Returns the Simulation's own flights (rather than any copies) in the order they are written (see
+        SortedFlights), by which a journal following on from the written files numbers them (see `FlightJournal`).
+        :return:
+        """
+        if self.sortedIndexes is None:
+            self.SortedFlights()
+        flights = list(self.flights)
+        return [flights[index] for index in self.sortedIndexes]
+
+    def WriteFlights(self, fileName, progress=None):
+        """
+        Writes the programTime and all ongoing (non-landed) flights to an ongoing flights text file. The flights are
+        written FILE_PROGRESS_INTERVAL at a time, with `progress(stage, fraction)` called after each, if given.
+        :param fileName:
+        :param progress:
+        :return:
+        """
+        sortedFlights = self.SortedFlights()
+        with open(fileName, 'w') as file:
+            # Construct the Data Search Term Strings line:
+            dataSearchTermStrings = f"#{self.dataSearchTerms[0]}"
+            for searchTerm in self.dataSearchTerms[1:]:
+                dataSearchTermStrings = f"{dataSearchTermStrings}, {searchTerm}"
+            file.write(f"{dataSearchTermStrings}\n")
+
+            # Construct the programTime line:
+            file.write(f"#{FormatTime(self.programTime)}\n")
+
+            # Construct the updated flight data lines, as strings of each Flight object's values:
+            for start in range(0, len(sortedFlights), FILE_PROGRESS_INTERVAL):
+                file.writelines(f"{', '.join(map(str, flight.GetRow()))}\n"
+                                for flight in sortedFlights[start:start + FILE_PROGRESS_INTERVAL]
+                                if not flight.hasLanded)
+                if progress is not None:
+                    numWritten = min(len(sortedFlights), start + FILE_PROGRESS_INTERVAL)
+                    progress(f"Writing flights: {numWritten} of {len(sortedFlights)}", numWritten / len(sortedFlights))
+
+    def WriteSnapshot(self, fileName):
+        """
+        Writes the programTime and all ongoing flights to a snapshot file (see `FlightSnapshot`).
+        :param fileName:
+        :return:
+        """
+        columns = self.flightColumns.GetColumns(self.SortedFlights())
+        FlightSnapshot.Write(fileName, self.dataSearchTerms, self.programTime,
+                             [columns[term] for term in self.dataSearchTerms])
+
+    def WriteAirportsAirlines(self, fileName):
+        """
+        Writes the airport names and airline data to an airports and airlines file.
+        :param fileName:
+        :return:
+        """
+        with open(fileName, 'w') as file:
+            # Construct Airport names String line:
+            airportNamesString = f"#{self.airportNames[0]}"
+            for airport in self.airportNames[1:]:
+                airportNamesString = f"{airportNamesString}, {airport}"
+            file.write(f"{airportNamesString}\n")
+
+            # Construct airline data into string lines
+            for airline in self.airlineDataSets:
+                airlineDataString = f"{airline[0]}"
+                for data in airline[1:]:
+                    airlineDataString = f"{airlineDataString}, {data}"
+                file.write(f"{airlineDataString}\n")
+
+    def WriteFiles(self, allFlightsFileName, airportsAirlinesFileName, snapshotFormat=False, progress=None):
+        """
+        Writes both program files, with the flights file as a snapshot if `snapshotFormat` is set. Each file is written
+        in full to a temporary file, which then replaces the program file with `os.replace`, so an interrupted write
+        never leaves a partly written program file, and neither file is replaced unless both were written. Returns the
+        number of bytes written. Progress is reported through
+        `progress(stage, fraction)`, if given, with a fraction of None when the progress of a stage is unknown.
+        :param allFlightsFileName:
+        :param airportsAirlinesFileName:
+        :param snapshotFormat:
+        :param progress:
+        :return:
+        """
+        flightsTemp, airportsAirlinesTemp = f"{allFlightsFileName}.tmp", f"{airportsAirlinesFileName}.tmp"
+        try:
+            if snapshotFormat:
+                if progress is not None:
+                    progress("Writing flights snapshot", None)
+                self.WriteSnapshot(flightsTemp)
+            else:
+                self.WriteFlights(flightsTemp, progress)
+            if progress is not None:
+                progress("Writing airports and airlines", None)
+            self.WriteAirportsAirlines(airportsAirlinesTemp)
+            bytesWritten = 0
+            for tempName in (flightsTemp, airportsAirlinesTemp):
+                FlightJournal.SyncFile(tempName)
+                bytesWritten += os.path.getsize(tempName)
+        except BaseException:  # Neither file is replaced, and the partly written temporary files are removed
+            for tempName in (flightsTemp, airportsAirlinesTemp):
+                if os.path.exists(tempName):
+                    os.remove(tempName)
+            raise
+        for tempName, fileName in ((flightsTemp, allFlightsFileName), (airportsAirlinesTemp, airportsAirlinesFileName)):
+            os.replace(tempName, fileName)
+        return bytesWritten
+
+
+class Autosave:
+    """
+    Autosave writes the state of a Simulation to a checkpoint of its journal every `interval` real seconds, without
+    pausing the Simulation for the write: the state is captured on the Simulation's thread by copying the FlightTable's
+    columns (see `Simulation.CaptureState`), and is then serialised and written on a worker thread through temporary
+    files and `os.replace` (see `SimulationState.WriteFiles`).
+
+    `Update` is called by the Simulation after each update of its flights, starting an autosave once due and completing
+    one once written, at which point the duration and bytes written are reported for sizing the interval. The journal
+    is then rebased onto the written checkpoint, keeping the records made since the capture. The autosave is written to
+    the checkpoint slot not named by the journal (see `Simulation.NextCheckpoint`), so the journal's base files are
+    never replaced, and a crash before the journal is rebased leaves the previous journal to be recovered.
+    """
+    def __init__(self, simulation, interval=DEFAULT_AUTOSAVE_INTERVAL):
+        self.simulation = simulation
+        self.interval = interval
+        self.thread = None  # Worker thread of the autosave being written
+        self.lastStart = time.monotonic()
+        self.captureTime = 0  # Simulation time of the captured state
+        self.slot, self.baseFiles = None, ()  # Checkpoint slot and (flights, airports) files of the autosave
+        self.state = None  # SimulationState being written
+        self.numSaves = 0
+        self.captureDuration = 0.0  # Seconds the Simulation was paused for by the last capture
+        self.writeDuration = 0.0  # Seconds taken by the worker to serialise and write the last autosave
+        self.bytesWritten = 0
+        self.error = None
+
+    def Busy(self):
+        """
+        Returns True whilst an autosave is being written.
+        :return:
+        """
+        return self.thread is not None
+
+    def Update(self):
+        """
+        Completes the autosave being written once its worker has finished, or starts an autosave once the interval has
+        passed since the last one began.
+        :return:
+        """
+        if self.thread is not None:
+            if not self.thread.is_alive():
+                self.Finish()
+        elif time.monotonic() - self.lastStart >= self.interval:
+            self.Start()
+
+    def Start(self):
+        """
+        Captures the state of the Simulation, and begins writing it to the next checkpoint on a worker thread.
+        :return:
+        """
+        simulation = self.simulation
+        self.lastStart = time.monotonic()
+        state = simulation.CaptureState(copyValues=True)
+        self.captureTime = simulation.simulationTime
+        self.slot, self.baseFiles = simulation.NextCheckpoint()
+        simulation.journal.Mark()
+        self.captureDuration = time.monotonic() - self.lastStart
+        self.error = None
+        self.state = state
+        self.thread = threading.Thread(target=self.Write, args=(state,), name='Autosave', daemon=True)
+        self.thread.start()
+
+    def Write(self, state):
+        """
+        Writes the captured state to the checkpoint files, with the flights as a snapshot. Runs on the worker thread.
+        Any failure is kept to be reported by Finish, with the size written only kept once both files are replaced.
+        :param state:
+        :return:
+        """
+        startTime = time.monotonic()
+        self.bytesWritten = 0
+        try:
+            bytesWritten = state.WriteFiles(*self.baseFiles, snapshotFormat=True)
+        except Exception as error:  # Reported upon the Simulation's thread, see Finish
+            self.error = error
+        else:
+            self.bytesWritten = bytesWritten
+        self.writeDuration = time.monotonic() - startTime
+
+    def Finish(self):
+        """
+        Waits for the autosave being written, reports its duration and size, and rebases the Simulation's journal onto
+        the written checkpoint.
+        :return:
+        """
+        self.thread.join()
+        self.thread = None
+        state, self.state = self.state, None
+        simulation = self.simulation
+        if self.error is not None:
+            print(f"Autosave failed: {type(self.error).__name__}: {self.error}")
+            simulation.journal.retained = None
+            return
+        self.numSaves += 1
+        simulation.instrumentation.Record('Autosave Capture', self.captureDuration)
+        simulation.instrumentation.Record('Autosave Write', self.writeDuration)
+        print(f"Autosaved at {FormatTime(self.captureTime % DAY_SECONDS)}: {self.bytesWritten / 1e6:.1f} MB written "
+              f"in {self.writeDuration:.2f}s (capture {self.captureDuration * 1000:.1f} ms).")
+        simulation.journal = simulation.journal.Rebase(self.baseFiles, self.captureTime, state.BaseFlights(), self.slot)
+
+    def Wait(self):
+        """
+        Completes the autosave being written, if any.
+        :return:
+        """
+        if self.thread is not None:
+            self.Finish()
+
+
+class Aircraft:
+    """
+    Aircraft is a type of aircraft flown by an Airline, with the speed (in km/h) at which flights of it are timetabled.
+    """
+    __slots__ = ('name', 'speed')
+
+    def __init__(self, name, speed):
+        self.name = sys.intern(name)
+        self.speed = float(speed)
+
+
+class Airline:
+    """
+    Airline holds the name and code of an airline, and the Aircraft it flies by name, in the order they are listed.
+
+    Within the airports and airlines file each airline is a line of its name, code, the names of its aircraft and then
+    the speed of each aircraft, in the same order: "Ryanair, FR, Boeing 737 Max 8, Boeing 737-800, 839, 966". The line
+    is parsed once by `FromData`, and written back by `GetData`.
+    """
+    __slots__ = ('name', 'code', 'aircraft')
+
+    def __init__(self, name, code, aircraft=()):
+        self.name = sys.intern(name)
+        self.code = sys.intern(code)
+        self.aircraft = {craft.name: craft for craft in aircraft}  # Aircraft by name
+
+    @classmethod
+    def FromData(cls, airlineData):
+        """
+        Constructs an Airline from the values of its line of the airports and airlines file.
+        :param airlineData:
+        :return:
+        """
+        numAircraft = (len(airlineData) - 2) // 2  # Aircraft names are followed by the speed of each
+        names = airlineData[2:2 + numAircraft]
+        speeds = airlineData[2 + numAircraft:2 + numAircraft * 2]
+        return cls(airlineData[0], airlineData[1], [Aircraft(name, speed) for name, speed in zip(names, speeds)])
+
+    def GetData(self):
+        """
+        Returns the values of the Airline's line of the airports and airlines file, as strings.
+        :return:
+        """
+        speeds = [str(int(craft.speed)) if craft.speed.is_integer() else str(craft.speed)
+                  for craft in self.aircraft.values()]
+        return [self.name, self.code, *self.aircraft, *speeds]
+
+
+class AirlineCatalog:
+    """
+    AirlineCatalog holds every Airline of a Simulation, read once from the airports and airlines file, by both name and
+    code - so finding an airline, and one of its aircraft and their speed, are O(1) dictionary lookups rather than
+    scans of every airline's data. Iterating an AirlineCatalog returns the Airlines in the order they were added.
+    """
+    def __init__(self, airlines=()):
+        self.byName = {}
+        self.byCode = {}
+        for airline in airlines:
+            self.Add(airline)
+
+    def __iter__(self):
+        return iter(self.byName.values())
+
+    def __len__(self):
+        return len(self.byName)
+
+    def Add(self, airline):
+        self.byName[airline.name] = airline
+        self.byCode[airline.code] = airline
+
+    def Get(self, name):
+        """
+        Returns the Airline with the given name, or None if there is none.
+        :param name:
+        :return:
+        """
+        return self.byName.get(name)
+
+    def GetByCode(self, code):
+        """
+        Returns the Airline with the given code, or None if there is none.
+        :param code:
+        :return:
+        """
+        return self.byCode.get(code)
+
+    def GetAircraft(self, airlineName, aircraftName):
+        """
+        Returns the Aircraft of the given name flown by the airline of the given name, or None if there is none.
+        :param airlineName:
+        :param aircraftName:
+        :return:
+        """
+        airline = self.byName.get(airlineName)
+        return airline.aircraft.get(aircraftName) if airline is not None else None
+
+    def Names(self):
+        """
+        Returns a list of the name of every Airline.
+        :return:
+        """
+        return list(self.byName)
+
+    def GetData(self):
+        """
+        Returns the values of each Airline's line of the airports and airlines file (see `Airline.GetData`).
+        :return:
+        """
+        return [airline.GetData() for airline in self]
+
+
+class FlightNumberAllocator:
+    """
+    FlightNumberAllocator hands out the flight numbers of a single airline from the four digit space of 0000 to 9999,
+    always allocating the lowest free number. The flights using each number are counted, numbers released below
+    `nextNumber` are held within a min-heap, and the numbers from `nextNumber` onwards are reached by advancing it past
+    those in use - so allocating and releasing a number are O(log n), rather than collecting every number in use.
+
+    A number is only free once every flight using it has released it, as files written by hand may hold several
+    flights with the same airline and number. Released numbers which have since been reserved are left within the
+    heap, and skipped when reaching its top.
+    """
+    def __init__(self, airlineCode, limit=FLIGHT_NUMBER_LIMIT):
+        self.airlineCode = airlineCode
+        self.used = array.array('I', [0]) * limit  # Flights using each number, 0 for each free number
+        self.numUsed = 0  # Distinct numbers in use
+        self.nextNumber = 0  # Every free number below nextNumber is held within `released`
+        self.released = []  # Min-heap of released numbers below nextNumber
+
+    def __len__(self):
+        return self.numUsed
+
+    def IsFree(self, number):
+        """
+        Returns True if `number` is within the airline's flight numbers and not in use.
+        :param number:
+        :return:
+        """
+        return 0 <= number < len(self.used) and not self.used[number]
+
+    def Lowest(self):
+        """
+        Returns the lowest free flight number, without allocating it. Raises ValueError if every number is in use.
+        :return:
+        """
+        while self.released and self.used[self.released[0]]:  # Drop numbers reserved since their release
+            heapq.heappop(self.released)
+        if self.released:
+            return self.released[0]
+        while self.nextNumber < len(self.used) and self.used[self.nextNumber]:
+            self.nextNumber += 1
+        if self.nextNumber == len(self.used):
+            raise ValueError(f"Airline {self.airlineCode} has no free flight numbers, all {len(self.used)} are in use")
+        return self.nextNumber
+
+    def Allocate(self):
+        """
+        Allocates and returns the lowest free flight number. Raises ValueError if every number is in use.
+        :return:
+        """
+        number = self.Lowest()
+        self.Reserve(number)
+        return number
+
+    def Reserve(self, number):
+        """
+        Marks `number` as in use by one more flight, such as the number of a flight read from file or entered by the
+        user. Numbers outside of the airline's flight numbers are ignored.
+        :param number:
+        :return:
+        """
+        if 0 <= number < len(self.used):
+            if not self.used[number]:
+                self.numUsed += 1
+            self.used[number] += 1
+
+    def Release(self, number):
+        """
+        Releases `number` from one of the flights using it, such as when the flight lands. The number is free once more
+        when no flight is using it.
+        :param number:
+        :return:
+        """
+        if 0 <= number < len(self.used) and self.used[number]:
+            self.used[number] -= 1
+            if not self.used[number]:
+                self.numUsed -= 1
+                if number < self.nextNumber:
+                    heapq.heappush(self.released, number)
+
+
+class FlightGenerator:
+    """
+    FlightGenerator constructs random, valid flights for a Simulation in bulk, from its airline/aircraft catalog and
+    airports, such as to build load scenarios of many flights. Every random value is drawn column by column from a
+    `random.Random` seeded with `seed`, so generators with the same seed construct the same flights (whether or not
+    NumPy is installed), and successive batches of a generator continue the same random sequence.
+
+    The values are chosen as those of the Create Flight screen: a random airline and one of its aircraft, distinct
+    origin and destination airports, a departure on a 15 minute boundary, a distance between 1200 and 3500, and a 30%
+    chance of travelling at 95% speed. The flights of each airline are given its lowest free flight numbers by the
+    Simulation's FlightNumberAllocators, so that flight codes remain unique.
+    """
+    def __init__(self, simulation, seed=DEFAULT_GENERATOR_SEED):
+        self.simulation = simulation
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    @staticmethod
+    def TimetableTimes(departTime, distance, speed):
+        """
+        Returns the approximate arrival time of a flight departing at `departTime` (in seconds since midnight) to
+        travel `distance` at `speed`, and its timetabled arrival time: the end of the 15 minute window the approximate
+        arrival time is in (13:32:00 -> 13:45:00).
+        :param departTime:
+        :param distance:
+        :param speed:
+        :return:
+        """
+        appxHours = distance / int(speed)
+        appxMins = (appxHours - int(appxHours)) * 60
+        appxSeconds = (appxMins - int(appxMins)) * 60
+        appxFlightTime = int(appxHours) * 3600 + int(appxMins) * 60 + int(appxSeconds)
+        appxArriveTime = (departTime + appxFlightTime) % DAY_SECONDS  # remove days value to retain 24hr time
+        return appxArriveTime, (appxArriveTime // (15 * 60) + 1) * 15 * 60 % DAY_SECONDS
+
+    def Generate(self, numFlights):
+        """
+        Constructs `numFlights` random flights and adds them to the Simulation, returning the list of new Flights. The
+        values of every flight are stored within the Simulation's FlightTable in one operation per column. Airlines
+        without any aircraft are never chosen. Raises ValueError, without adding any flights, if an airline runs out of
+        flight numbers.
+        :param numFlights:
+        :return:
+        """
+        simulation = self.simulation
+        if numFlights < 0 or not simulation.HasCapacity(numFlights):
+            raise ValueError(f"Cannot add {numFlights} flights to a Simulation of {simulation.numFlights} flights, "
+                             f"limited to {simulation.maxFlights}")
+        airlines = [airline for airline in simulation.airlines if airline.aircraft]
+        if len(simulation.airportNames) < 2 or not airlines:
+            raise ValueError("Flights can only be generated with at least two airports and one airline with aircraft")
+        rand = self.random
+        # Aircraft of each airline, in the order the airline lists them
+        aircraftLists = [list(airline.aircraft.values()) for airline in airlines]
+        numAirports = len(simulation.airportNames)
+
+        # Draw each random value of every flight, one column at a time
+        airlineIndexes = rand.choices(range(len(airlines)), k=numFlights)
+        aircraftIndexes = [int(rand.random() * len(aircraftLists[airline])) for airline in airlineIndexes]
+        origins = rand.choices(range(numAirports), k=numFlights)
+        # Destination is offset from the origin by 1 to numAirports - 1 airports, so the two are always distinct
+        destinations = [(origin + offset) % numAirports
+                        for origin, offset in zip(origins, rand.choices(range(1, numAirports), k=numFlights))]
+        departTimes = [slot * 15 * 60 for slot in rand.choices(range(24 * 4), k=numFlights)]
+        distances = rand.choices(range(1200, 3501), k=numFlights)
+        lateChances = rand.choices(range(101), k=numFlights)
+
+        # Each airline's flights take its lowest free flight numbers, which are released again should any run out
+        allocators = [simulation.FlightNumbers(airline.code) for airline in airlines]
+        numbers = []
+        try:
+            for airline in airlineIndexes:
+                numbers.append(allocators[airline].Allocate())
+        except ValueError:
+            for airline, number in zip(airlineIndexes, numbers):
+                allocators[airline].Release(number)
+            raise
+        fliNums = [f"{number:04}" for number in numbers]
+
+        # Timetable values of each flight, computed with the aircraft's speed before any delay is applied
+        speeds = [aircraftLists[airline][aircraft].speed for airline, aircraft in zip(airlineIndexes, aircraftIndexes)]
+        times = [self.TimetableTimes(*values) for values in zip(departTimes, distances, speeds)]
+        arriveTimes = [arrive for _, arrive in times]
+        speeds = [round(speed * 0.95, 2) if chance <= 30 else speed for speed, chance in zip(speeds, lateChances)]
+        firstRow = simulation.flightTable.AppendColumns(numFlights, {
+            'speed': speeds, 'distance': distances, 'departTime': departTimes, 'arriveTime': arriveTimes,
+            # Since programTime operates in 24hr loop, arrival time can be < departure time
+            'trueArrive': [arrive + DAY_SECONDS if arrive < depart else arrive
+                           for depart, arrive in zip(departTimes, arriveTimes)],
+            'appxArriveTime': [appxArrive for appxArrive, _ in times], 'delayTime': [0] * numFlights,
+            'hasDeparted': [False] * numFlights,
+            # if program time has already passed the departure time, flight scheduled to depart next day
+            'isDeparting': [depart > simulation.programTime for depart in departTimes]})
+
+        flights = []
+        airportNames = simulation.airportNames
+        for row, fliNum, airline, aircraft, origin, destination in zip(
+                range(firstRow, firstRow + numFlights), fliNums, airlineIndexes, aircraftIndexes, origins,
+                destinations):
+            name, code = airlines[airline].name, airlines[airline].code
+            flightDetails = (fliNum, f"{code}{fliNum}", airportNames[origin], airportNames[destination])
+            flights.append(Flight.ViewTableRow(flightDetails, (aircraftLists[airline][aircraft].name, name, code),
+                                               simulation.flightColumns, simulation.flightTable, row))
+        simulation.AddFlights(flights, reserveNumbers=False)  # Their numbers were reserved when allocated
+        return flights
+
+
+class Simulation:
+    """
+    Simulation is the engine of the program. It owns all Flights and Airports, the airline data, and the programTime,
+    alongside performing the tick logic which advances programTime and updates flight values. All times are held as
+    whole seconds: `simulationTime` increases monotonically, with `programTime` being its time of day.
+
+    Data is read from the `ongoingFlights.txt` and `AirportsAirlines.txt` files (or the given file names) upon
+    construction, with the flights file being either text (see `FlightFileReader`) or a binary snapshot (see
+    `FlightSnapshot`). The Simulation does not require a GUI - the Main window is a client of the Simulation, and
+    simulations may also be run from the command line through `RunCommandLine`.
+
+    `maxFlights` limits the number of ongoing flights which can be added to the Simulation (see `HasCapacity`). Flights
+    read from file are always loaded, unless they are not selected by the `flightFilter` (see `FlightFilter`).
+
+    With `journal` set, every change to the flights and airports is kept in a FlightJournal alongside the flights file,
+    with a compacted checkpoint written every `checkpointRecords` records. Should the journal of a previous run remain
+    (such as after a crash), the Simulation is recovered from it upon construction (see `ReplayJournal`).
+
+    Given `progress`, the progress of reading the files is reported by calling `progress(stage, fraction)` every
+    FILE_PROGRESS_INTERVAL flights, with a fraction of None when the progress of a stage is unknown. The Simulation may
+    be constructed upon a worker thread, with the reports passed to another thread (see `BackgroundTask`).
+    """
+    def __init__(self, allFlightsFileName="ongoingFlights.txt", airportsAirlinesFileName="AirportsAirlines.txt",
+                 maxFlights=DEFAULT_MAX_FLIGHTS, flightFilter=None, journal=False, progress=None):
+        if journal and flightFilter is not None:
+            raise ValueError("A flight journal cannot be kept for a filtered Simulation")
+        # Confirm that the file paths exist, else construct them with default data
+        self.allFlightsFileName = self.ConstructFile(allFlightsFileName)
+        self.airportsAirlinesFileName = self.ConstructFile(airportsAirlinesFileName)
+
+        self.snapshotFormat = FlightSnapshot.IsSnapshot(self.allFlightsFileName)  # Flights file is a binary snapshot
+        self.allFlights = FlightSet()
+        self.maxFlights = maxFlights
+        self.flightTable = FlightTable()  # Values of ongoing flights
+        self.landedFlightTable = FlightTable()  # Values of landed flights, which are no longer updated
+        self.scheduler = EventScheduler()  # Upcoming departures and landings of ongoing flights
+        self.journal = None  # FlightJournal of changes since the files were read or written, if kept
+        self.journalFileName = f"{self.allFlightsFileName}.journal"
+        self.checkpointRecords = DEFAULT_CHECKPOINT_RECORDS
+        self.autosave = None  # Autosave to checkpoints of the journal, if started
+        self.landings = None  # (time, flight code, destination) of each landing since last collected, if collected
+        self.flightFilter = flightFilter  # FlightFilter selecting the flights read, if filtered
+        self.filePositions = [] if flightFilter is not None else None  # Position in file of each filtered flight
+        self.flightNumbers = {}  # FlightNumberAllocator of each airline code, see FlightNumbers
+        self.instrumentation = Instrumentation()  # Timings of ticks, saves and journal flushes, and their counts
+        self.tickTimes = self.instrumentation.Timing('Tick')  # Histograms recorded within every tick
+        self.landingsPerTick = self.instrumentation.Samples('Landings per Tick')
+
+        # A remaining journal is recovered by reading its base files, and then replaying its records
+        recovered = FlightJournal.Recover(self.journalFileName) if journal else None
+        flightsFileName, airportsAirlinesFileName = (recovered[0]['baseFiles'] if recovered is not None else
+                                                     (self.allFlightsFileName, self.airportsAirlinesFileName))
+
+        # Read the program time, data search terms and flights from file, in a single pass
+        reader = FlightSnapshot if FlightSnapshot.IsSnapshot(flightsFileName) else FlightFileReader
+        with reader(flightsFileName) as flightsFile:
+            # Simulation time is the number of seconds since midnight on the day the simulation began, and never wraps
+            self.simulationTime = flightsFile.programTime
+            self.programTime = self.simulationTime
+            self.flightTable.time = self.simulationTime
+            self.dataSearchTerms = flightsFile.dataSearchTerms
+            self.flightColumns = FlightColumns(self.dataSearchTerms)  # Getters for the value of each search term
+            for flight in flightsFile.Flights(self.flightColumns, self.flightTable, flightFilter, self.filePositions):
+                self.allFlights.Add(flight)
+                numRead = len(self.allFlights)
+                if progress is not None and numRead % FILE_PROGRESS_INTERVAL == 0:
+                    progress(f"Reading flights: {numRead} read", flightsFile.Progress(numRead))
+
+        # Construct Airports and get Airline Data from file:
+        # gets 1st line from file, remove \n, # chars, split into a list of airport names
+        if progress is not None:
+            progress("Reading airports and airlines", None)
+        with open(airportsAirlinesFileName, 'r') as file:
+            self.airlines = AirlineCatalog()  # Airlines and their aircraft, by airline name and code
+            for line in file:
+                if line[0] == '#':
+                    self.airportNames = line.strip()[1:].split(', ')
+                elif line.strip():
+                    self.airlines.Add(Airline.FromData(line.strip().split(', ')))
+
+        self.airports = []
+        self.airportsByName = {}
+        for airport in self.airportNames:
+            # Create list of airport objects
+            self.airports.append(Airport(airport))
+            self.airportsByName[airport] = self.airports[-1]
+
+        for numScheduled, flight in enumerate(self.allFlights, 1):
+            self.ReserveFlightNumber(flight)
+            self.AssignAirports(flight)
+            self.ScheduleFlight(flight)
+            if progress is not None and numScheduled % FILE_PROGRESS_INTERVAL == 0:
+                progress(f"Scheduling flights: {numScheduled} of {len(self.allFlights)}",
+                         numScheduled / len(self.allFlights))
+        self.searchIndex = FlightSearchIndex(self.flightColumns, self.allFlights)  # Indexes ongoing flights
+        if journal:
+            if progress is not None and recovered is not None:
+                progress("Recovering changes from the flight journal", None)
+            self.StartJournal(recovered)
+
+    @staticmethod
+    def ConstructFile(fileName):
+        """
+        This function will determine if a file already exists for a path, given by a string parameter. If the file is
+        not found, then the program will construct new files with default data entered into them. This data can then be
+        used to continue normal use of the program.
+        :param fileName:
+        :return:
+        """
+        if os.path.exists(fileName):  # Tests if file path exists.
+            return fileName
+        else:  # File path not found
+            print(f"Essential file: {fileName} NOT in local space. Ensure file has accessible presence in local space.")
+            print("File will be constructed using default data in program.")
+            # Determine which file is being constructed, and hence what data
+            if os.path.basename(fileName) == "AirportsAirlines.txt":
+                defaultAirportsString = "#East Midlands Airport, Heathrow Airport, Birmingham International Airport\n"
+                defaultAirlineString = ("BritishAirways, BA, Boeing787-9, Airbus A350-1000, Airbus A380-800, Embraer "
+                                        "190-BA, 1050, 905, 1086, 870")
+                with open(fileName, 'w') as file:
+                    file.write(defaultAirportsString)
+                    file.write(defaultAirlineString)
+            elif os.path.basename(fileName) == "ongoingFlights.txt":
+                defaultProgramTime = "#07:30:00"
+                with open(fileName, 'w') as file:
+                    file.write(DEFAULT_FLIGHTS_FILE_HEADER)
+                    file.write(defaultProgramTime)
+            return fileName
+
+    def AdvanceProgramTime(self, seconds):
+        """
+        Advances the simulation time by the given number of seconds. The programTime follows the simulation time,
+        wrapping back to 00:00:00 at 24:00:00.
+        :param seconds:
+        :return:
+        """
+        self.simulationTime += seconds
+        self.flightTable.time = self.simulationTime
+        # Remove days value to keep to 24hr time only
+        self.programTime = self.simulationTime % DAY_SECONDS
+
+    def ScheduleFlight(self, flight):
+        """
+        Schedules the next event of an ongoing flight, determined from the simulation time and the flight's status:
+        departed flights are scheduled to land, and departing flights depart when the next flight window begins (or
+        immediately if currently within it, flying from the window's start if it began the previous day). Flights which
+        are not departing wait for the end of the current flight window before departing in the next one.
+        :param flight:
+        :return:
+        """
+        time = self.simulationTime
+        if flight.hasDeparted:  # Continue flight from the current time
+            flight.Depart(time, flight.LatestDepartureTime(time))
+            self.scheduler.Schedule(flight.landingTime, EventScheduler.LAND, flight)
+        elif flight.InFlightWindow(time % DAY_SECONDS):
+            if flight.isDeparting:
+                windowStart = flight.LatestDepartureTime(time)
+                # A window which began the previous day is flown from its start, otherwise depart immediately
+                flight.Depart(windowStart if windowStart < time - time % DAY_SECONDS else time, windowStart)
+                self.scheduler.Schedule(flight.landingTime, EventScheduler.LAND, flight)
+            else:  # Has already missed the start of this flight window
+                self.scheduler.Schedule(flight.WindowEndTime(time) + 1, EventScheduler.READY, flight)
+        else:
+            flight.isDeparting = True
+            self.scheduler.Schedule(flight.NextDepartureTime(time), EventScheduler.DEPART, flight)
+
+    def AssignAirports(self, flight):
+        """
+        Adds a flight to the outbound flights of its Origin airport and the inbound flights of its Destination airport,
+        found by name.
+        :param flight:
+        :return:
+        """
+        for airportName in (flight.fliOrigin, flight.fliDestination):
+            airport = self.airportsByName.get(airportName)
+            if airport is not None:
+                airport.AddFlight(flight)
+
+    def FlightNumbers(self, airlineCode):
+        """
+        Returns the FlightNumberAllocator of the airline with the given code, constructing it if not yet used.
+        :param airlineCode:
+        :return:
+        """
+        allocator = self.flightNumbers.get(airlineCode)
+        if allocator is None:
+            allocator = self.flightNumbers[airlineCode] = FlightNumberAllocator(airlineCode)
+        return allocator
+
+    def ReserveFlightNumber(self, flight):
+        """
+        Marks the flight number of an ongoing flight as in use by its airline.
+        :param flight:
+        :return:
+        """
+        if flight.fliNum.isdigit():
+            self.FlightNumbers(flight.alCode).Reserve(int(flight.fliNum))
+
+    def ReleaseFlightNumber(self, flight):
+        """
+        Frees the flight number of a flight which is no longer ongoing, so that it may be given to a new flight.
+        :param flight:
+        :return:
+        """
+        if flight.fliNum.isdigit():
+            self.FlightNumbers(flight.alCode).Release(int(flight.fliNum))
+
+    @property
+    def numFlights(self):
+        """
+        The number of ongoing flights.
+        :return:
+        """
+        return len(self.allFlights)
+
+    def HasCapacity(self, numFlights=1):
+        """
+        Returns True if `numFlights` more flights can be added without exceeding maxFlights ongoing flights.
+        :param numFlights:
+        :return:
+        """
+        return len(self.allFlights) + numFlights <= self.maxFlights
+
+    def AddFlight(self, flight, reserveNumber=True):
+        """
+        Adds a newly constructed flight to the simulation, reserving its flight number, assigning it to its Origin and
+        Destination airports and scheduling its departure. The number is not reserved with `reserveNumber` False, for
+        flights whose numbers have already been allocated (see FlightGenerator), as each reservation is released by a
+        landing.
+        :param flight:
+        :param reserveNumber:
+        :return:
+        """
+        if self.journal is not None:
+            self.journal.RecordFlight(FlightJournal.CREATE, self.simulationTime, flight, *map(str, flight.GetRow()))
+        self.allFlights.Add(flight)
+        if reserveNumber:
+            self.ReserveFlightNumber(flight)
+        self.AssignAirports(flight)
+        self.ScheduleFlight(flight)
+        self.searchIndex.Add(flight)
+
+    def AddFlights(self, flights, reserveNumbers=True):
+        """
+        Adds many newly constructed flights to the simulation, such as those of a FlightGenerator (see AddFlight).
+        :param flights:
+        :param reserveNumbers:
+        :return:
+        """
+        for flight in flights:
+            self.AddFlight(flight, reserveNumbers)
+
+    def AddAirport(self, airport):
+        """
+        Adds a newly constructed airport to the simulation.
+        :param airport:
+        :return:
+        """
+        if self.journal is not None:
+            self.journal.Record(FlightJournal.ADD_AIRPORT, self.simulationTime, airport.name)
+        self.airports.append(airport)
+        self.airportNames.append(airport.name)
+        self.airportsByName[airport.name] = airport
+
+    def RemoveAirport(self, airportName):
+        """
+        Removes the airport with the given name from the simulation.
+        :param airportName:
+        :return:
+        """
+        if self.journal is not None:
+            self.journal.Record(FlightJournal.REMOVE_AIRPORT, self.simulationTime, airportName)
+        airport = self.airportsByName.pop(airportName)
+        self.airports.remove(airport)
+        self.airportNames.remove(airportName)
+
+    def LandFlight(self, flight):
+        """
+        Lands a single flight (see LandFlights).
+        :param flight:
+        :return:
+        """
+        self.LandFlights([flight])
+
+    def LandFlights(self, flights):
+        """
+        Lands ongoing flights, removing them from their respective airports' inbound and outbound flights, and moving
+        them into the landedFlights of their Destination Airports.
+
+        The flights are then removed from allFlights and moved to the landedFlightTable, so that they are no longer
+        ongoing and to permit more flights to be made (up to maxFlights ongoing flights). Each step uses the flight's
+        own airport references, so landing a flight does not depend upon the number of airports or flights, whilst the
+        values of the flights are landed and moved in one operation per column of the FlightTable.
+        :param flights:
+        :return:
+        """
+        rows = [flight.row for flight in flights]
+        self.flightTable.LandRows(rows)
+        for flight in flights:
+            if flight.destinationAirport is not None and flight in flight.destinationAirport.inboundFlights:
+                flight.destinationAirport.inboundFlights.Remove(flight)
+                flight.destinationAirport.landedFlights.Add(flight)
+            if flight.originAirport is not None:
+                flight.originAirport.outboundFlights.Remove(flight)
+            self.allFlights.Remove(flight)  # Remove from allFlights
+            self.ReleaseFlightNumber(flight)
+            self.searchIndex.Remove(flight)
+        self.flightTable.MoveRows(rows, self.landedFlightTable)
+
+    def UpdateFlights(self):
+        """
+        Processes every departure, landing and ready event which has become due since the last update. Flights which
+        depart have their landing scheduled, and flights which land are removed from the simulation together once every
+        event has been processed (see LandFlights). Departures and landings are recorded in the journal, which is
+        flushed once its flush interval has passed.
+        :return:
+        """
+        journal = self.journal
+        landedFlights = []
+        numEvents = 0
+        for eventTime, kind, flight in self.scheduler.PopDue(self.simulationTime):
+            numEvents += 1
+            if kind == EventScheduler.DEPART:
+                flight.Depart(eventTime, eventTime)
+                self.scheduler.Schedule(flight.landingTime, EventScheduler.LAND, flight)
+                if journal is not None:
+                    journal.RecordFlight(FlightJournal.DEPART, self.simulationTime, flight,
+                                         eventTime + journal.timeOffset)
+            elif kind == EventScheduler.LAND:
+                landedFlights.append(flight)
+                if journal is not None:
+                    journal.RecordFlight(FlightJournal.LAND, self.simulationTime, flight)
+                if self.landings is not None:
+                    self.landings.append((float(eventTime), flight.fliCode, flight.fliDestination))
+            else:  # Flight window has ended, so the flight departs within the next one
+                flight.isDeparting = True
+                self.scheduler.Schedule(flight.NextDepartureTime(eventTime), EventScheduler.DEPART, flight)
+        if landedFlights:
+            self.LandFlights(landedFlights)
+        self.landingsPerTick.Record(len(landedFlights))
+        if numEvents:
+            self.instrumentation.Count('Flights Updated', numEvents)
+        if journal is not None and journal.FlushDue():
+            self.FlushJournal()
+        if self.autosave is not None:
+            self.autosave.Update()
+
+    def StartJournal(self, recovered=None):
+        """
+        Begins keeping a journal of changes. Given the (header, records) of a recovered journal, the records are first
+        replayed and the journal is then continued, otherwise a new journal following on from the program files is
+        created.
+        :param recovered:
+        :return:
+        """
+        if recovered is None:
+            self.journal = FlightJournal.Create(self.journalFileName,
+                                                (self.allFlightsFileName, self.airportsAirlinesFileName),
+                                                self.simulationTime)
+            self.journal.NumberFlights(self.allFlights)  # In the order they were read from the program files
+            return
+        header, records = recovered
+        timeOffset = header['baseTime'] - self.simulationTime
+        flightsById = self.ReplayJournal(records, -timeOffset)
+        self.journal = FlightJournal(self.journalFileName, header, timeOffset, len(records))
+        self.journal.NumberFlights(flightsById, self.allFlights)
+        print(f"Flight journal: recovered {len(records)} changes from {self.journalFileName}.")
+
+    def ReplayJournal(self, records, timeOffset=0):
+        """
+        Reapplies the records of a journal to a Simulation read from the journal's base files, with `timeOffset` added
+        to the times of the records. The simulation is advanced to the time of each record in turn, such that the
+        flights depart and land as they did originally; departures and landings which are recorded but have not
+        occurred are then applied directly. Returns the list of flights by their id within the journal (see
+        `FlightJournal`), the flights read from the base files being numbered in the order they were read.
+        :param records:
+        :param timeOffset:
+        :return:
+        """
+        flightsById = list(self.allFlights)
+        for kind, recordTime, *values in records:
+            recordTime += timeOffset
+            if recordTime > self.simulationTime:
+                self.AdvanceProgramTime(recordTime - self.simulationTime)
+                self.UpdateFlights()
+            if kind == FlightJournal.CREATE:
+                flight = Flight(values[:6], values[6:9], values[9:], self.flightColumns, self.flightTable)
+                flightsById.append(flight)
+                self.AddFlight(flight)
+            elif kind == FlightJournal.ADD_AIRPORT:
+                self.AddAirport(Airport(values[0], self.allFlights))
+            elif kind == FlightJournal.REMOVE_AIRPORT and values[0] in self.airportsByName:
+                self.RemoveAirport(values[0])
+            elif kind in (FlightJournal.DEPART, FlightJournal.LAND):
+                flight = flightsById[values[0]] if 0 <= values[0] < len(flightsById) else None
+                if flight is None or flight not in self.allFlights:
+                    continue
+                if kind == FlightJournal.LAND:
+                    self.scheduler.Cancel(flight)
+                    self.LandFlight(flight)
+                elif not flight.hasDeparted:
+                    departTime = values[1] + timeOffset
+                    flight.Depart(departTime, departTime)
+                    self.scheduler.Schedule(flight.landingTime, EventScheduler.LAND, flight)
+        return flightsById
+
+    def FlushJournal(self):
+        """
+        Records the simulation time and writes all pending records to the journal. Once the journal holds
+        checkpointRecords records, a compacted checkpoint is written in its place (see Checkpoint), unless an autosave
+        is being written, which will compact the journal once complete.
+        :return:
+        """
+        self.journal.Record(FlightJournal.TIME, self.simulationTime)
+        with self.instrumentation.Timer('Journal Flush'):
+            self.journal.Flush()
+        if self.journal.numRecords >= self.checkpointRecords and (self.autosave is None or not self.autosave.Busy()):
+            self.Checkpoint()
+
+    def Checkpoint(self):
+        """
+        Writes a compacted checkpoint of the ongoing flights (as a snapshot) and the airports, and starts a new, empty
+        journal following on from it. Checkpoints alternate between two slots, so the checkpoint named by the current
+        journal is never overwritten, and a crash whilst checkpointing leaves the previous checkpoint and journal.
+        :return:
+        """
+        self.journal.Flush()
+        slot, baseFiles = self.NextCheckpoint()
+        state = self.CaptureState()
+        with self.instrumentation.Timer('Save'):
+            state.WriteSnapshot(baseFiles[0])
+        state.WriteAirportsAirlines(baseFiles[1])
+        for fileName in baseFiles:
+            FlightJournal.SyncFile(fileName)
+        self.journal = self.journal.Rebase(baseFiles, self.simulationTime, state.BaseFlights(), slot)
+
+    def NextCheckpoint(self):
+        """
+        Returns the checkpoint slot not named by the journal, and its (flights, airports) file names, to which the next
+        checkpoint is written.
+        :return:
+        """
+        slot = 1 if self.journal.header['checkpointSlot'] == 0 else 0
+        baseFiles = (f"{self.allFlightsFileName}.checkpoint{slot}", f"{self.airportsAirlinesFileName}.checkpoint{slot}")
+        return slot, baseFiles
+
+    def CloseJournal(self, discard=False):
+        """
+        Flushes and closes the journal, such that it is recovered when the files are next read. With `discard`, the
+        journal and its checkpoints are instead removed, discarding any changes not saved to the program files.
+        :param discard:
+        :return:
+        """
+        if self.journal is None:
+            return
+        self.journal.Close()
+        self.journal = None
+        if discard:
+            for fileName in (self.journalFileName, *(f"{name}.checkpoint{slot}" for slot in (0, 1) for name in
+                                                     (self.allFlightsFileName, self.airportsAirlinesFileName))):
+                if os.path.exists(fileName):
+                    os.remove(fileName)
+
+    def StartAutosave(self, interval=DEFAULT_AUTOSAVE_INTERVAL):
+        """
+        Begins autosaving to checkpoints of the journal every `interval` real seconds (see Autosave). Raises ValueError
+        if no journal is kept, as the autosaves would never be recovered.
+        :param interval:
+        :return:
+        """
+        if self.journal is None:
+            raise ValueError("Autosave requires a flight journal, see Simulation(journal=True)")
+        self.StopAutosave()
+        self.autosave = Autosave(self, interval)
+
+    def StopAutosave(self):
+        """
+        Stops autosaving, first completing any autosave being written.
+        :return:
+        """
+        if self.autosave is not None:
+            self.autosave.Wait()
+            self.autosave = None
+
+    def Step(self, seconds):
+        """
+        Performs a single tick of the simulation: programTime is advanced by `seconds`, and then all flights updated.
+        The duration of the tick is recorded within the 'Tick' timing.
+        :param seconds:
+        :return:
+        """
+        startTime = time.perf_counter()
+        self.AdvanceProgramTime(seconds)
+        self.UpdateFlights()
+        self.tickTimes.Record(time.perf_counter() - startTime)
+
+    def Seek(self, time):
+        """
+        Advances the simulation directly to the simulation time `time` in a single step. Departures and landings occur
+        at their own event times, and the values of departed flights are computed from their departure (see
+        `FlightStateAt`), so the resulting state is the same as when advancing in ticks of any size. Seeking backwards
+        raises ValueError, as landed flights have left the simulation - the states of the ongoing flights at an earlier
+        time may be computed with `FlightTable.StatesAt` instead.
+        :param time:
+        :return:
+        """
+        if time < self.simulationTime:
+            raise ValueError(f"Cannot seek back to {time} from simulation time {self.simulationTime}")
+        self.Step(time - self.simulationTime)
+
+    def Run(self, hours, step=1, tickRate=0):
+        """
+        Advances the simulation by the given number of simulated hours, in ticks of `step` simulated seconds. With a
+        tickRate of 0 the ticks are performed as fast as possible, otherwise `tickRate` ticks are performed per real
+        second. Returns the number of ticks performed.
+        :param hours:
+        :param step:
+        :param tickRate:
+        :return:
+        """
+        remaining = int(hours * 60 * 60)
+        ticks = 0
+        startTime = time.monotonic()
+        while remaining > 0:
+            seconds = min(step, remaining)
+            self.Step(seconds)
+            remaining -= seconds
+            ticks += 1
+            if tickRate > 0:  # Wait until the next tick is due
+                time.sleep(max(0.0, startTime + ticks / tickRate - time.monotonic()))
+        return ticks
+
+    def CaptureState(self, copyValues=False):
+        """
+        Returns a SimulationState of the values written to the program files. With `copyValues`, the FlightTable is
+        copied alongside the lists of flights and airports (see `FlightTable.Copy`), so that the state may be written
+        whilst the Simulation continues. No flight values are computed whilst capturing.
+        :param copyValues:
+        :return:
+        """
+        flights, flightTable, rows = self.allFlights, None, None
+        if copyValues:
+            flights = list(self.allFlights)
+            rows = [flight.row for flight in flights]
+            flightTable = self.flightTable.Copy()
+        return SimulationState(self.dataSearchTerms, self.flightColumns, self.programTime, flights,
+                               list(self.airportNames), self.airlines.GetData(),
+                               flightTable, rows)
+
+    def SaveFlights(self, fileName=None):
+        """
+        Writes the programTime and all ongoing (non-landed) flights to the ongoing flights file, or to `fileName` if
+        given. Flights are written organised by timetabled arrival time.
+        :param fileName:
+        :return:
+        """
+        fileName = self.OutputFileName(fileName, self.allFlightsFileName, self.flightFilter)
+        with self.instrumentation.Timer('Save'):
+            self.CaptureState().WriteFlights(fileName)
+
+    def SaveSnapshot(self, fileName=None):
+        """
+        Writes the programTime and all ongoing (non-landed) flights to a snapshot file (see `FlightSnapshot`), being the
+        ongoing flights file or `fileName` if given. Flights are written organised by timetabled arrival time.
+        :param fileName:
+        :return:
+        """
+        fileName = self.OutputFileName(fileName, self.allFlightsFileName, self.flightFilter)
+        with self.instrumentation.Timer('Save'):
+            self.CaptureState().WriteSnapshot(fileName)
+
+    def SaveAirportsAirlines(self, fileName=None):
+        """
+        Writes the airport names and airline data to the airports and airlines file, or to `fileName` if given.
+        :param fileName:
+        :return:
+        """
+        self.CaptureState().WriteAirportsAirlines(fileName or self.airportsAirlinesFileName)
+
+    @staticmethod
+    def OutputFileName(fileName, allFlightsFileName, flightFilter):
+        """
+        Returns the file flights are saved to: `fileName` if given, otherwise the flights file they were read from.
+        Raises ValueError if the flights were read with a FlightFilter and would be saved over the flights file they
+        were read from, as every flight not selected by the filter would be lost from it.
+        :param fileName:
+        :param allFlightsFileName:
+        :param flightFilter:
+        :return:
+        """
+        if flightFilter is not None and (fileName is None or
+                                         os.path.abspath(fileName) == os.path.abspath(allFlightsFileName)):
+            raise ValueError(f"Filtered flights cannot be saved over {allFlightsFileName}, which holds every flight; "
+                             f"save them to another file")
+        return fileName or allFlightsFileName
+
+    def SaveFiles(self, progress=None):
+        """
+        Updates both program files with the current state of the Simulation, with the flights file kept in the format it
+        was read in. Each file is written in full to a temporary file which then replaces it, so a crash whilst saving
+        never leaves a partly written program file (see `SimulationState.WriteFiles`). Any autosave being written is
+        completed first, and when a journal is kept, a new journal is then started from the updated files. Raises
+        ValueError for a filtered Simulation (see `OutputFileName`). Progress is reported through
+        `progress(stage, fraction)`, if given.
+        :param progress:
+        :return:
+        """
+        if self.autosave is not None:
+            if progress is not None and self.autosave.Busy():
+                progress("Completing autosave", None)
+            self.autosave.Wait()
+        allFlightsFileName = self.OutputFileName(None, self.allFlightsFileName, self.flightFilter)
+        state = self.CaptureState()
+        with self.instrumentation.Timer('Save'):
+            state.WriteFiles(allFlightsFileName, self.airportsAirlinesFileName, self.snapshotFormat, progress)
+        if self.journal is not None:
+            self.journal = self.journal.Rebase((self.allFlightsFileName, self.airportsAirlinesFileName),
+                                               self.simulationTime, state.BaseFlights())
+
+
+class Histogram:
+    """
+    Histogram counts values, such as the durations of ticks, into buckets bounded above by `bounds` (with a final bucket
+    for larger values), alongside their count, total, maximum and last value. Recording a value is a single bisect, so
+    Histograms may be kept upon hot paths.
+    """
+    def __init__(self, bounds=DURATION_BUCKETS):
+        self.bounds = bounds
+        self.Reset()
+
+    def Reset(self):
+        """
+        Discards every value recorded.
+        :return:
+        """
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+        self.last = 0
+
+    def Record(self, value):
+        """
+        Records a value within the bucket of the lowest bound it does not exceed.
+        :param value:
+        :return:
+        """
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self):
+        """
+        Mean of the values recorded, or 0 if none have been.
+        :return:
+        """
+        return self.total / self.count if self.count else 0
+
+    def Percentile(self, percent):
+        """
+        Returns an upper estimate of the given percentile of the values recorded: the bound of the bucket holding it,
+        or the maximum should that be lower.
+        :param percent:
+        :return:
+        """
+        target = self.count * percent / 100
+        seen = 0
+        for bound, numValues in zip(self.bounds, self.buckets):
+            seen += numValues
+            if numValues and seen >= target:
+                return min(bound, self.maximum)
+        return self.maximum
+
+
+class Instrumentation:
+    """
+    Instrumentation keeps the timings and counters of each part of the simulation and GUI, so that the time spent
+    simulating, drawing and reading or writing files can be told apart. `timings` are Histograms of durations in
+    seconds, recorded with `Record`, `Timer` or `Timed`; `samples` are Histograms of counts per event (such as the
+    landings of each tick), recorded with `Sample`; and `counters` are running totals, incremented with `Count`.
+
+    Optionally, `StartProfile` captures a cProfile of every call and a tracemalloc trace of memory allocations until
+    `StopProfile`, which returns a report of both.
+    """
+    def __init__(self):
+        self.timings = {}
+        self.samples = {}
+        self.counters = {}
+        self.profile = None  # cProfile.Profile whilst profiling
+
+    def Timing(self, name):
+        """
+        Returns the Histogram of the timing `name`, constructing it if needed. Hot paths may keep the Histogram to
+        record durations within it directly.
+        :param name:
+        :return:
+        """
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Histogram(DURATION_BUCKETS)
+        return timing
+
+    def Samples(self, name):
+        """
+        Returns the Histogram of the samples `name`, constructing it if needed.
+        :param name:
+        :return:
+        """
+        sample = self.samples.get(name)
+        if sample is None:
+            sample = self.samples[name] = Histogram(COUNT_BUCKETS)
+        return sample
+
+    def Record(self, name, duration):
+        """
+        Records a duration, in seconds, within the timing `name`.
+        :param name:
+        :param duration:
+        :return:
+        """
+        self.Timing(name).Record(duration)
+
+    def Sample(self, name, value):
+        """
+        Records a count of a single event, such as the number of landings within a tick, within the samples `name`.
+        :param name:
+        :param value:
+        :return:
+        """
+        self.Samples(name).Record(value)
+
+    def Count(self, name, amount=1):
+        """
+        Adds `amount` to the counter `name`.
+        :param name:
+        :param amount:
+        :return:
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextlib.contextmanager
+    def Timer(self, name):
+        """
+        Context manager recording the duration of its body within the timing `name`.
+        :param name:
+        :return:
+        """
+        startTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.Record(name, time.perf_counter() - startTime)
+
+    def Timed(self, name, function):
+        """
+        Returns a function which calls `function`, recording the duration of each call within the timing `name`.
+        :param name:
+        :param function:
+        :return:
+        """
+        def TimedFunction(*args, **kwargs):
+            with self.Timer(name):
+                return function(*args, **kwargs)
+        return TimedFunction
+
+    def Reset(self):
+        """
+        Discards the values of every timing, sample and counter. The Histograms themselves are kept, as hot paths may
+        hold them.
+        :return:
+        """
+        for histogram in (*self.timings.values(), *self.samples.values()):
+            histogram.Reset()
+        self.counters.clear()
+
+    def Summary(self):
+        """
+        Returns a single line summarising each timing (runs, and the mean, 95th percentile and maximum in
+        milliseconds), sample (mean and maximum) and counter, for logging periodically.
+        :return:
+        """
+        parts = [f"{name} {timing.count}x {timing.mean * 1000:.2f}/{timing.Percentile(95) * 1000:.2f}/"
+                 f"{timing.maximum * 1000:.2f} ms" for name, timing in self.timings.items()]
+        parts += [f"{name} {sample.mean:.1f} avg/{sample.maximum} max" for name, sample in self.samples.items()]
+        parts += [f"{name} {value}" for name, value in self.counters.items()]
+        return ' | '.join(parts)
+
+    def Report(self):
+        """
+        Returns a table of each timing and sample, with their bucket counts, followed by each counter.
+        :return:
+        """
+        lines = [f"{'Timing':<20}{'Runs':>8}{'Mean ms':>10}{'p95 ms':>10}{'Max ms':>10}{'Total s':>10}"]
+        for name, timing in self.timings.items():
+            lines.append(f"{name:<20}{timing.count:>8}{timing.mean * 1000:>10.2f}{timing.Percentile(95) * 1000:>10.2f}"
+                         f"{timing.maximum * 1000:>10.2f}{timing.total:>10.2f}")
+            labels = [f"<={bound * 1000:g}ms" for bound in timing.bounds] + [f">{timing.bounds[-1] * 1000:g}ms"]
+            lines.append('    ' + '  '.join(f"{label}:{numValues}" for label, numValues in zip(labels, timing.buckets)
+                                            if numValues))
+        lines.append('')
+        lines.append(f"{'Sample':<20}{'Events':>8}{'Mean':>10}{'p95':>10}{'Max':>10}{'Total':>10}")
+        for name, sample in self.samples.items():
+            lines.append(f"{name:<20}{sample.count:>8}{sample.mean:>10.2f}{sample.Percentile(95):>10}"
+                         f"{sample.maximum:>10}{sample.total:>10}")
+        lines.append('')
+        lines.extend(f"{name:<20}{value:>8}" for name, value in self.counters.items())
+        return '\n'.join(lines)
+
+    def StartProfile(self):
+        """
+        Begins capturing a cProfile of every call (upon this thread) and tracing memory allocations with tracemalloc.
+        :return:
+        """
+        if self.profile is not None:
+            return
+        tracemalloc.start()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def StopProfile(self, limit=PROFILE_REPORT_LIMIT):
+        """
+        Stops profiling, and returns a report of the `limit` functions with the greatest cumulative time and the `limit`
+        source lines which allocated the most memory still in use.
+        :param limit:
+        :return:
+        """
+        if self.profile is None:
+            return ''
+        self.profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(limit)
+        self.profile = None
+        lines = [stream.getvalue().strip(), '',
+                 f"Memory traced: {current / 1e6:.1f} MB in use, {peak / 1e6:.1f} MB peak. Largest allocations:"]
+        lines.extend(f"    {statistic}" for statistic in snapshot.statistics('lineno')[:limit])
+        return '\n'.join(lines)
+
+
+class ClockSubsystem:
+    """
+    ClockSubsystem is a callback run by a SimulationClock, at most once every `interval` real seconds, alongside its
+    time budget and the timings of its runs.
+    """
+    def __init__(self, name, callback, interval=0.0, budget=DEFAULT_CLOCK_STEP, skippable=False):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.budget = budget  # Real seconds the callback is expected to take, after which the frame is behind
+        self.skippable = skippable  # May be skipped whilst the clock is behind, such as a refresh of the display
+        self.nextTime = 0.0  # time.monotonic() at which the subsystem is next due
+        self.numRuns = 0
+        self.numSkips = 0
+        self.numOverruns = 0
+        self.skippedFrames = 0  # Frames skipped in a row
+        self.lastDuration = 0.0
+
+    def Run(self, now):
+        """
+        Runs the callback, timing it against the budget. Returns True if the budget was overrun.
+        :param now:
+        :return:
+        """
+        startTime = time.monotonic()
+        self.callback()
+        self.lastDuration = time.monotonic() - startTime
+        self.nextTime = now + self.interval
+        self.numRuns += 1
+        self.skippedFrames = 0
+        if self.lastDuration > self.budget:
+            self.numOverruns += 1
+            return True
+        return False
+
+
+class SimulationClock:
+    """
+    SimulationClock drives a Simulation in real time from a single timer, such as the Tk `after` loop of the GUI.
+    Each frame, the real time passed since the previous frame (by `time.monotonic`) is added to `lag`, and the
+    Simulation is advanced in fixed steps of `step` real seconds, each by `multiplier` simulated seconds per real
+    second. Fractions of a simulated second are carried to the next step, so simulated time follows real time however
+    late a frame is, and the next frame is timed from the remaining lag rather than after a fixed delay. At most
+    `maxCatchUpSteps` steps are performed within a frame: should a frame be later still (such as after the machine
+    slept, or whilst the steps take longer than the real time they cover), the remaining steps are dropped, so the
+    clock does not fall further behind trying to catch up and simulated time falls behind real time instead.
+
+    After the Simulation is advanced, the registered subsystems which are due (see Register) are run in the order they
+    were registered, each timed against its budget. A frame is behind when more than one step was due, or the steps or
+    a subsystem overran the frame; skippable subsystems, such as refreshes of the display, are then skipped until a
+    frame is not behind, for at most MAX_SKIPPED_FRAMES frames in a row. The duration of each frame and subsystem is
+    recorded by the Simulation's Instrumentation, alongside the frames behind and refreshes skipped.
+    """
+    def __init__(self, simulation, step=DEFAULT_CLOCK_STEP, multiplier=1, maxCatchUpSteps=MAX_CATCH_UP_STEPS):
+        self.simulation = simulation
+        self.step = step
+        self.multiplier = multiplier  # Simulated seconds per real second
+        self.maxCatchUpSteps = maxCatchUpSteps  # Steps performed within a frame, after which any others are dropped
+        self.subsystems = []  # ClockSubsystems, in the order they are run
+        self.lag = 0.0  # Real seconds which the Simulation has not yet been advanced by
+        self.simulatedLag = 0.0  # Fraction of a simulated second carried to the next step
+        self.lastTime = None  # time.monotonic() of the previous frame
+        self.after = None  # Schedules the next frame, see Start
+        self.numFrames = 0
+        self.numFramesBehind = 0
+        self.numDroppedSteps = 0
+
+    def Register(self, name, callback, interval=0.0, budget=DEFAULT_CLOCK_STEP, skippable=False):
+        """
+        Registers `callback` to be run after the Simulation is advanced, at most once every `interval` real seconds
+        (every frame for 0). Returns the ClockSubsystem.
+        :param name:
+        :param callback:
+        :param interval:
+        :param budget:
+        :param skippable:
+        :return:
+        """
+        subsystem = ClockSubsystem(name, callback, interval, budget, skippable)
+        self.subsystems.append(subsystem)
+        return subsystem
+
+    def Start(self, after):
+        """
+        Begins running frames, with `after(milliseconds, callback)` used to schedule each frame (such as Tk's `after`).
+        :param after:
+        :return:
+        """
+        self.after = after
+        self.lastTime = time.monotonic()
+        self.after(int(self.step * 1000), self.Frame)
+
+    def Stop(self):
+        """
+        Stops scheduling frames.
+        :return:
+        """
+        self.after = None
+
+    def Advance(self, elapsed):
+        """
+        Advances the Simulation by `elapsed` real seconds (alongside any lag remaining), in fixed steps. Beyond
+        maxCatchUpSteps steps, the whole steps remaining are dropped from the lag, and counted by the Simulation's
+        Instrumentation. Returns the number of steps performed.
+        :param elapsed:
+        :return:
+        """
+        self.lag += elapsed
+        steps = 0
+        while self.lag >= self.step:
+            if steps == self.maxCatchUpSteps:
+                droppedSteps = int(self.lag / self.step + 1e-9)  # Whole steps, allowing for float rounding
+                self.lag = max(0.0, self.lag - droppedSteps * self.step)
+                self.numDroppedSteps += droppedSteps
+                self.simulation.instrumentation.Count('Dropped Steps', droppedSteps)
+                break
+            self.lag -= self.step
+            self.simulatedLag += self.step * self.multiplier
+            seconds = int(self.simulatedLag + 1e-9)  # Whole simulated seconds, allowing for float rounding
+            if seconds > 0:
+                self.simulatedLag -= seconds
+                self.simulation.Step(seconds)
+            steps += 1
+        return steps
+
+    def Frame(self):
+        """
+        Runs a single frame: advances the Simulation by the real time passed since the previous frame, runs the due
+        subsystems, and schedules the next frame for when the next step is due. A frame scheduled before the clock was
+        stopped does nothing.
+        :return:
+        """
+        if self.after is None:
+            return
+        now = time.monotonic()
+        instrumentation = self.simulation.instrumentation
+        elapsed, self.lastTime = now - self.lastTime, now
+        behind = self.Advance(elapsed) > 1 or time.monotonic() - now > self.step
+        for subsystem in self.subsystems:
+            if now < subsystem.nextTime:
+                continue
+            if behind and subsystem.skippable and subsystem.skippedFrames < MAX_SKIPPED_FRAMES:
+                subsystem.skippedFrames += 1
+                subsystem.numSkips += 1
+                instrumentation.Count('Skipped Refreshes')
+                continue
+            behind = subsystem.Run(now) or behind
+            instrumentation.Record(subsystem.name, subsystem.lastDuration)
+        self.numFrames += 1
+        instrumentation.Record('Frame', time.monotonic() - now)
+        if behind:
+            self.numFramesBehind += 1
+            instrumentation.Count('Frames Behind')
+        if self.after is not None:
+            delay = max(0.0, self.step - self.lag - (time.monotonic() - now))
+            self.after(int(delay * 1000) + 1, self.Frame)
+
+
+class BackgroundTask:
+    """
+    BackgroundTask runs `function(progress)` upon a worker thread, such as reading or writing the program files, so
+    that the thread which started it (such as the Tk thread of the GUI) remains responsive. The function reports its
+    progress by calling `progress(stage, fraction)`, with a fraction of None when unknown. The reports, followed by the
+    function's result (or the exception it raised), are passed back through a queue, which the starting thread empties
+    with `Poll` - such as from a Tk `after` callback - so that nothing else is shared between the threads.
+    """
+    PROGRESS = 'progress'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, name, function):
+        self.name = name
+        self.function = function
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.Run, name=name, daemon=True)
+
+    def Start(self):
+        """
+        Starts the worker thread. Returns the BackgroundTask.
+        :return:
+        """
+        self.thread.start()
+        return self
+
+    def Run(self):
+        """
+        Runs the function, then queues its result or the exception raised. Runs on the worker thread.
+        :return:
+        """
+        try:
+            result = self.function(self.Progress)
+        except Exception as error:  # Raised upon the starting thread once polled, see Poll and Wait
+            self.queue.put((self.FAILED, error))
+        else:
+            self.queue.put((self.DONE, result))
+
+    def Progress(self, stage, fraction=None):
+        """
+        Queues a report of progress. Called by the function upon the worker thread.
+        :param stage:
+        :param fraction:
+        :return:
+        """
+        self.queue.put((self.PROGRESS, (stage, fraction)))
+
+    def Poll(self):
+        """
+        Returns the (kind, value) of each message queued since the last poll, without waiting: PROGRESS with a
+        (stage, fraction), followed by DONE with the result or FAILED with the exception raised.
+        :return:
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def Wait(self):
+        """
+        Waits for the function to complete, discarding any reports not yet polled, and returns its result (raising the
+        exception should it have failed).
+        :return:
+        """
+        self.thread.join()
+        for kind, value in self.Poll():
+            if kind == self.DONE:
+                return value
+            if kind == self.FAILED:
+                raise value
+        return None
+
+
+class ShardedSimulation:
+    """
+    ShardedSimulation runs the flights of a flights file across `numShards` worker processes, each holding a Simulation
+    of the flights of one FlightShard (partitioned by Origin airport or airline code). The flights file is read once,
+    by the coordinating process, into a flights file of each shard (see `Partition`), from which each worker reads its
+    own flights alone. Flights do not interact with one another, so each shard advances its own flights with its own
+    EventScheduler, and the results are identical to those of a single Simulation. Whilst running, only landing events
+    and aggregates - the number of ongoing flights, and of landings at each airport - are returned to the coordinating
+    process; flights are only gathered when saved, merged from the shards in the order a single Simulation saves them.
+
+    The ShardedSimulation is headless and read-only: flights and airports are not added to it whilst it runs.
+    `maxFlights` limits the ongoing flights of all shards together (see `HasCapacity`).
+    """
+    def __init__(self, allFlightsFileName, airportsAirlinesFileName, numShards, shardBy='airport',
+                 maxFlights=DEFAULT_MAX_FLIGHTS, flightFilter=None):
+        self.allFlightsFileName = Simulation.ConstructFile(allFlightsFileName)
+        self.airportsAirlinesFileName = Simulation.ConstructFile(airportsAirlinesFileName)
+        self.snapshotFormat = FlightSnapshot.IsSnapshot(self.allFlightsFileName)
+        self.flightFilter = flightFilter  # FlightFilter selecting the flights read, if filtered
+        self.maxFlights = maxFlights  # Limit of ongoing flights across all shards
+        reader = FlightSnapshot if self.snapshotFormat else FlightFileReader
+        with reader(self.allFlightsFileName) as flightsFile:  # Only the first lines or header are read
+            self.dataSearchTerms = flightsFile.dataSearchTerms
+            self.simulationTime = self.programTime = flightsFile.programTime
+        with open(self.airportsAirlinesFileName, 'r') as file:  # Airport names and airline codes to deal to shards
+            keys = {'airport': [], 'airline': []}
+            for line in file:
+                if line[0] == '#':
+                    keys['airport'] = line.strip()[1:].split(', ')
+                elif line.strip():
+                    keys['airline'].append(line.strip().split(', ')[1])
+
+        self.landings = []  # (time, flight code, destination) of each landing, ordered by time
+        self.airportLandings = {}  # Number of landings at each destination airport
+        self.connections = []
+        self.processes = []
+        # The shard files are only read as the workers start, so are removed once every shard has read its flights
+        with tempfile.TemporaryDirectory(prefix='flightShards') as shardDirectory:
+            shardFiles = self.Partition(FlightShard(shardBy, 0, numShards, keys.get(shardBy, ())), shardDirectory)
+            for index, (shardFileName, filePositions) in enumerate(shardFiles):
+                connection, workerConnection = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=RunShardWorker, name=f"Shard {index}", daemon=True,
+                                                  args=(workerConnection, shardFileName, self.airportsAirlinesFileName,
+                                                        filePositions))
+                process.start()
+                self.connections.append(connection)
+                self.processes.append(process)
+            self.shardFlights = self.Gather()  # Number of ongoing flights of each shard
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+    @property
+    def numFlights(self):
+        """
+        The number of ongoing flights, across all shards.
+        :return:
+        """
+        return sum(self.shardFlights)
+
+    def HasCapacity(self, numFlights=1):
+        """
+        Returns True if `numFlights` more flights can be ongoing without exceeding maxFlights ongoing flights across all
+        shards (see `Simulation.HasCapacity`).
+        :param numFlights:
+        :return:
+        """
+        return self.numFlights + numFlights <= self.maxFlights
+
+    def Partition(self, shard, shardDirectory):
+        """
+        Reads the flights file once, writing each flight selected by the flightFilter to a flights file of its shard
+        (see `FlightShard.ShardOf`) within `shardDirectory`, in the format of the flights file. Returns the file name of
+        each shard alongside the position of each of its flights amongst all flights of the flights file.
+        :param shard:
+        :param shardDirectory:
+        :return:
+        """
+        extension = 'snap' if self.snapshotFormat else 'txt'
+        fileNames = [os.path.join(shardDirectory, f"shard{index}.{extension}") for index in range(shard.numShards)]
+        positions = [array.array('q') for fileName in fileNames]  # Compact, as sent to each worker process
+        keyIndex = 2 if shard.shardBy == 'airport' else 8  # Origin or airline code, within the data search terms
+        if self.snapshotFormat:
+            with FlightSnapshot(self.allFlightsFileName) as snapshot:
+                columnValues = [snapshot.Values(index) for index in range(len(self.dataSearchTerms))]
+            for position, key in enumerate(columnValues[keyIndex]):
+                if self.flightFilter is None or self.flightFilter.Match(columnValues[2][position],
+                                                                        columnValues[3][position],
+                                                                        columnValues[9][position], key):
+                    positions[shard.ShardOf(key)].append(position)
+            for fileName, rows in zip(fileNames, positions):
+                FlightSnapshot.Write(fileName, self.dataSearchTerms, self.programTime,
+                                     [[values[row] for row in rows] for values in columnValues])
+            return list(zip(fileNames, positions))
+
+        shardFiles = [open(fileName, 'w') for fileName in fileNames]
+        try:
+            with open(self.allFlightsFileName, 'r') as flightsFile:
+                header = flightsFile.readline() + flightsFile.readline()  # Data search terms and programTime
+                for shardFile in shardFiles:
+                    shardFile.write(header)
+                # Omit lines beginning with #, no value or \n char as these are not flight data lines
+                omit = ('#', '\n', ' ')
+                position = 0
+                for line in flightsFile:
+                    if line[0] not in omit:
+                        flightData = line.strip().split(', ')
+                        if self.flightFilter is None or self.flightFilter.MatchRecord(flightData):
+                            index = shard.ShardOf(flightData[keyIndex])
+                            shardFiles[index].write(f"{line.rstrip()}\n")
+                            positions[index].append(position)
+                        position += 1
+        finally:
+            for shardFile in shardFiles:
+                shardFile.close()
+        return list(zip(fileNames, positions))
+
+    def Send(self, *command):
+        """
+        Sends a command to every shard.
+        :param command:
+        :return:
+        """
+        for connection in self.connections:
+            connection.send(command)
+
+    def Gather(self):
+        """
+        Returns a list of the result of every shard, raising any exception raised by a shard.
+        :return:
+        """
+        results = [connection.recv() for connection in self.connections]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    def Run(self, hours, step=1, tickRate=0):
+        """
+        Advances every shard by the given number of simulated hours, in ticks of `step` simulated seconds (see
+        `Simulation.Run`), merging the landing events of the shards. Returns the number of ticks performed.
+        :param hours:
+        :param step:
+        :param tickRate:
+        :return:
+        """
+        self.Send('run', hours, step, tickRate)
+        results = self.Gather()
+        self.shardFlights = [numFlights for ticks, landings, numFlights in results]
+        for landing in heapq.merge(*(landings for ticks, landings, numFlights in results)):
+            self.landings.append(landing)
+            self.airportLandings[landing[2]] = self.airportLandings.get(landing[2], 0) + 1
+        self.simulationTime += int(hours * 60 * 60)
+        self.programTime = self.simulationTime % DAY_SECONDS
+        return results[0][0]
+
+    def GatherFlights(self, snapshotFormat):
+        """
+        Returns an iterator over the values of every ongoing flight of every shard, organised by timetabled arrival time
+        with flights of equal arrival time kept in the order they were read, as a single Simulation saves them. Values
+        are given as lines of text, or as a tuple of the values of each data search term for `snapshotFormat`.
+        :param snapshotFormat:
+        :return:
+        """
+        self.Send('flights', snapshotFormat)
+        return (values for arriveTime, position, values in heapq.merge(*self.Gather()))
+
+    def SaveFlights(self, fileName=None):
+        """
+        Writes the programTime and all ongoing flights of every shard to the ongoing flights file, or to `fileName` if
+        given (see `Simulation.SaveFlights`). Raises ValueError for filtered flights (see `Simulation.OutputFileName`).
+        :param fileName:
+        :return:
+        """
+        with open(Simulation.OutputFileName(fileName, self.allFlightsFileName, self.flightFilter), 'w') as file:
+            file.write(f"#{', '.join(self.dataSearchTerms)}\n")
+            file.write(f"#{FormatTime(self.programTime)}\n")
+            file.writelines(self.GatherFlights(False))
+
+    def SaveSnapshot(self, fileName=None):
+        """
+        Writes the programTime and all ongoing flights of every shard to a snapshot file, being the ongoing flights file
+        or `fileName` if given (see `Simulation.SaveSnapshot`). Raises ValueError for filtered flights (see
+        `Simulation.OutputFileName`).
+        :param fileName:
+        :return:
+        """
+        fileName = Simulation.OutputFileName(fileName, self.allFlightsFileName, self.flightFilter)
+        rows = list(self.GatherFlights(True))
+        columnValues = [list(values) for values in zip(*rows)] if rows else [[] for term in self.dataSearchTerms]
+        FlightSnapshot.Write(fileName, self.dataSearchTerms, self.programTime, columnValues)
+
+    def Close(self):
+        """
+        Stops the worker process of every shard.
+        :return:
+        """
+        self.Send('stop')
+        for process in self.processes:
+            process.join()
+        self.connections, self.processes = [], []
+
+
+def RunShardWorker(connection, shardFileName, airportsAirlinesFileName, filePositions):
+    """
+    Entry point of the worker process of each shard of a ShardedSimulation. Reads the shard's flights file (see
+    `ShardedSimulation.Partition`) into a Simulation, and then carries out the commands sent by the coordinating
+    process until told to stop. `filePositions` holds the position of each of the shard's flights within the flights
+    file the shards were partitioned from.
+    :param connection:
+    :param shardFileName:
+    :param airportsAirlinesFileName:
+    :param filePositions:
+    :return:
+    """
+    try:
+        simulation = Simulation(shardFileName, airportsAirlinesFileName)
+        simulation.landings = []
+        filePositions = dict(zip(simulation.allFlights, filePositions))
+        connection.send(simulation.numFlights)
+        while True:
+            command, *arguments = connection.recv()
+            if command == 'run':
+                ticks = simulation.Run(*arguments)
+                connection.send((ticks, simulation.landings, simulation.numFlights))
+                simulation.landings = []
+            elif command == 'flights':  # Values of each ongoing flight, with its arrival time and position in file
+                sortedFlights = simulation.CaptureState().SortedFlights()
+                if arguments[0]:
+                    columns = simulation.flightColumns.GetColumns(sortedFlights)
+                    values = zip(*(columns[term] for term in simulation.dataSearchTerms))
+                else:
+                    values = (f"{', '.join(map(str, flight.GetRow()))}\n" for flight in sortedFlights)
+                connection.send([(flight.ttblArriveTime, filePositions[flight], flightValues)
+                                 for flight, flightValues in zip(sortedFlights, values)])
+            else:
+                break
+    except Exception as error:  # Raised within the coordinating process by Gather
+        connection.send(error)
+
+
+def RunCommandLine(argv=None):
+    """
+    Command line entry point. Loads the program files into a Simulation (adding any flights requested from a
+    FlightGenerator), advances it by the requested number of simulated hours without constructing any GUI, and writes
+    the resulting flight state to file.
+    :param argv:
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Run the flight simulation without the GUI.')
+    parser.add_argument('--hours', type=float, default=1, help='simulated hours to advance by (default 1)')
+    parser.add_argument('--step', type=int, default=1,
+                        help='simulated seconds per tick, between 1 and 21600 (default 1)')
+    parser.add_argument('--tick-rate', type=float, default=0,
+                        help='ticks performed per real second, 0 runs at max speed (default 0)')
+    parser.add_argument('--flights', default='ongoingFlights.txt', help='ongoing flights file to load')
+    parser.add_argument('--airports', default='AirportsAirlines.txt', help='airports and airlines file to load')
+    parser.add_argument('--output', help='file the resulting flight state is written to (default: --flights file, '
+                                         'required with --airport or --depart-window)')
+    parser.add_argument('--output-format', choices=['text', 'snapshot'],
+                        help='format of the resulting flight state (default: the format of the --flights file)')
+    parser.add_argument('--import-text', nargs=2, metavar=('TEXT', 'SNAPSHOT'),
+                        help='convert an ongoing flights text file into a snapshot file, then exit')
+    parser.add_argument('--export-text', nargs=2, metavar=('SNAPSHOT', 'TEXT'),
+                        help='convert a snapshot file into an ongoing flights text file, then exit')
+    parser.add_argument('--airport', action='append',
+                        help='only load flights flying from or to this airport (may be given more than once)')
+    parser.add_argument('--depart-window', nargs=2, metavar=('START', 'END'),
+                        help='only load flights departing between the two HH:MM:SS times')
+    parser.add_argument('--max-flights', type=int, default=DEFAULT_MAX_FLIGHTS,
+                        help=f'limit upon the number of ongoing flights (default {DEFAULT_MAX_FLIGHTS})')
+    parser.add_argument('--shards', type=int, default=1,
+                        help='worker processes the flights are partitioned across (default 1, not sharded)')
+    parser.add_argument('--shard-by', choices=FlightShard.SHARD_KEYS, default='airport',
+                        help='partition flights by origin airport or by airline code (default airport)')
+    parser.add_argument('--generate', type=int, default=0, metavar='N',
+                        help='add N random flights to those loaded before simulating (default 0)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_GENERATOR_SEED,
+                        help=f'random seed of the flights added by --generate (default {DEFAULT_GENERATOR_SEED})')
+    parser.add_argument('--stats', action='store_true',
+                        help='print the timings and counters of the run (see Instrumentation)')
+    parser.add_argument('--profile', action='store_true',
+                        help='profile the run with cProfile and tracemalloc, and print the report')
+    args = parser.parse_args(argv)
+    if not 1 <= args.step <= 3600 * 6:  # Same limits as the GUI's time multiplier
+        parser.error('--step must be between 1 and 21600 seconds')
+    if args.shards < 1:
+        parser.error('--shards must be at least 1')
+    if args.generate < 0:
+        parser.error('--generate must be at least 0')
+    if args.generate and args.shards > 1:
+        parser.error('--generate cannot be used with --shards')
+    if args.stats and args.shards > 1:
+        parser.error('--stats cannot be used with --shards, as each shard is timed within its own process')
+    if args.import_text or args.export_text:  # Convert between the flight file formats without simulating
+        if args.import_text:
+            FlightSnapshot.ImportText(*args.import_text)
+        if args.export_text:
+            FlightSnapshot.ExportText(*args.export_text)
+        return
+
+    flightFilter = None
+    if args.airport or args.depart_window:
+        try:
+            departWindow = [ParseTimeString(t) for t in args.depart_window or ()] or [None, None]
+        except ValueError:
+            parser.error('--depart-window times must be given as HH:MM:SS')
+        flightFilter = FlightFilter(args.airport, *departWindow)
+        try:  # The filtered flights must not replace every flight of the --flights file
+            Simulation.OutputFileName(args.output, args.flights, flightFilter)
+        except ValueError:
+            parser.error('--output must be given, and differ from --flights, with --airport or --depart-window')
+
+    if args.shards > 1:
+        simulation = ShardedSimulation(args.flights, args.airports, args.shards, args.shard_by, args.max_flights,
+                                       flightFilter)
+    else:
+        simulation = Simulation(args.flights, args.airports, args.max_flights, flightFilter)
+    if args.generate:
+        startTime = time.perf_counter()
+        try:
+            FlightGenerator(simulation, args.seed).Generate(args.generate)
+        except ValueError as error:
+            parser.error(str(error))
+        print(f"Generated {args.generate} flights with seed {args.seed} "
+              f"({time.perf_counter() - startTime:.3f}s).")
+    profiler = Instrumentation() if args.profile else None
+    try:
+        startFlights = simulation.numFlights
+        if profiler is not None:
+            profiler.StartProfile()
+        startTime = time.perf_counter()
+        ticks = simulation.Run(args.hours, args.step, args.tick_rate)
+        elapsed = time.perf_counter() - startTime
+        if profiler is not None:
+            print(profiler.StopProfile())
+        if (args.output_format or ('snapshot' if simulation.snapshotFormat else 'text')) == 'snapshot':
+            simulation.SaveSnapshot(args.output)
+        else:
+            simulation.SaveFlights(args.output)
+    finally:
+        if args.shards > 1:
+            simulation.Close()
+    print(f"Simulated {args.hours} hours in {ticks} ticks ({elapsed:.3f}s). Program time is now "
+          f"{FormatTime(simulation.programTime)}, {startFlights - simulation.numFlights} flights landed, "
+          f"{simulation.numFlights} ongoing.")
+    if args.stats:
+        print(simulation.instrumentation.Report())
+
+
+if __name__ == "__main__":
+    RunCommandLine()
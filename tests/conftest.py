@@ -0,0 +1,75 @@
+"""
+Shared fixtures of the tests. The tests run against the engine module in the repository root, upon copies of the
+program files within a temporary directory, so the repository's own files are never written.
+"""
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import FlightSimulationEngine  # noqa: E402
+from FlightSimulationEngine import FlightGenerator, Simulation  # noqa: E402
+
+
+@pytest.fixture
+def programFiles(tmp_path):
+    """
+    Copies of the repository's `ongoingFlights.txt` and `AirportsAirlines.txt`, returned as their paths.
+    :param tmp_path:
+    :return:
+    """
+    paths = []
+    for fileName in ('ongoingFlights.txt', 'AirportsAirlines.txt'):
+        shutil.copyfile(os.path.join(ROOT, fileName), tmp_path / fileName)
+        paths.append(str(tmp_path / fileName))
+    return tuple(paths)
+
+
+@pytest.fixture
+def generatedFiles(programFiles):
+    """
+    The program files, with 500 flights of a seeded FlightGenerator added to the flights file, returned as their
+    paths. The generated flights depart throughout the day, so every kind of flight window is covered.
+    :param programFiles:
+    :return:
+    """
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=1).Generate(500)
+    simulation.SaveFlights()
+    return programFiles
+
+
+@pytest.fixture
+def tkRoot():
+    """
+    A root window for the tests of the GUI, destroyed after the test. The test is skipped where no display is available.
+    :return:
+    """
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        pytest.skip(f"No display available: {error}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def columnBackend(request, monkeypatch):
+    """
+    Runs a test with the NumPy columns of the FlightTable and snapshots, and again with the array fallback used when
+    NumPy is not installed.
+    :param request:
+    :param monkeypatch:
+    :return:
+    """
+    if request.param == 'numpy' and FlightSimulationEngine.np is None:
+        pytest.skip('NumPy is not installed')
+    if request.param == 'python':
+        monkeypatch.setattr(FlightSimulationEngine, 'np', None)
+    return request.param
@@ -0,0 +1,54 @@
+"""
+The airlines of the airports and airlines file are parsed once into an AirlineCatalog of Airlines and their Aircraft,
+looked up by name and by code, and written back as they were read.
+"""
+import pytest
+
+from FlightSimulationEngine import Aircraft, Airline, AirlineCatalog, Simulation
+
+
+def ReadAirlineLines(fileName):
+    with open(fileName) as file:
+        return [line.strip() for line in file if line.strip() and line[0] != '#']
+
+
+def test_catalog_lookups(programFiles):
+    simulation = Simulation(*programFiles)
+    airlines = simulation.airlines
+    assert airlines.Names() == ['Jet2', 'Ryanair', 'BritishAirways', 'TUI'] == [airline.name for airline in airlines]
+    assert len(airlines) == 4
+    ryanair = airlines.Get('Ryanair')
+    assert ryanair is airlines.GetByCode('FR') and ryanair.code == 'FR'
+    assert list(ryanair.aircraft) == ['Boeing 737 Max 8', 'Boeing 737-800']
+    aircraft = airlines.GetAircraft('Ryanair', 'Boeing 737-800')
+    assert aircraft is ryanair.aircraft['Boeing 737-800'] and aircraft.speed == 966.0
+    assert type(aircraft.speed) is float
+    assert airlines.Get('FR') is None and airlines.GetByCode('Ryanair') is None
+    assert airlines.GetAircraft('Ryanair', 'Airbus A380-800') is None
+    assert airlines.GetAircraft('No Such Airline', 'Boeing 737-800') is None
+
+
+def test_airline_data_round_trips(programFiles):
+    simulation = Simulation(*programFiles)
+    lines = ReadAirlineLines(programFiles[1])
+    assert [', '.join(data) for data in simulation.airlines.GetData()] == lines
+    for line in lines:
+        assert Airline.FromData(line.split(', ')).GetData() == line.split(', ')
+    assert Airline('Test', 'TT', [Aircraft('Jet', '812.5'), Aircraft('Prop', 400)]).GetData() == \
+        ['Test', 'TT', 'Jet', 'Prop', '812.5', '400']
+
+    simulation.airlines.Add(Airline.FromData(['Grounded', 'GR']))
+    simulation.SaveFiles()
+    assert ReadAirlineLines(programFiles[1]) == lines + ['Grounded, GR']
+    assert Simulation(*programFiles).airlines.Get('Grounded').aircraft == {}
+
+
+def test_catalog_construction():
+    airlines = AirlineCatalog([Airline('First', 'FA'), Airline('Second', 'SA')])
+    airlines.Add(Airline('Third', 'TA'))
+    assert airlines.Names() == ['First', 'Second', 'Third']
+    assert airlines.GetByCode('TA').name == 'Third' and airlines.GetData()[0] == ['First', 'FA']
+    for airline in airlines:
+        assert not hasattr(airline, '__dict__')
+        with pytest.raises(AttributeError):
+            airline.unknownValue = 1
@@ -0,0 +1,77 @@
+"""
+A BackgroundTask runs a function upon a worker thread, passing back its reports of progress followed by its result, or
+the exception it raised, such as whilst reading and writing the program files.
+"""
+import threading
+
+import pytest
+
+import FlightSimulationEngine
+from FlightSimulationEngine import BackgroundTask, Simulation
+
+
+def PollUntilComplete(task):
+    """
+    Returns every message of the task, polling until its result or exception has been passed back.
+    :param task:
+    :return:
+    """
+    messages = []
+    while not messages or messages[-1][0] == BackgroundTask.PROGRESS:
+        task.thread.join(0.01)
+        messages.extend(task.Poll())
+    return messages
+
+
+def test_progress_then_result_passed_back():
+    started = threading.Event()
+    workerThreads = []
+
+    def Function(progress):
+        workerThreads.append(threading.current_thread())
+        started.wait()
+        progress('Counting', 0.5)
+        progress('Finishing')
+        return 42
+    task = BackgroundTask('Count', Function).Start()
+    assert task.Poll() == []  # Nothing is reported until the function does
+    started.set()
+    messages = PollUntilComplete(task)
+    assert messages == [(BackgroundTask.PROGRESS, ('Counting', 0.5)), (BackgroundTask.PROGRESS, ('Finishing', None)),
+                        (BackgroundTask.DONE, 42)]
+    assert workerThreads == [task.thread] and task.thread is not threading.current_thread()
+    assert task.Poll() == []
+
+
+def test_exception_passed_back():
+    def Function(progress):
+        progress('Reading', None)
+        raise OSError('Disk removed')
+    messages = PollUntilComplete(BackgroundTask('Read', Function).Start())
+    assert messages[0] == (BackgroundTask.PROGRESS, ('Reading', None))
+    assert messages[1][0] == BackgroundTask.FAILED and isinstance(messages[1][1], OSError)
+
+    with pytest.raises(OSError):
+        BackgroundTask('Read', Function).Start().Wait()
+    assert BackgroundTask('Add', lambda progress: 1 + 1).Start().Wait() == 2
+
+
+def test_files_read_and_written_with_progress(generatedFiles, monkeypatch):
+    monkeypatch.setattr(FlightSimulationEngine, 'FILE_PROGRESS_INTERVAL', 100)
+    task = BackgroundTask('Reading program files', lambda progress: Simulation(*generatedFiles, progress=progress))
+    messages = PollUntilComplete(task.Start())
+    kind, simulation = messages[-1]
+    assert kind == BackgroundTask.DONE and simulation.numFlights == Simulation(*generatedFiles).numFlights
+    reports = [value for kind, value in messages[:-1]]
+    readFractions = [fraction for stage, fraction in reports if stage.startswith('Reading flights')]
+    assert readFractions and readFractions == sorted(readFractions)
+    assert all(0 < fraction <= 1 for fraction in readFractions)
+    assert ('Reading airports and airlines', None) in reports
+    assert any(stage.startswith('Scheduling flights') for stage, fraction in reports)
+
+    task = BackgroundTask('Writing program files', simulation.SaveFiles)
+    messages = PollUntilComplete(task.Start())
+    assert messages[-1] == (BackgroundTask.DONE, None)
+    writeFractions = [fraction for kind, (stage, fraction) in messages[:-1] if stage.startswith('Writing flights')]
+    assert writeFractions and writeFractions[-1] <= 1
+    assert Simulation(*generatedFiles).numFlights == simulation.numFlights
@@ -0,0 +1,59 @@
+"""
+The number of ongoing flights which may be added to a Simulation is limited by its maxFlights, whilst flights read from
+file are always loaded, and the search indexes are only built upon the first search.
+"""
+import pytest
+
+from FlightSimulationEngine import FlightGenerator, RunCommandLine, Simulation
+
+
+def test_max_flights_limits_added_flights(programFiles):
+    numFlights = Simulation(*programFiles).numFlights
+    simulation = Simulation(*programFiles, maxFlights=numFlights + 10)
+    assert simulation.HasCapacity() and simulation.HasCapacity(10) and not simulation.HasCapacity(11)
+    generator = FlightGenerator(simulation, seed=1)
+    with pytest.raises(ValueError):
+        generator.Generate(11)
+    assert simulation.numFlights == numFlights  # No flights are added by a batch beyond the limit
+    generator.Generate(10)
+    assert simulation.numFlights == numFlights + 10 and not simulation.HasCapacity()
+
+    simulation.LandFlight(next(iter(simulation.allFlights)))
+    assert simulation.HasCapacity(1) and not simulation.HasCapacity(2)
+
+
+def test_flights_read_from_file_always_load(generatedFiles):
+    numFlights = Simulation(*generatedFiles).numFlights
+    simulation = Simulation(*generatedFiles, maxFlights=10)
+    assert simulation.numFlights == numFlights > 10
+    assert not simulation.HasCapacity()
+    with pytest.raises(ValueError):
+        FlightGenerator(simulation).Generate(1)
+
+
+def test_search_indexes_built_on_first_search(generatedFiles):
+    simulation = Simulation(*generatedFiles)
+    simulation.Run(3, 60)
+    FlightGenerator(simulation, seed=2).Generate(20)
+    assert simulation.searchIndex.indexes is None  # Loading, simulating and adding flights do not build the indexes
+
+    origin = simulation.dataSearchTerms[2]
+    airportName = simulation.airportNames[0]
+    found = simulation.searchIndex.Search([(origin, [airportName])])
+    assert simulation.searchIndex.indexes is not None
+    assert set(found) == {flight for flight in simulation.allFlights if flight.fliOrigin == airportName}
+
+    FlightGenerator(simulation, seed=3).Generate(20)
+    simulation.Run(3, 60)  # Once built, the indexes follow the flights added and landed
+    found = simulation.searchIndex.Search([(origin, [airportName])])
+    assert set(found) == {flight for flight in simulation.allFlights if flight.fliOrigin == airportName}
+
+
+def test_command_line_max_flights(programFiles, tmp_path):
+    numFlights = Simulation(*programFiles).numFlights
+    output = str(tmp_path / 'output.txt')
+    arguments = ['--flights', programFiles[0], '--airports', programFiles[1], '--output', output, '--hours', '0']
+    with pytest.raises(SystemExit):
+        RunCommandLine(arguments + ['--max-flights', str(numFlights + 5), '--generate', '6'])
+    RunCommandLine(arguments + ['--max-flights', str(numFlights + 5), '--generate', '5'])
+    assert Simulation(output, programFiles[1]).numFlights == numFlights + 5
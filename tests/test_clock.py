@@ -0,0 +1,109 @@
+"""
+A SimulationClock advances its Simulation in fixed steps of real time, carrying fractions of a simulated second, drops
+the steps beyond maxCatchUpSteps within a frame, and skips skippable subsystems whilst behind.
+"""
+import time
+
+from FlightSimulationEngine import MAX_SKIPPED_FRAMES, Simulation, SimulationClock
+
+
+class Scheduler:
+    """
+    Stands in for Tk's `after`, keeping each frame scheduled rather than running it.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, milliseconds, callback):
+        self.calls.append((milliseconds, callback))
+
+
+def RunFrame(clock, elapsed):
+    """
+    Runs a frame of the clock as though `elapsed` real seconds have passed since the previous frame.
+    :param clock:
+    :param elapsed:
+    :return:
+    """
+    clock.lastTime = time.monotonic() - elapsed
+    clock.Frame()
+
+
+def test_advance_carries_fractions_of_a_second(programFiles):
+    simulation = Simulation(*programFiles)
+    startTime = simulation.simulationTime
+    clock = SimulationClock(simulation, step=0.25)
+    assert clock.Advance(0.1) == 0 and clock.lag == 0.1
+    assert clock.Advance(0.65) == 3  # 0.75 simulated seconds, so the Simulation is not yet advanced
+    assert simulation.simulationTime == startTime and clock.simulatedLag == 0.75
+    assert clock.Advance(0.25) == 1
+    assert simulation.simulationTime == startTime + 1 and clock.simulatedLag == 0
+
+    clock.multiplier = 60
+    assert clock.Advance(1.0) == 4
+    assert simulation.simulationTime == startTime + 61
+
+
+def test_steps_beyond_the_catch_up_limit_are_dropped(programFiles):
+    simulation = Simulation(*programFiles)
+    startTime = simulation.simulationTime
+    clock = SimulationClock(simulation, step=0.25, maxCatchUpSteps=4)
+    assert clock.Advance(10.125) == 4
+    assert clock.numDroppedSteps == 36 and clock.lag == 0.125
+    assert simulation.instrumentation.counters['Dropped Steps'] == 36
+    assert simulation.simulationTime == startTime + 1  # Simulated time falls behind real time instead
+    assert clock.Advance(0.5) == 2 and clock.numDroppedSteps == 36
+
+
+def test_frames_run_due_subsystems_until_stopped(programFiles):
+    simulation = Simulation(*programFiles)
+    clock = SimulationClock(simulation, step=0.25)
+    runs = []
+    everyFrame = clock.Register('Every Frame', lambda: runs.append('every'))
+    everyMinute = clock.Register('Every Minute', lambda: runs.append('minute'), interval=60)
+    after = Scheduler()
+    clock.Start(after)
+    assert after.calls == [(250, clock.Frame)]
+
+    RunFrame(clock, 0.25)
+    RunFrame(clock, 0.25)
+    assert runs == ['every', 'minute', 'every']
+    assert everyFrame.numRuns == 2 and everyMinute.numRuns == 1
+    assert len(after.calls) == 3 and all(0 < milliseconds <= 251 for milliseconds, _ in after.calls[1:])
+    assert simulation.instrumentation.Timing('Every Frame').count == 2
+    assert clock.numFrames == 2 and clock.numFramesBehind == 0
+
+    clock.Stop()
+    RunFrame(clock, 0.25)
+    assert clock.numFrames == 2 and len(after.calls) == 3
+
+
+def test_skippable_subsystems_skipped_whilst_behind(programFiles):
+    simulation = Simulation(*programFiles)
+    clock = SimulationClock(simulation, step=0.25)
+    tick = clock.Register('Tick', lambda: None)
+    display = clock.Register('Display', lambda: None, skippable=True)
+    clock.Start(Scheduler())
+
+    for frame in range(MAX_SKIPPED_FRAMES):
+        RunFrame(clock, 1.0)  # Four steps were due, so the frame is behind
+        assert display.numRuns == 0 and display.skippedFrames == frame + 1
+    RunFrame(clock, 1.0)  # Skipped for as long as it may be, so run regardless
+    assert display.numRuns == 1 and display.skippedFrames == 0
+    assert tick.numRuns == MAX_SKIPPED_FRAMES + 1
+    assert clock.numFramesBehind == MAX_SKIPPED_FRAMES + 1
+    assert simulation.instrumentation.counters['Skipped Refreshes'] == MAX_SKIPPED_FRAMES
+
+    RunFrame(clock, 0.25)
+    assert display.numRuns == 2 and clock.numFramesBehind == MAX_SKIPPED_FRAMES + 1
+
+
+def test_overrun_budget_puts_frame_behind(programFiles):
+    simulation = Simulation(*programFiles)
+    clock = SimulationClock(simulation, step=0.25)
+    slow = clock.Register('Slow', lambda: time.sleep(0.02), budget=0.001)
+    display = clock.Register('Display', lambda: None, skippable=True)
+    clock.Start(Scheduler())
+    RunFrame(clock, 0.25)
+    assert slow.numOverruns == 1 and slow.lastDuration > slow.budget
+    assert display.numSkips == 1 and clock.numFramesBehind == 1
@@ -0,0 +1,72 @@
+"""
+A DataGrid displays flights sorted by timetabled arrival, sorting a FlightSet again only once flights have been added
+to or removed from it, and constructs only the rows of its viewport.
+"""
+import operator
+
+from FlightArrivalEnquiryMain import DataGrid
+from FlightSimulationEngine import FlightGenerator, Simulation
+
+
+def ShownRows(grid, simulation):
+    return [row[:len(simulation.dataSearchTerms)] for row in grid.shownValues]
+
+
+def ExpectedRows(grid, flights, terms):
+    rows = [flight.GetRow(terms) for flight in flights[grid.firstRow:grid.firstRow + grid.numRows]]
+    return rows + [[''] * len(terms)] * (grid.numRows - len(rows))
+
+
+def test_flight_set_sorted_only_when_changed(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=1).Generate(40)
+    terms = simulation.dataSearchTerms
+    grid = DataGrid(tkRoot, 0, 0, terms, numRows=6)
+    grid.InsertValues(simulation.allFlights)
+    flightData = grid.flightData
+    assert flightData == sorted(simulation.allFlights, key=operator.attrgetter('ttblArriveTime'))
+    assert ShownRows(grid, simulation) == ExpectedRows(grid, flightData, terms)
+
+    grid.InsertValues(simulation.allFlights)
+    assert grid.flightData is flightData  # Unchanged, so not sorted again
+
+    added = FlightGenerator(simulation, seed=2).Generate(1)[0]
+    grid.InsertValues(simulation.allFlights)
+    assert grid.flightData is not flightData and added in grid.flightData
+    flightData = grid.flightData
+    simulation.LandFlight(added)
+    grid.InsertValues(simulation.allFlights)
+    assert grid.flightData is not flightData and added not in grid.flightData
+    assert grid.flightData == sorted(simulation.allFlights, key=operator.attrgetter('ttblArriveTime'))
+
+
+def test_lists_are_always_sorted(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=3).Generate(20)
+    grid = DataGrid(tkRoot, 0, 0, simulation.dataSearchTerms)
+    flights = list(simulation.allFlights)
+    grid.InsertValues(flights)
+    flightData = grid.flightData
+    flights.pop()
+    grid.InsertValues(flights)
+    assert grid.flightData is not flightData
+    assert grid.flightData == sorted(flights, key=operator.attrgetter('ttblArriveTime'))
+
+
+def test_viewport_scrolls_through_flights(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=4).Generate(30)
+    terms = simulation.dataSearchTerms
+    grid = DataGrid(tkRoot, 0, 0, terms, numRows=5)
+    assert len(grid.dataFieldRows) == 5
+    grid.InsertValues(simulation.allFlights)
+    grid.Scroll('scroll', 3, 'units')
+    assert grid.firstRow == 3
+    assert ShownRows(grid, simulation) == ExpectedRows(grid, grid.flightData, terms)
+    grid.Scroll('scroll', 1, 'pages')
+    assert grid.firstRow == 8
+    grid.Scroll('moveto', 1.0)  # Kept within the flight data
+    assert grid.firstRow == len(grid.flightData) - grid.numRows
+    assert ShownRows(grid, simulation) == ExpectedRows(grid, grid.flightData, terms)
+    grid.InsertValues([])
+    assert grid.firstRow == 0 and ShownRows(grid, simulation) == ExpectedRows(grid, [], terms)
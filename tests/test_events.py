@@ -0,0 +1,124 @@
+"""
+The event scheduled Simulation is checked against the baseline tick loop, which updated the distance and times of
+every flight on every tick (`Flight.UpdateDistanceAndTime` of the original FlightArrivalEnquiryMain.py).
+"""
+import pytest
+
+from FlightSimulationEngine import DAY_SECONDS, Simulation
+
+
+def ParseSeconds(timeString):
+    hours, minutes, seconds = map(int, timeString.split(':'))
+    return hours * 60 * 60 + minutes * 60 + seconds
+
+
+class ReferenceFlight:
+    """
+    The baseline Flight and its UpdateDistanceAndTime, with times held as seconds since midnight rather than
+    timedeltas. Departures, landings, distances and delays follow the baseline exactly, tick by tick.
+    """
+    def __init__(self, values):
+        self.fliCode = values[1]
+        self.fliSpeed = float(values[4])
+        self.fliDist = float(values[5])
+        self.ttblDepartTime = ParseSeconds(values[9])
+        self.ttblArriveTime = ParseSeconds(values[10])
+        if self.ttblArriveTime < self.ttblDepartTime:
+            self.trueArrive = self.ttblArriveTime + DAY_SECONDS
+        else:
+            self.trueArrive = self.ttblArriveTime
+        self.appxArriveTime = ParseSeconds(values[11])
+        self.delayTime = ParseSeconds(values[12])
+        self.hasDeparted = values[13] == 'True'
+        self.isDeparting = values[14] == 'True'
+        self.hasLanded = False
+
+    def UpdateDistanceAndTime(self, prevTime, programTime):
+        if programTime <= self.ttblDepartTime and programTime <= self.ttblArriveTime < self.ttblDepartTime:
+            inFlightWindow = True
+        elif self.ttblDepartTime <= programTime <= self.trueArrive:
+            inFlightWindow = True
+        else:
+            self.isDeparting = True
+            inFlightWindow = False
+
+        if prevTime > programTime:  # 24hr repeat loop
+            programTime += DAY_SECONDS
+
+        if (inFlightWindow and self.isDeparting) or self.hasDeparted:
+            timeChange = programTime - prevTime
+            if prevTime < self.ttblDepartTime and not self.hasDeparted:
+                timeChange = programTime - self.ttblDepartTime
+            timeChange %= DAY_SECONDS  # As timedelta.seconds of the baseline
+
+            self.isDeparting = False
+            self.hasDeparted = True
+
+            newDist = self.fliDist - (self.fliSpeed / 60 / 60) * timeChange
+            if newDist > 0:
+                self.fliDist = newDist
+                self.appxArriveTime = programTime + int((self.fliDist / self.fliSpeed) * 60 * 60)
+                self.delayTime = max(0, self.appxArriveTime - self.trueArrive)
+                if self.appxArriveTime >= DAY_SECONDS:
+                    self.appxArriveTime -= DAY_SECONDS
+            else:
+                self.fliDist = 0
+                self.hasLanded = True
+                self.hasDeparted = False
+
+
+def RunReference(allFlightsFileName, hours, step):
+    """
+    Runs the baseline tick loop over the flights of a text flights file, returning the ongoing flights by code.
+    :param allFlightsFileName:
+    :param hours:
+    :param step:
+    :return:
+    """
+    with open(allFlightsFileName) as file:
+        lines = file.read().splitlines()
+    flights = [ReferenceFlight(line.split(', ')) for line in lines[2:] if line and line[0] not in '# ']
+    programTime = ParseSeconds(lines[1][1:])
+    for _ in range(int(hours * 60 * 60 / step)):
+        prevTime, programTime = programTime, (programTime + step) % DAY_SECONDS
+        for flight in flights:
+            flight.UpdateDistanceAndTime(prevTime, programTime)
+        flights = [flight for flight in flights if not flight.hasLanded]
+    return {flight.fliCode: flight for flight in flights}
+
+
+def AssertMatchesReference(allFlightsFileName, airportsAirlinesFileName, hours, step):
+    expected = RunReference(allFlightsFileName, hours, step)
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    simulation.Run(hours, step)
+    ongoing = {flight.fliCode: flight for flight in simulation.allFlights}
+
+    assert ongoing.keys() == expected.keys()
+    for code, flight in ongoing.items():
+        reference = expected[code]
+        assert (flight.hasDeparted, flight.isDeparting) == (reference.hasDeparted, reference.isDeparting), code
+        if reference.hasDeparted:  # Values computed from the departure rather than summed tick by tick
+            assert flight.fliDist == pytest.approx(reference.fliDist, abs=1), code
+            difference = (flight.appxArriveTime - reference.appxArriveTime) % DAY_SECONDS
+            assert min(difference, DAY_SECONDS - difference) <= 5, code
+            assert abs(flight.delayTime - reference.delayTime) <= 5, code
+
+
+@pytest.mark.parametrize('hours, step', [(2, 1), (24, 60), (30, 600)])
+def test_program_flights_match_baseline(programFiles, hours, step):
+    AssertMatchesReference(*programFiles, hours, step)
+
+
+@pytest.mark.parametrize('hours, step', [(6, 15), (26, 60), (48, 3600)])
+def test_generated_flights_match_baseline(generatedFiles, hours, step):
+    AssertMatchesReference(*generatedFiles, hours, step)
+
+
+def test_landings_are_removed_once(programFiles):
+    simulation = Simulation(*programFiles)
+    numFlights = simulation.numFlights
+    simulation.landings = []
+    simulation.Run(48, 60)
+    assert simulation.numFlights == 0
+    assert len(simulation.landings) == numFlights
+    assert len({code for _, code, _ in simulation.landings}) == numFlights
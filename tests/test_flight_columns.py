@@ -0,0 +1,62 @@
+"""
+The FlightColumns registry maps each data search term to the getter and data type of a Flight value, shared by every
+Flight of the same search terms, with times given in seconds and only formatted as strings for display.
+"""
+from FlightSimulationEngine import FlightColumns, FormatTime, Simulation
+
+# Data type of each data search term, in the order of the `ongoingFlights.txt` header
+TERM_TYPES = ['int', 'str', 'str', 'str', 'float', 'float', 'str', 'str', 'str', 'time', 'time', 'time', 'time',
+              'bool', 'bool']
+
+
+def FirstFlight(simulation):
+    return next(flight for flight in simulation.allFlights if flight.fliCode == 'FR0001')
+
+
+def test_registry_is_shared(programFiles):
+    simulation = Simulation(*programFiles)
+    assert FlightColumns.ForTerms(simulation.dataSearchTerms) is simulation.flightColumns
+    assert all(flight.flightColumns is simulation.flightColumns for flight in simulation.allFlights)
+    otherTerms = [f"Term {number}" for number in range(len(TERM_TYPES))]
+    other = FlightColumns.ForTerms(otherTerms)
+    assert other is not simulation.flightColumns and FlightColumns.ForTerms(otherTerms) is other
+
+
+def test_accessors_get_typed_values(programFiles):
+    simulation = Simulation(*programFiles)
+    columns = simulation.flightColumns
+    flight = FirstFlight(simulation)
+    assert [columns.GetAccessor(term)[1] for term in simulation.dataSearchTerms] == TERM_TYPES
+    values = [flight.GetFlightValue(term)[0] for term in simulation.dataSearchTerms]
+    assert values[:9] == ['0001', 'FR0001', 'Birmingham Airport', 'Default Airport', 797.05, 3186.0,
+                          'Boeing 737 Max 8', 'Ryanair', 'FR']
+    assert values[9:11] == [20 * 60 * 60 + 30 * 60, 30 * 60]
+    assert all(type(value) is int for value in values[9:13])
+    assert values[13:] == [False, True]
+
+
+def test_rows_are_displayed_and_columns_in_seconds(programFiles):
+    simulation = Simulation(*programFiles)
+    columns = simulation.flightColumns
+    terms = simulation.dataSearchTerms
+    flight = FirstFlight(simulation)
+    row = columns.GetRow(flight)
+    assert row == flight.GetRow()
+    assert row[9:11] == ['20:30:00', '0:30:00']
+    assert row[11:13] == [FormatTime(flight.appxArriveTime), FormatTime(flight.delayTime)]
+    assert columns.GetRow(flight, [terms[3], terms[0]]) == ['Default Airport', '0001']
+
+    flights = list(simulation.allFlights)
+    columnValues = columns.GetColumns(iter(flights), [terms[1], terms[9]])
+    assert list(columnValues) == [terms[1], terms[9]]
+    assert columnValues[terms[1]] == [flight.fliCode for flight in flights]
+    assert columnValues[terms[9]] == [flight.ttblDepartTime for flight in flights]
+    assert list(columns.GetColumns(flights)) == terms
+
+
+def test_distance_is_rounded(programFiles):
+    simulation = Simulation(*programFiles)
+    simulation.Run(2, 60)
+    term = simulation.dataSearchTerms[5]
+    for flight in simulation.allFlights:
+        assert flight.GetFlightValue(term)[0] == round(flight.fliDist, 1)
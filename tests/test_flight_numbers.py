@@ -0,0 +1,107 @@
+"""
+Flight numbers are handed out by a FlightNumberAllocator per airline: the lowest free number first, freed when its
+flight lands, and reused by later flights.
+"""
+import pytest
+
+from FlightSimulationEngine import FlightGenerator, FlightNumberAllocator, Simulation
+
+
+def test_allocates_lowest_free_number():
+    allocator = FlightNumberAllocator('ZZ')
+    assert [allocator.Allocate() for _ in range(5)] == [0, 1, 2, 3, 4]
+    allocator.Release(3)
+    allocator.Release(1)
+    assert allocator.Lowest() == 1
+    assert [allocator.Allocate() for _ in range(3)] == [1, 3, 5]
+    assert len(allocator) == 6
+
+
+def test_reserved_numbers_are_skipped():
+    allocator = FlightNumberAllocator('ZZ')
+    for number in (0, 1, 2, 7):
+        allocator.Reserve(number)
+    allocator.Release(1)
+    allocator.Reserve(1)  # Reserved again whilst still within the heap of released numbers
+    assert [allocator.Allocate() for _ in range(5)] == [3, 4, 5, 6, 8]
+    assert not allocator.IsFree(1) and not allocator.IsFree(7)
+    assert not allocator.IsFree(-1) and not allocator.IsFree(10000)
+    allocator.Reserve(10000)  # Outside of the airline's numbers, so ignored
+    assert len(allocator) == 9
+
+
+def test_exhausted_airline_raises():
+    allocator = FlightNumberAllocator('ZZ', limit=3)
+    assert [allocator.Allocate() for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError):
+        allocator.Allocate()
+    allocator.Release(1)
+    assert allocator.Allocate() == 1
+
+
+def test_duplicate_numbers_free_once_every_flight_released():
+    allocator = FlightNumberAllocator('ZZ')
+    allocator.Reserve(0)
+    allocator.Reserve(0)
+    allocator.Reserve(1)
+    assert len(allocator) == 2
+    allocator.Release(0)
+    assert not allocator.IsFree(0) and allocator.Allocate() == 2
+    allocator.Release(0)
+    assert allocator.IsFree(0) and allocator.Allocate() == 0
+    allocator.Release(5)  # Not in use, so ignored
+    assert len(allocator) == 3
+
+
+def test_landed_numbers_are_reused(programFiles):
+    simulation = Simulation(*programFiles)
+    generator = FlightGenerator(simulation, seed=1)
+    generator.Generate(300)
+    inUse = {flight.fliCode for flight in simulation.allFlights}
+    simulation.landings = []
+    simulation.Run(6, 60)
+    landed = {code for _, code, _ in simulation.landings}
+    assert landed
+
+    for flight in simulation.allFlights:
+        assert not simulation.FlightNumbers(flight.alCode).IsFree(int(flight.fliNum))
+    for code in landed:
+        assert simulation.FlightNumbers(code[:2]).IsFree(int(code[2:]))
+
+    generator.Generate(len(landed))
+    added = {flight.fliCode for flight in simulation.allFlights} - (inUse - landed)
+    codes = [flight.fliCode for flight in simulation.allFlights]
+    assert len(codes) == len(set(codes))  # Flight codes remain unique
+    assert added & landed  # The numbers freed by landings are given to new flights
+
+
+def test_duplicate_numbers_in_flights_file(programFiles):
+    allFlightsFileName, airportsAirlinesFileName = programFiles
+    with open(allFlightsFileName) as file:
+        lines = file.read().splitlines()
+    values = lines[2].split(', ')
+    code = values[1]
+    shortFlight = values[:5] + ['10.0'] + values[6:]  # Same airline and number, landing soon after departing
+    with open(allFlightsFileName, 'w') as file:
+        file.write('\n'.join(lines[:2] + [', '.join(shortFlight)] + lines[2:]) + '\n')
+
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    allocator = simulation.FlightNumbers(values[8])
+    number = int(values[0])
+    assert [flight.fliCode for flight in simulation.allFlights].count(code) == 2
+    while [flight.fliCode for flight in simulation.allFlights].count(code) == 2:
+        simulation.Step(60)
+    assert not allocator.IsFree(number)  # The other flight is still using the number
+    while code in {flight.fliCode for flight in simulation.allFlights}:
+        simulation.Step(60)
+    assert allocator.IsFree(number)
+
+
+def test_failed_generation_releases_numbers(programFiles):
+    simulation = Simulation(*programFiles)
+    numbersInUse = {airline.code: len(simulation.FlightNumbers(airline.code)) for airline in simulation.airlines}
+    numFlights = simulation.numFlights
+    with pytest.raises(ValueError):
+        FlightGenerator(simulation).Generate(10000 * len(numbersInUse) + 1)
+    assert simulation.numFlights == numFlights
+    assert {code: len(simulation.FlightNumbers(code)) for code in numbersInUse} == numbersInUse
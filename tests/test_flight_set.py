@@ -0,0 +1,62 @@
+"""
+A FlightSet keeps its Flights in the order they were added, and each Airport holds its inbound, outbound and landed
+Flights within FlightSets, moving a Flight between them as it lands.
+"""
+from FlightSimulationEngine import FlightGenerator, FlightSet, Simulation
+
+
+def test_flight_set_order_and_membership():
+    flights = [object() for _ in range(6)]
+    flightSet = FlightSet(flights[:3])
+    assert list(flightSet) == flights[:3] and len(flightSet) == 3
+    flightSet.Add(flights[5])
+    flightSet.Add(flights[3])
+    flightSet.Add(flights[0])  # Already present, so neither moved nor counted
+    assert list(flightSet) == [flights[0], flights[1], flights[2], flights[5], flights[3]]
+    flightSet.Remove(flights[1])
+    flightSet.Remove(flights[4])  # Never added, so ignored
+    assert list(flightSet) == [flights[0], flights[2], flights[5], flights[3]]
+    assert flights[0] in flightSet and flights[1] not in flightSet and flights[4] not in flightSet
+    assert len(flightSet) == 4
+
+
+def test_flight_set_version_counts_changes():
+    first, second = object(), object()
+    flightSet = FlightSet([first])
+    assert flightSet.version == 0
+    flightSet.Add(second)
+    flightSet.Add(second)
+    assert flightSet.version == 1
+    flightSet.Remove(first)
+    flightSet.Remove(first)
+    assert flightSet.version == 2
+
+
+def test_airports_hold_their_flights(generatedFiles):
+    simulation = Simulation(*generatedFiles)
+    for airport in simulation.airports:
+        for flight in airport.outboundFlights:
+            assert flight.fliOrigin == airport.name and flight.originAirport is airport
+        for flight in airport.inboundFlights:
+            assert flight.fliDestination == airport.name and flight.destinationAirport is airport
+    assert sum(len(airport.outboundFlights) for airport in simulation.airports) == len(simulation.allFlights)
+    assert sum(len(airport.inboundFlights) for airport in simulation.airports) == len(simulation.allFlights)
+
+
+def test_landed_flights_move_to_destination(programFiles):
+    simulation = Simulation(*programFiles)
+    generated = FlightGenerator(simulation, seed=5).Generate(20)
+    landing, remaining = generated[:5], generated[5:]
+    simulation.LandFlight(landing[0])
+    simulation.LandFlights(landing[1:])
+    for flight in landing:
+        assert flight not in simulation.allFlights
+        assert flight not in flight.originAirport.outboundFlights
+        assert flight not in flight.destinationAirport.inboundFlights
+        assert flight in flight.destinationAirport.landedFlights
+    for flight in remaining:
+        assert flight in simulation.allFlights
+        assert flight in flight.originAirport.outboundFlights and flight in flight.destinationAirport.inboundFlights
+    landedOrder = [flight for flight in simulation.airportsByName[landing[0].fliDestination].landedFlights
+                   if flight in landing]
+    assert landedOrder == [flight for flight in landing if flight.fliDestination == landing[0].fliDestination]
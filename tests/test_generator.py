@@ -0,0 +1,69 @@
+"""
+A FlightGenerator constructs the same random flights for the same seed, with the values of the Create Flight screen,
+flown only by airlines which have aircraft.
+"""
+import pytest
+
+import FlightSimulationEngine
+from FlightSimulationEngine import DAY_SECONDS, Airline, AirlineCatalog, FlightGenerator, Simulation
+
+
+def GeneratedRows(programFiles, seed, numFlights=200):
+    simulation = Simulation(*programFiles)
+    return [flight.GetRow() for flight in FlightGenerator(simulation, seed).Generate(numFlights)]
+
+
+def test_same_seed_constructs_same_flights(programFiles, monkeypatch):
+    rows = GeneratedRows(programFiles, seed=7)
+    assert GeneratedRows(programFiles, seed=7) == rows
+    assert GeneratedRows(programFiles, seed=8) != rows
+    monkeypatch.setattr(FlightSimulationEngine, 'np', None)
+    assert GeneratedRows(programFiles, seed=7) == rows  # Whether or not NumPy is installed
+
+
+def test_successive_batches_continue_the_sequence(programFiles):
+    simulation = Simulation(*programFiles)
+    generator = FlightGenerator(simulation, seed=7)
+    first = [flight.GetRow()[2:] for flight in generator.Generate(50)]
+    second = [flight.GetRow()[2:] for flight in generator.Generate(50)]
+    assert first != second
+
+
+def test_generated_values_are_valid(programFiles, columnBackend):
+    simulation = Simulation(*programFiles)
+    flights = FlightGenerator(simulation, seed=9).Generate(500)
+    assert all(flight in simulation.allFlights for flight in flights)
+    for flight in flights:
+        airline = simulation.airlines.GetByCode(flight.alCode)
+        aircraft = airline.aircraft[flight.aircraft]
+        assert flight.alName == airline.name and flight.fliCode == f"{flight.alCode}{flight.fliNum}"
+        assert flight.fliOrigin != flight.fliDestination
+        assert {flight.fliOrigin, flight.fliDestination} <= set(simulation.airportNames)
+        assert flight.originAirport.name == flight.fliOrigin and flight.destinationAirport.name == flight.fliDestination
+        assert flight.fliSpeed in (aircraft.speed, round(aircraft.speed * 0.95, 2))
+        assert 1200 <= flight.fliDist <= 3500 and flight.fliDist == int(flight.fliDist)
+        assert flight.ttblDepartTime % (15 * 60) == 0 and flight.ttblArriveTime % (15 * 60) == 0
+        assert 0 <= flight.ttblDepartTime < DAY_SECONDS and 0 <= flight.ttblArriveTime < DAY_SECONDS
+        assert not flight.hasDeparted and flight.delayTime == 0
+    codes = [flight.fliCode for flight in simulation.allFlights]
+    assert len(codes) == len(set(codes))
+
+
+def test_airlines_without_aircraft_are_skipped(programFiles):
+    simulation = Simulation(*programFiles)
+    simulation.airlines.Add(Airline('Grounded', 'GR'))
+    flights = FlightGenerator(simulation, seed=3).Generate(300)
+    assert 'GR' not in {flight.alCode for flight in flights}
+
+    simulation.airlines = AirlineCatalog([Airline('Grounded', 'GR')])
+    numFlights = simulation.numFlights
+    with pytest.raises(ValueError):
+        FlightGenerator(simulation, seed=3).Generate(1)
+    assert simulation.numFlights == numFlights
+
+
+def test_negative_batch_raises(programFiles):
+    simulation = Simulation(*programFiles)
+    with pytest.raises(ValueError):
+        FlightGenerator(simulation).Generate(-1)
+    assert FlightGenerator(simulation).Generate(0) == []
@@ -0,0 +1,89 @@
+"""
+Instrumentation keeps Histograms of the durations and counts of each part of the program, alongside running counters,
+which are recorded by the Simulation as it runs and reported from the command line.
+"""
+import time
+
+import pytest
+
+from FlightSimulationEngine import COUNT_BUCKETS, Histogram, Instrumentation, RunCommandLine, Simulation
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram(bounds=(1, 2, 5, 10))
+    assert histogram.Percentile(50) == 0 and histogram.mean == 0
+    for value in (0.5, 1, 1.5, 2, 3, 4, 4, 8, 9, 20):
+        histogram.Record(value)
+    assert histogram.buckets == [2, 2, 3, 2, 1]
+    assert histogram.count == 10 and histogram.total == 53 and histogram.mean == 5.3
+    assert histogram.maximum == 20 and histogram.last == 20
+    assert [histogram.Percentile(percent) for percent in (10, 20, 40, 70, 90, 95, 100)] == [1, 1, 2, 5, 10, 20, 20]
+
+    small = Histogram(bounds=(1, 2, 5, 10))
+    for value in (0.1, 0.2, 3.5):
+        small.Record(value)
+    assert small.Percentile(50) == 1 and small.Percentile(100) == 3.5  # Never above the maximum recorded
+
+    histogram.Reset()
+    assert histogram.buckets == [0] * 5 and histogram.count == histogram.total == histogram.maximum == 0
+
+
+def test_instrumentation_records_timings_samples_and_counters():
+    instrumentation = Instrumentation()
+    timing = instrumentation.Timing('Work')
+    assert instrumentation.Timing('Work') is timing
+    instrumentation.Record('Work', 0.002)
+    with instrumentation.Timer('Work'):
+        time.sleep(0.001)
+    timed = instrumentation.Timed('Work', lambda value: value * 2)
+    assert timed(4) == 8
+    with pytest.raises(ZeroDivisionError):  # Timed even when raising
+        with instrumentation.Timer('Work'):
+            1 / 0
+    assert timing.count == 4 and timing.maximum >= 0.001
+
+    instrumentation.Sample('Events', 3)
+    instrumentation.Sample('Events', 7)
+    assert instrumentation.Samples('Events').bounds == COUNT_BUCKETS
+    assert instrumentation.Samples('Events').mean == 5
+    instrumentation.Count('Things')
+    instrumentation.Count('Things', 4)
+    assert instrumentation.counters == {'Things': 5}
+
+    summary = instrumentation.Summary()
+    assert 'Work 4x' in summary and 'Events 5.0 avg/7 max' in summary and 'Things 5' in summary
+    report = instrumentation.Report()
+    assert all(name in report for name in ('Work', 'Events', 'Things'))
+
+    instrumentation.Reset()
+    assert instrumentation.Timing('Work') is timing and timing.count == 0  # Held Histograms are kept
+    assert instrumentation.Samples('Events').count == 0 and instrumentation.counters == {}
+
+
+def test_profile_report():
+    instrumentation = Instrumentation()
+    assert instrumentation.StopProfile() == ''
+    instrumentation.StartProfile()
+    sorted(range(10000), key=lambda value: -value)
+    report = instrumentation.StopProfile(limit=5)
+    assert 'function calls' in report and 'Memory traced' in report
+    assert instrumentation.profile is None
+
+
+def test_simulation_records_ticks_and_landings(generatedFiles):
+    simulation = Simulation(*generatedFiles)
+    numFlights = simulation.numFlights
+    simulation.Run(6, 60)
+    instrumentation = simulation.instrumentation
+    assert instrumentation.Timing('Tick').count == 6 * 60
+    assert instrumentation.Samples('Landings per Tick').count == 6 * 60
+    assert instrumentation.Samples('Landings per Tick').total == numFlights - simulation.numFlights > 0
+    simulation.SaveFlights()
+    assert instrumentation.Timing('Save').count == 1
+
+
+def test_command_line_stats(programFiles, tmp_path, capsys):
+    RunCommandLine(['--flights', programFiles[0], '--airports', programFiles[1], '--output', str(tmp_path / 'out.txt'),
+                    '--hours', '1', '--step', '60', '--stats'])
+    output = capsys.readouterr().out
+    assert 'Tick' in output and 'Landings per Tick' in output
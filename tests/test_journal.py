@@ -0,0 +1,194 @@
+"""
+A Simulation kept with a flight journal is recovered after a crash - from the program files or a checkpoint, and
+from the checkpoint of an autosave - holding the state at the journal's last flush.
+"""
+import os
+import random
+
+import pytest
+
+from FlightSimulationEngine import Airport, FlightGenerator, ParseTimeString, Simulation
+
+
+def State(simulation):
+    """
+    Returns the state saved of a Simulation: its programTime, the displayed values of every ongoing flight, and its
+    airports with their numbers of inbound and outbound flights.
+    :param simulation:
+    :return:
+    """
+    rows = sorted(tuple(map(str, simulation.flightColumns.GetRow(flight))) for flight in simulation.allFlights)
+    airports = [(airport.name, len(airport.inboundFlights), len(airport.outboundFlights))
+                for airport in simulation.airports]
+    return simulation.programTime, rows, airports
+
+
+def AssertRecovered(recovered, expected):
+    """
+    Checks that a recovered Simulation holds the expected State. Checkpoints save the remaining distance to 0.1 km, as
+    the program files do, so the approximate arrival time and delay computed from it may differ by a second.
+    :param recovered:
+    :param expected:
+    :return:
+    """
+    programTime, rows, airports = State(recovered)
+    assert (programTime, airports) == (expected[0], expected[2])
+    assert len(rows) == len(expected[1])
+    for row, expectedRow in zip(rows, expected[1]):
+        assert row[:11] + row[13:] == expectedRow[:11] + expectedRow[13:]
+        for value, expectedValue in zip(row[11:13], expectedRow[11:13]):
+            assert abs(ParseTimeString(value) - ParseTimeString(expectedValue)) <= 1, row
+
+
+def MakeChanges(simulation, seed, numSteps=200):
+    """
+    Advances the Simulation whilst adding flights and airports and removing airports at random, flushing the journal
+    now and again.
+    :param simulation:
+    :param seed:
+    :param numSteps:
+    :return:
+    """
+    rand = random.Random(seed)
+    generator = FlightGenerator(simulation, seed=seed)
+    for step in range(numSteps):
+        choice = rand.random()
+        if choice < 0.3:
+            generator.Generate(rand.randint(1, 10))
+        elif choice < 0.35:
+            simulation.AddAirport(Airport(f"Journal Test {seed} {step} Airport", simulation.allFlights))
+        elif choice < 0.38:
+            emptyAirports = [airport.name for airport in simulation.airports
+                             if not airport.inboundFlights and not airport.outboundFlights]
+            if emptyAirports:
+                simulation.RemoveAirport(rand.choice(emptyAirports))
+        simulation.Step(rand.choice([1, 60, 600, 3600]))
+        if rand.random() < 0.2:
+            simulation.FlushJournal()
+    simulation.FlushJournal()
+
+
+def Crash(simulation):
+    """
+    Leaves the journal as a crash would: its file closed without the journal being closed, and a partly written record
+    at its end.
+    :param simulation:
+    :return:
+    """
+    simulation.journal.file.close()
+    with open(simulation.journalFileName, 'a') as file:
+        file.write('["land", 5')
+
+
+def test_journal_recovers_after_crash(programFiles):
+    simulation = Simulation(*programFiles, journal=True)
+    MakeChanges(simulation, seed=1)
+    expected = State(simulation)
+    Crash(simulation)
+
+    recovered = Simulation(*programFiles, journal=True)
+    AssertRecovered(recovered, expected)
+
+
+def test_journal_recovers_from_checkpoints(programFiles):
+    simulation = Simulation(*programFiles, journal=True)
+    simulation.checkpointRecords = 50  # Several checkpoints, in both slots
+    MakeChanges(simulation, seed=2)
+    assert simulation.journal.header['baseFiles'][0] != programFiles[0]
+    expected = State(simulation)
+    Crash(simulation)
+
+    recovered = Simulation(*programFiles, journal=True)
+    AssertRecovered(recovered, expected)
+    MakeChanges(recovered, seed=3)  # Recovery continues the same journal
+    expected = State(recovered)
+    Crash(recovered)
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
+
+
+def test_autosave_crash_before_rebase(programFiles):
+    with open(programFiles[0], 'rb') as file:
+        programFlights = file.read()
+    simulation = Simulation(*programFiles, journal=True)
+    simulation.StartAutosave(0)
+    generator = FlightGenerator(simulation, seed=4)
+    generator.Generate(50)
+    simulation.Step(60)  # Autosave begins, capturing the 50 flights
+    simulation.autosave.thread.join()
+    simulation.autosave.Update = lambda: None  # Written to its checkpoint, but the journal not yet rebased
+    generator.Generate(30)
+    simulation.Step(60)
+    simulation.FlushJournal()
+    expected = State(simulation)
+    Crash(simulation)
+
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
+    with open(programFiles[0], 'rb') as file:
+        assert file.read() == programFlights  # Autosaves never overwrite the program files
+
+
+def test_autosave_rebase_carries_changes(programFiles):
+    simulation = Simulation(*programFiles, journal=True)
+    simulation.StartAutosave(0)
+    generator = FlightGenerator(simulation, seed=10)
+    generator.Generate(50)
+    simulation.Step(60)  # Autosave begins, capturing the 50 flights
+    generator.Generate(30)  # Made whilst the autosave is written, so carried into the rebased journal
+    simulation.Step(3 * 60 * 60)
+    simulation.autosave.Wait()
+    assert simulation.journal.header['baseFiles'][0] != programFiles[0]
+    MakeChanges(simulation, seed=11, numSteps=50)
+    simulation.autosave.Wait()
+    simulation.FlushJournal()
+    expected = State(simulation)
+    Crash(simulation)
+
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
+
+
+def test_journal_ignored_when_program_files_change(programFiles, tmp_path):
+    simulation = Simulation(*programFiles, journal=True)
+    MakeChanges(simulation, seed=5)
+    Crash(simulation)
+    original = Simulation(*programFiles)
+    FlightGenerator(original, seed=6).Generate(5)
+    original.SaveFlights()  # The program files are rewritten after the journal was last flushed
+    expected = State(Simulation(*programFiles))
+
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
+
+
+@pytest.mark.parametrize('checkpointRecords', [100000, 3])
+def test_journal_recovers_flights_sharing_a_code(programFiles, checkpointRecords):
+    allFlightsFileName, airportsAirlinesFileName = programFiles
+    with open(allFlightsFileName) as file:
+        lines = file.read().splitlines()
+    values = lines[2].split(', ')
+    shortFlight = values[:5] + ['10.0'] + values[6:]  # Same code, landing soon after departing
+    with open(allFlightsFileName, 'w') as file:
+        file.write('\n'.join(lines[:2] + [', '.join(shortFlight)] + lines[2:]) + '\n')
+
+    simulation = Simulation(*programFiles, journal=True)
+    simulation.checkpointRecords = checkpointRecords
+    FlightGenerator(simulation, seed=8).Generate(5)
+    code = values[1]
+    while [flight.fliCode for flight in simulation.allFlights].count(code) == 2:
+        simulation.Step(60)
+        simulation.FlushJournal()
+    assert code in {flight.fliCode for flight in simulation.allFlights}  # The other flight is still ongoing
+    MakeChanges(simulation, seed=9, numSteps=20)
+    expected = State(simulation)
+    Crash(simulation)
+
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
+
+
+def test_discarded_journal_is_not_recovered(programFiles):
+    expected = State(Simulation(*programFiles))
+    simulation = Simulation(*programFiles, journal=True)
+    simulation.checkpointRecords = 50
+    MakeChanges(simulation, seed=7)
+    simulation.CloseJournal(discard=True)
+    assert not os.path.exists(simulation.journalFileName)
+
+    AssertRecovered(Simulation(*programFiles, journal=True), expected)
@@ -0,0 +1,94 @@
+"""
+The program files are only replaced once both have been written in full: a save which fails part way leaves the old
+program files intact, and removes its temporary files.
+"""
+import os
+
+import pytest
+
+from FlightSimulationEngine import FlightGenerator, FlightJournal, Simulation, SimulationState
+
+
+def ReadFiles(fileNames):
+    contents = []
+    for fileName in fileNames:
+        with open(fileName, 'rb') as file:
+            contents.append(file.read())
+    return contents
+
+
+def TempFiles(directory):
+    return [fileName for fileName in os.listdir(directory) if fileName.endswith('.tmp')]
+
+
+def FailPartWay(error):
+    """
+    Returns a replacement for a write of SimulationState, which writes part of its file and then raises `error`.
+    :param error:
+    :return:
+    """
+    def Write(self, fileName, *args):
+        with open(fileName, 'w') as file:
+            file.write('#Partly written\n')
+        raise error
+    return Write
+
+
+@pytest.mark.parametrize('method', ['WriteFlights', 'WriteSnapshot', 'WriteAirportsAirlines'])
+def test_failed_write_keeps_program_files(programFiles, tmp_path, monkeypatch, method):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=1).Generate(50)
+    simulation.snapshotFormat = method == 'WriteSnapshot'
+    original = ReadFiles(programFiles)
+    monkeypatch.setattr(SimulationState, method, FailPartWay(OSError('No space left on device')))
+
+    with pytest.raises(OSError):
+        simulation.SaveFiles()
+    assert ReadFiles(programFiles) == original
+    assert TempFiles(tmp_path) == []
+
+
+def test_interrupted_sync_keeps_program_files(programFiles, tmp_path, monkeypatch):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=2).Generate(50)
+    original = ReadFiles(programFiles)
+
+    def Interrupt(fileName):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(FlightJournal, 'SyncFile', staticmethod(Interrupt))
+    with pytest.raises(KeyboardInterrupt):
+        simulation.SaveFiles()
+    assert ReadFiles(programFiles) == original
+    assert TempFiles(tmp_path) == []
+
+
+def test_failed_save_keeps_journal(programFiles, tmp_path, monkeypatch):
+    simulation = Simulation(*programFiles, journal=True)
+    FlightGenerator(simulation, seed=3).Generate(50)
+    simulation.Step(60)
+    simulation.FlushJournal()
+    original = ReadFiles(programFiles)
+    baseFiles = simulation.journal.header['baseFiles']
+    monkeypatch.setattr(SimulationState, 'WriteAirportsAirlines', FailPartWay(OSError('Disk removed')))
+
+    with pytest.raises(OSError):
+        simulation.SaveFiles()
+    assert simulation.journal.header['baseFiles'] == baseFiles  # The journal still holds the unsaved changes
+    monkeypatch.undo()
+    simulation.FlushJournal()
+    expected = sorted(tuple(map(str, simulation.flightColumns.GetRow(flight))) for flight in simulation.allFlights)
+    simulation.journal.file.close()  # As a crash would leave it
+    assert ReadFiles(programFiles) == original
+    recovered = Simulation(*programFiles, journal=True)
+    rows = sorted(tuple(map(str, recovered.flightColumns.GetRow(flight))) for flight in recovered.allFlights)
+    assert [row[:11] for row in rows] == [row[:11] for row in expected]
+
+
+def test_save_replaces_program_files(programFiles, tmp_path):
+    simulation = Simulation(*programFiles)
+    FlightGenerator(simulation, seed=4).Generate(50)
+    simulation.SaveFiles()
+    assert TempFiles(tmp_path) == []
+    saved = Simulation(*programFiles)
+    assert saved.numFlights == simulation.numFlights
+    assert saved.airportNames == simulation.airportNames
@@ -0,0 +1,160 @@
+"""
+The indexed search of the FlightSearchIndex is checked against a brute force search of every ongoing flight, as the
+flights land and new flights are added.
+"""
+import random
+
+import pytest
+
+from FlightSimulationEngine import Flight, FlightSearchIndex, Simulation
+
+# Names of the data search terms, in the order of the `ongoingFlights.txt` header
+TERM_NAMES = ['fliNum', 'fliCode', 'origin', 'destination', 'speed', 'distance', 'aircraft', 'alName', 'alCode',
+              'departTime', 'arriveTime', 'appxArriveTime', 'delayTime', 'hasDeparted', 'isDeparting']
+
+
+def FormatSeconds(seconds):
+    seconds = int(seconds) % (24 * 60 * 60)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def RandomFlights(airportsAirlinesFileName, programSeconds, count, seed):
+    """
+    Returns the values of `count` random flights between the airports of `airportsAirlinesFileName`, as the values of a
+    line of the flights file. The flights depart throughout the day, so every kind of flight window is covered.
+    :param airportsAirlinesFileName:
+    :param programSeconds:
+    :param count:
+    :param seed:
+    :return:
+    """
+    with open(airportsAirlinesFileName) as file:
+        airportNames = file.readline().strip()[1:].split(', ')
+        airlines = [line.strip().split(', ') for line in file if line.strip()]
+    rand = random.Random(seed)
+    flights = []
+    for number in range(count):
+        airline = rand.choice(airlines)
+        numAircraft = (len(airline) - 2) // 2
+        aircraft = rand.randrange(numAircraft)
+        speed = float(airline[2 + numAircraft + aircraft])
+        distance = float(rand.randint(100, 3500))
+        departTime = rand.randrange(24 * 60 * 60)
+        arriveTime = departTime + int(distance / speed * 60 * 60)
+        origin, destination = rand.sample(airportNames, 2)
+        flights.append([f"{number:04d}", f"{airline[1]}{number:04d}", origin, destination, str(speed), str(distance),
+                        airline[2 + aircraft], airline[0], airline[1], FormatSeconds(departTime),
+                        FormatSeconds(arriveTime), FormatSeconds(arriveTime), '0:00:00', 'False',
+                        str(departTime > programSeconds)])
+    return flights
+
+
+@pytest.fixture
+def searchFiles(programFiles):
+    """
+    The program files, with 500 random flights added to the flights file, returned as their paths.
+    :param programFiles:
+    :return:
+    """
+    allFlightsFileName, airportsAirlinesFileName = programFiles
+    with open(allFlightsFileName) as file:
+        lines = file.read().splitlines()
+    hours, minutes, seconds = map(int, lines[1][1:].split(':'))
+    flights = RandomFlights(airportsAirlinesFileName, hours * 3600 + minutes * 60 + seconds, 500, seed=1)
+    with open(allFlightsFileName, 'w') as file:
+        file.write('\n'.join(lines + [', '.join(values) for values in flights]) + '\n')
+    return programFiles
+
+
+def AddRandomFlights(simulation, count, seed):
+    for values in RandomFlights(simulation.airportsAirlinesFileName, 0, count, seed):
+        simulation.AddFlight(Flight(values[:6], values[6:9], values[9:], simulation.flightColumns,
+                                    simulation.flightTable))
+
+
+def BruteForceSearch(simulation, criteria):
+    """
+    Returns the set of ongoing flights matching every criterion, checking each flight in turn as the original search
+    did.
+    :param simulation:
+    :param criteria:
+    :return:
+    """
+    matches = set()
+    for flight in simulation.allFlights:
+        for term, searchValues in criteria:
+            getter, dataType = simulation.flightColumns.GetAccessor(term)
+            values = FlightSearchIndex.ParseValues(dataType, searchValues)
+            if not values[0] <= FlightSearchIndex.ConvertValue(dataType, getter(flight)) <= values[-1]:
+                break
+        else:
+            matches.add(flight)
+    return matches
+
+
+def Criteria(simulation):
+    """
+    Returns searches covering every kind of term - hashed, sorted and unindexed, single values and ranges - alone and
+    combined, using values of the simulation's flights and airports.
+    :param simulation:
+    :return:
+    """
+    terms = dict(zip(TERM_NAMES, simulation.dataSearchTerms))
+    flight = sorted(simulation.allFlights, key=lambda flight: flight.fliCode)[0]
+    origin, destination = simulation.airportNames[:2]
+    return [
+        [(terms['origin'], [origin])],
+        [(terms['destination'], [destination]), (terms['alCode'], [flight.alCode])],
+        [(terms['fliCode'], [flight.fliCode])],
+        [(terms['alName'], [flight.alName]), (terms['aircraft'], [flight.aircraft])],
+        [(terms['fliNum'], ['5', '40'])],
+        [(terms['fliNum'], [flight.fliNum])],
+        [(terms['speed'], ['700', '850'])],
+        [(terms['departTime'], ['6:00:00', '11:59:59'])],
+        [(terms['arriveTime'], ['22:00:00', '23:59:59']), (terms['origin'], [origin])],
+        [(terms['distance'], ['1000', '2500'])],
+        [(terms['hasDeparted'], ['True'])],
+        [(terms['isDeparting'], ['False']), (terms['departTime'], ['0:00:00', '12:00:00'])],
+        [(terms['delayTime'], ['0:00:01', '23:59:59'])],
+        [(terms['appxArriveTime'], ['12:00:00', '18:00:00']), (terms['alCode'], [flight.alCode])],
+        [(terms['origin'], [origin]), (terms['destination'], [destination]), (terms['speed'], ['0', '900']),
+         (terms['hasDeparted'], ['False'])],
+        [(terms['origin'], ['No Such Airport'])],
+        [(terms['origin'], sorted([origin, destination]))],  # A range of names is checked against each flight
+    ]
+
+
+def AssertSearchesMatch(simulation):
+    for criteria in Criteria(simulation):
+        found = simulation.searchIndex.Search(criteria)
+        assert len(found) == len(set(found)), criteria
+        assert set(found) == BruteForceSearch(simulation, criteria), criteria
+
+
+def test_search_matches_brute_force(searchFiles):
+    simulation = Simulation(*searchFiles)
+    AssertSearchesMatch(simulation)
+
+
+def test_search_matches_after_landings_and_additions(searchFiles):
+    simulation = Simulation(*searchFiles)
+    AssertSearchesMatch(simulation)
+    for seed, hours in enumerate((3, 5, 9), start=2):
+        numFlights = len(simulation.allFlights)
+        simulation.Run(hours, 60)
+        assert len(simulation.allFlights) < numFlights
+        AssertSearchesMatch(simulation)
+        AddRandomFlights(simulation, 100, seed)
+        AssertSearchesMatch(simulation)
+
+
+def test_landed_flights_are_not_found(searchFiles):
+    simulation = Simulation(*searchFiles)
+    term = simulation.dataSearchTerms[TERM_NAMES.index('fliCode')]
+    simulation.searchIndex.Search([(term, ['XX0000'])])
+    ongoing = {flight.fliCode for flight in simulation.allFlights}
+    simulation.Run(12, 60)
+    landed = ongoing - {flight.fliCode for flight in simulation.allFlights}
+    assert landed
+    for code in landed:
+        assert simulation.searchIndex.Search([(term, [code])]) == []
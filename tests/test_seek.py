@@ -0,0 +1,106 @@
+"""
+Seeking straight to a simulation time, and computing flight states with FlightTable.StatesAt, give the same flights
+and values as running the Simulation there in ticks.
+"""
+import pytest
+
+from FlightSimulationEngine import DAY_SECONDS, Simulation
+
+
+def FlightValues(simulation):
+    """
+    Returns every value of each ongoing flight, by flight code.
+    :param simulation:
+    :return:
+    """
+    return {flight.fliCode: (flight.fliDist, *simulation.flightColumns.GetRow(flight))
+            for flight in simulation.allFlights}
+
+
+def States(simulation, time):
+    """
+    Returns the state of each ongoing flight at the simulation time `time` (see FlightTable.StatesAt), by flight code.
+    :param simulation:
+    :param time:
+    :return:
+    """
+    flights = list(simulation.allFlights)
+    states = simulation.flightTable.StatesAt(time, [flight.row for flight in flights])
+    return {flight.fliCode: {name: values[index] for name, values in states.items()}
+            for index, flight in enumerate(flights)}
+
+
+def AssertStatesMatch(states, simulation):
+    """
+    Checks that the states computed for the flights departed when they were computed match the flights of a
+    Simulation advanced to their time, those no longer ongoing having landed.
+    :param states:
+    :param simulation:
+    :return:
+    """
+    flights = {flight.fliCode: flight for flight in simulation.allFlights}
+    for code, state in states.items():
+        flight = flights.get(code)
+        assert bool(state['hasLanded']) == (flight is None), code
+        if flight is not None:
+            assert float(state['distance']) == pytest.approx(flight.fliDist, abs=1e-6), code
+            assert (int(state['appxArriveTime']), int(state['delayTime'])) == (flight.appxArriveTime,
+                                                                               flight.delayTime), code
+
+
+@pytest.mark.parametrize('hours, step', [(3, 1), (20, 60), (30, 3600), (50, 7 * 60 + 11)])
+def test_seek_matches_run(generatedFiles, columnBackend, hours, step):
+    ticked = Simulation(*generatedFiles)
+    ticked.Run(hours, step)
+    sought = Simulation(*generatedFiles)
+    sought.Seek(sought.simulationTime + hours * 60 * 60)
+
+    assert sought.simulationTime == ticked.simulationTime
+    assert sought.programTime == ticked.programTime
+    assert FlightValues(sought) == FlightValues(ticked)
+
+
+def test_seeks_in_steps_match_single_seek(generatedFiles):
+    stepped = Simulation(*generatedFiles)
+    startTime = stepped.simulationTime
+    for hours in (1, 2.5, 7, 7, 13, 26):
+        stepped.Seek(startTime + int(hours * 60 * 60))
+    sought = Simulation(*generatedFiles)
+    sought.Seek(startTime + 26 * 60 * 60)
+    assert FlightValues(stepped) == FlightValues(sought)
+
+
+@pytest.mark.parametrize('hours', [0.5, 4, 11, 30])
+def test_states_at_later_time_match_run(generatedFiles, columnBackend, hours):
+    simulation = Simulation(*generatedFiles)
+    simulation.Run(2, 60)  # Only flights departed now have their states computed, see StatesAt
+    departed = {flight.fliCode for flight in simulation.allFlights if flight.hasDeparted}
+    time = simulation.simulationTime + int(hours * 60 * 60)
+    states = {code: state for code, state in States(simulation, time).items() if code in departed}
+    assert states
+
+    simulation.Run(hours, 60)
+    assert simulation.simulationTime == time
+    AssertStatesMatch(states, simulation)
+
+
+def test_states_at_earlier_time_match_run(generatedFiles, columnBackend):
+    earlier = Simulation(*generatedFiles)
+    earlier.Run(5, 60)
+    later = Simulation(*generatedFiles)
+    later.Run(8, 60)
+
+    departed = {flight.fliCode for flight in earlier.allFlights if flight.hasDeparted}
+    states = {code: state for code, state in States(later, earlier.simulationTime).items() if code in departed}
+    assert states
+    AssertStatesMatch(states, earlier)
+
+
+def test_seek_backwards_raises(generatedFiles):
+    simulation = Simulation(*generatedFiles)
+    simulation.Seek(simulation.simulationTime + DAY_SECONDS)
+    values = FlightValues(simulation)
+    simulation.Seek(simulation.simulationTime)
+    assert FlightValues(simulation) == values
+    with pytest.raises(ValueError):
+        simulation.Seek(simulation.simulationTime - 1)
@@ -0,0 +1,61 @@
+"""
+A ShardedSimulation, partitioned by Origin airport or by airline, lands the same flights and saves the same files as a
+single Simulation of the same flights.
+"""
+import pytest
+
+from FlightSimulationEngine import FlightFilter, ShardedSimulation, Simulation
+
+
+def ReadBytes(fileName):
+    with open(fileName, 'rb') as file:
+        return file.read()
+
+
+@pytest.mark.parametrize('shardBy', ['airport', 'airline'])
+@pytest.mark.parametrize('snapshot', [False, True])
+def test_sharded_matches_unsharded(generatedFiles, tmp_path, shardBy, snapshot):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    if snapshot:
+        Simulation(*generatedFiles).SaveSnapshot(str(tmp_path / 'flights.snap'))
+        allFlightsFileName = str(tmp_path / 'flights.snap')
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    simulation.landings = []
+    with ShardedSimulation(allFlightsFileName, airportsAirlinesFileName, 3, shardBy) as sharded:
+        assert sorted(sharded.shardFlights) != [0, 0, sharded.numFlights]  # Flights are spread across the shards
+        assert sharded.numFlights == simulation.numFlights
+        for hours in (2, 7, 13):
+            simulation.Run(hours, 60)
+            sharded.Run(hours, 60)
+            assert sharded.numFlights == simulation.numFlights
+            assert sorted(sharded.landings) == sorted(simulation.landings)
+            assert sharded.simulationTime == simulation.simulationTime
+        assert sharded.landings
+
+        simulation.SaveFlights(str(tmp_path / 'single.txt'))
+        sharded.SaveFlights(str(tmp_path / 'sharded.txt'))
+        assert ReadBytes(tmp_path / 'sharded.txt') == ReadBytes(tmp_path / 'single.txt')
+        simulation.SaveSnapshot(str(tmp_path / 'single.snap'))
+        sharded.SaveSnapshot(str(tmp_path / 'sharded.snap'))
+        assert ReadBytes(tmp_path / 'sharded.snap') == ReadBytes(tmp_path / 'single.snap')
+
+
+def test_filtered_sharded_matches_unsharded(generatedFiles, tmp_path):
+    flightFilter = FlightFilter(airports=Simulation(*generatedFiles).airportNames[:3], departAfter=20 * 60 * 60,
+                                departBefore=8 * 60 * 60)
+    simulation = Simulation(*generatedFiles, flightFilter=flightFilter)
+    with ShardedSimulation(*generatedFiles, 2, 'airline', flightFilter=flightFilter) as sharded:
+        assert sharded.numFlights == simulation.numFlights < Simulation(*generatedFiles).numFlights
+        simulation.Run(10, 60)
+        sharded.Run(10, 60)
+        simulation.SaveFlights(str(tmp_path / 'single.txt'))
+        sharded.SaveFlights(str(tmp_path / 'sharded.txt'))
+    assert ReadBytes(tmp_path / 'sharded.txt') == ReadBytes(tmp_path / 'single.txt')
+
+
+def test_max_flights_limits_all_shards(generatedFiles):
+    numFlights = Simulation(*generatedFiles).numFlights
+    with ShardedSimulation(*generatedFiles, 4, maxFlights=numFlights + 10) as sharded:
+        assert all(shardFlights < numFlights for shardFlights in sharded.shardFlights)
+        assert sharded.HasCapacity(10)
+        assert not sharded.HasCapacity(11)
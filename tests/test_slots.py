@@ -0,0 +1,41 @@
+"""
+Flights and Airports are slotted records without a per-instance `__dict__`, and the strings shared between many Flights
+are interned, such that each distinct value is stored once.
+"""
+import pytest
+
+from FlightSimulationEngine import Airport, Intern, Simulation
+
+
+@pytest.mark.parametrize('snapshot', [False, True])
+def test_shared_strings_are_single_objects(generatedFiles, tmp_path, snapshot):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    if snapshot:
+        allFlightsFileName = str(tmp_path / 'flights.snap')
+        Simulation(*generatedFiles).SaveSnapshot(allFlightsFileName)
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    values = {}
+    for flight in simulation.allFlights:
+        for name in ('fliNum', 'fliOrigin', 'fliDestination', 'aircraft', 'alName', 'alCode'):
+            value = getattr(flight, name)
+            assert values.setdefault(value, value) is value, name  # Every equal value is the same object
+        assert flight.fliOrigin is flight.originAirport.name
+        assert flight.fliDestination is flight.destinationAirport.name
+
+
+def test_records_have_no_dict(programFiles):
+    simulation = Simulation(*programFiles)
+    for record in (next(iter(simulation.allFlights)), simulation.airports[0]):
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.unknownValue = 1
+
+
+def test_intern():
+    parts = 'London Heathrow Airport, London Heathrow Airport'.split(', ')
+    assert parts[0] is not parts[1]
+    assert Intern(parts[0]) is Intern(parts[1])
+    assert Intern(12) == 12 and Intern(None) is None  # Values which are not strings are unchanged
+    names = ''.join(['Test ', 'Airport']), ''.join(['Test ', 'Airport'])
+    assert names[0] is not names[1]
+    assert Airport(names[0]).name is Airport(names[1]).name
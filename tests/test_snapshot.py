@@ -0,0 +1,101 @@
+"""
+Flights are round tripped between the text flights file and the binary snapshot file (see FlightSnapshot), with and
+without NumPy.
+"""
+import pytest
+
+from FlightSimulationEngine import FlightSnapshot, Simulation
+
+
+def ReadBytes(fileName):
+    with open(fileName, 'rb') as file:
+        return file.read()
+
+
+def FlightValues(simulation):
+    """
+    Returns the value of every search term of every ongoing flight, ordered by flight code.
+    :param simulation:
+    :return:
+    """
+    flights = sorted(simulation.allFlights, key=lambda flight: flight.fliCode)
+    return simulation.flightColumns.GetColumns(flights)
+
+
+def AssertValuesMatch(simulation, loaded):
+    """
+    Checks that the flights of a Simulation loaded from a saved file hold the values of the Simulation saved. As the
+    remaining distance is saved to 0.1 km (as displayed), the approximate arrival time and delay computed from it may
+    differ by a second.
+    :param simulation:
+    :param loaded:
+    :return:
+    """
+    values, loadedValues = FlightValues(simulation), FlightValues(loaded)
+    appxTerms = simulation.dataSearchTerms[11:13]
+    for term in simulation.dataSearchTerms:
+        if term in appxTerms:
+            assert all(abs(value - loadedValue) <= 1 for value, loadedValue in zip(values[term], loadedValues[term]))
+        else:
+            assert values[term] == loadedValues[term], term
+
+
+@pytest.mark.parametrize('hours', [0, 5, 13])
+def test_text_snapshot_text_round_trip(generatedFiles, tmp_path, columnBackend, hours):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    simulation.Run(hours, 60)  # Departed flights hold part of their distance and a delay
+    simulation.SaveFlights(str(tmp_path / 'saved.txt'))
+
+    fromText = Simulation(str(tmp_path / 'saved.txt'), airportsAirlinesFileName)
+    AssertValuesMatch(simulation, fromText)
+    fromText.SaveSnapshot(str(tmp_path / 'flights.snap'))
+    fromText.SaveFlights(str(tmp_path / 'before.txt'))
+
+    fromSnapshot = Simulation(str(tmp_path / 'flights.snap'), airportsAirlinesFileName)
+    assert fromSnapshot.snapshotFormat and not fromText.snapshotFormat
+    assert fromSnapshot.simulationTime == fromText.simulationTime == simulation.simulationTime
+    assert FlightValues(fromSnapshot) == FlightValues(fromText)
+    fromSnapshot.SaveFlights(str(tmp_path / 'after.txt'))
+    assert ReadBytes(tmp_path / 'after.txt') == ReadBytes(tmp_path / 'before.txt')
+
+
+def test_snapshot_text_snapshot_round_trip(generatedFiles, tmp_path, columnBackend):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    simulation.Run(7, 60)
+    simulation.SaveSnapshot(str(tmp_path / 'saved.snap'))
+
+    fromSnapshot = Simulation(str(tmp_path / 'saved.snap'), airportsAirlinesFileName)
+    AssertValuesMatch(simulation, fromSnapshot)
+    fromSnapshot.SaveSnapshot(str(tmp_path / 'before.snap'))
+    fromSnapshot.SaveFlights(str(tmp_path / 'flights.txt'))
+    Simulation(str(tmp_path / 'flights.txt'), airportsAirlinesFileName).SaveSnapshot(str(tmp_path / 'after.snap'))
+    assert ReadBytes(tmp_path / 'after.snap') == ReadBytes(tmp_path / 'before.snap')
+
+
+def test_snapshot_simulates_as_text(generatedFiles, tmp_path, columnBackend):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    Simulation(allFlightsFileName, airportsAirlinesFileName).SaveSnapshot(str(tmp_path / 'flights.snap'))
+    fromText = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    fromSnapshot = Simulation(str(tmp_path / 'flights.snap'), airportsAirlinesFileName)
+    fromText.Run(10, 60)
+    fromSnapshot.Run(10, 60)
+    assert FlightValues(fromSnapshot) == FlightValues(fromText)
+
+
+def test_snapshot_header(generatedFiles, tmp_path):
+    allFlightsFileName, airportsAirlinesFileName = generatedFiles
+    simulation = Simulation(allFlightsFileName, airportsAirlinesFileName)
+    simulation.SaveSnapshot(str(tmp_path / 'flights.snap'))
+    assert FlightSnapshot.IsSnapshot(str(tmp_path / 'flights.snap'))
+    assert not FlightSnapshot.IsSnapshot(allFlightsFileName)
+    with FlightSnapshot(str(tmp_path / 'flights.snap')) as snapshot:
+        assert snapshot.count == simulation.numFlights
+        assert snapshot.programTime == simulation.simulationTime
+        assert snapshot.dataSearchTerms == simulation.dataSearchTerms
+
+
+def test_text_file_is_not_a_snapshot(programFiles):
+    with pytest.raises(ValueError):
+        FlightSnapshot(programFiles[0])
@@ -0,0 +1,47 @@
+"""
+Times are held as whole seconds, parsed from "H:M:S" strings by ParseTimeString and only formatted back into "H:MM:SS"
+strings by FormatTime, matching the strings of `datetime.strptime` and `timedelta` which they replace.
+"""
+import datetime as dt
+
+import pytest
+
+from FlightSimulationEngine import DAY_SECONDS, Flight, FormatTime, ParseTimeString, Simulation
+
+
+def test_every_second_of_the_day_round_trips():
+    for seconds in range(DAY_SECONDS):
+        timeString = FormatTime(seconds)
+        assert timeString == str(dt.timedelta(seconds=seconds))
+        assert ParseTimeString(timeString) == seconds
+
+
+@pytest.mark.parametrize('timeString, seconds', [('0:00:00', 0), ('7:36:31', 7 * 3600 + 36 * 60 + 31),
+                                                 ('07:05:09', 7 * 3600 + 5 * 60 + 9), ('7:5:9', 7 * 3600 + 5 * 60 + 9),
+                                                 ('23:59:59', DAY_SECONDS - 1)])
+def test_parses_one_or_two_digit_parts(timeString, seconds):
+    assert ParseTimeString(timeString) == seconds
+    parsed = dt.datetime.strptime(timeString, "%H:%M:%S")
+    assert seconds == parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+
+
+@pytest.mark.parametrize('timeString', ['', '7:36', '7:36:31:00', '24:00:00', '7:60:00', '7:00:60', '007:00:00',
+                                        '7::00', '-1:00:00', '7:3a:00', ' 7:00:00'])
+def test_unsuitable_strings_raise(timeString):
+    with pytest.raises(ValueError):
+        ParseTimeString(timeString)
+
+
+def test_durations_of_a_day_or_more_show_days():
+    assert FormatTime(DAY_SECONDS) == '1 day, 0:00:00'
+    assert FormatTime(DAY_SECONDS + 3661.9) == '1 day, 1:01:01'
+    assert FormatTime(59.9) == '0:00:59'
+
+
+def test_times_are_held_as_seconds(programFiles):
+    simulation = Simulation(*programFiles)
+    assert simulation.programTime == simulation.simulationTime == 7 * 3600 + 36 * 60 + 31
+    for flight in simulation.allFlights:
+        for seconds in (flight.ttblDepartTime, flight.ttblArriveTime, flight.appxArriveTime, flight.delayTime):
+            assert type(seconds) is int and 0 <= seconds < DAY_SECONDS
+    assert Flight.StripTime('20:30:00') == Flight.StripTime(20 * 3600 + 30 * 60) == 20 * 3600 + 30 * 60
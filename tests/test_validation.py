@@ -0,0 +1,92 @@
+"""
+The inputs of the Create Flight and airport management screen are validated whenever they change, and again by the
+clock once flights have landed, as landings free flight numbers and airports.
+"""
+import types
+
+from FlightArrivalEnquiryMain import AddFlightAirportScreen
+from FlightSimulationEngine import Airport, Simulation, SimulationClock
+
+
+def ConstructScreen(root, simulation):
+    """
+    Returns a constructed AddFlightAirportScreen, hosted by a stand-in for Main holding only what the screen uses.
+    :param root:
+    :param simulation:
+    :return:
+    """
+    host = types.SimpleNamespace(root=root, simulation=simulation, instrumentation=simulation.instrumentation,
+                                 clock=SimulationClock(simulation))
+    screen = AddFlightAirportScreen(host)
+    screen.Construct()
+    return screen
+
+
+def EnterFlight(screen, fliNum, origin, destination, airline='Ryanair', aircraft='Boeing 737-800',
+                departTime='12:00:00'):
+    for entry, value in zip(screen.flightDataEntries, (fliNum, origin, destination, airline, aircraft, departTime)):
+        entry.set(value)
+
+
+def RunValidation(screen):
+    subsystem = next(subsystem for subsystem in screen.host.clock.subsystems if subsystem.name == 'Validation')
+    subsystem.callback()
+
+
+def test_flight_inputs_checked_as_they_change(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    screen = ConstructScreen(tkRoot, simulation)
+    assert not screen.canConstructFlight  # The prompts are not suitable values
+    origin, destination = simulation.airportNames[:2]
+    EnterFlight(screen, '0500', origin, destination)
+    assert screen.canConstructFlight
+
+    for index, value in [(0, '0001'), (0, '10000'), (0, 'abc'), (2, origin), (2, 'No Such Airport'),
+                         (3, 'No Such Airline'), (4, 'Boeing 767-300'), (5, '24:00:00'), (5, '12:00')]:
+        screen.flightDataEntries[index].set(value)
+        assert not screen.canConstructFlight, value
+        EnterFlight(screen, '0500', origin, destination)
+        assert screen.canConstructFlight
+    assert simulation.instrumentation.Timing('Validation').count > 0
+
+    numFlights = simulation.numFlights
+    screen.ConstructNewFlight()
+    assert simulation.numFlights == numFlights + 1
+    assert not screen.canConstructFlight  # The flight number is now in use
+
+
+def test_inputs_rechecked_after_landings(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    screen = ConstructScreen(tkRoot, simulation)
+    flight = next(flight for flight in simulation.allFlights if flight.fliCode == 'FR0001')
+    EnterFlight(screen, '0001', flight.fliOrigin, flight.fliDestination)
+    airport = flight.originAirport
+    screen.destroyAirportName.set(airport.name)
+    assert not screen.canConstructFlight and not screen.canDestroyAirport
+
+    RunValidation(screen)  # Nothing has landed, so nothing is checked
+    assert not screen.canConstructFlight
+    simulation.LandFlights([flight] + [other for other in simulation.allFlights if other is not flight and
+                                       airport in (other.originAirport, other.destinationAirport)])
+    assert not screen.canConstructFlight  # The inputs have not changed
+    RunValidation(screen)
+    assert screen.canConstructFlight and screen.canDestroyAirport
+
+
+def test_airport_inputs_checked_as_they_change(tkRoot, programFiles):
+    simulation = Simulation(*programFiles)
+    screen = ConstructScreen(tkRoot, simulation)
+    assert not screen.canConstructAirport and not screen.canDestroyAirport  # The prompts are not suitable values
+    for name, suitable in [('Newcastle', True), ('East Midlands', False), ('  Leeds   Bradford  ', True),
+                           ('Ab', False), ('', False), ('Default Airport Name', False)]:
+        screen.newAirportName.set(name)
+        assert screen.canConstructAirport == suitable, name
+
+    airport = next(airport for airport in simulation.airports if airport.outboundFlights)
+    screen.destroyAirportName.set(airport.name)
+    assert not screen.canDestroyAirport  # Flights still fly from the airport
+    simulation.AddAirport(Airport('Newcastle Airport'))
+    screen.destroyAirportName.set('Newcastle Airport')
+    assert screen.canDestroyAirport
+    screen.newAirportName.set('Newcastle')
+    assert not screen.canConstructAirport